@@ -58,3 +58,5 @@ if __name__ == '__main__':
     # Export the sweep data to Touchstone (file will be saved in the directory we just switched to)
     vna.query('MMEMory:STORe:TRACe 0,S2P,filename.s2p')
 
+    # Close the SCPI connection
+    vna.close()
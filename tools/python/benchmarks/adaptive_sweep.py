@@ -0,0 +1,73 @@
+"""
+adaptive_sweep
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Compares an `AdaptiveSweep` of the full band of the demo VNA with a uniform
+sweep of the same resolution, 10,001 points unless a resolution is given:
+
+- the number of points and the measured time of each,
+- the time saved as estimated by `AdaptiveSweep` from its two passes,
+- the largest difference in |S11| and |S21| (in dB) between the uniform
+  sweep and the adaptive sweep interpolated onto the uniform grid.
+
+Running the benchmark
+--------------------
+Requires `numpy` and the `vna` package and SDK libraries (see api/python/README.md).
+python3 adaptive_sweep.py [resolution_hz] [coarse_points]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.adaptive import AdaptiveSweep
+from picovna5_tools.conversions import logmag
+from picovna5_tools.regrid import RegridEngine
+from picovna5_tools.sweep_builder import MAX_POINTS, build_uniform_configuration
+from picovna5_tools.sweep_result import SweepResult
+
+
+POWER_DBM = 0
+BANDWIDTH_HZ = 1000
+
+
+if __name__ == '__main__':
+
+    instrument = vna.Device.openDemo()
+    info = instrument.getInfo()
+    start_hz, stop_hz = info.minSweepFrequencyHz, info.maxSweepFrequencyHz
+    resolution_hz = float(sys.argv[1]) if len(sys.argv) > 1 else (stop_hz - start_hz) / (MAX_POINTS - 1)
+    coarse_points = int(sys.argv[2]) if len(sys.argv) > 2 else 401
+
+    adaptive = AdaptiveSweep(instrument, start_hz, stop_hz, resolution_hz, coarse_points, POWER_DBM, BANDWIDTH_HZ)
+    run = adaptive.run()
+    timing = run.timing
+    print(f"{start_hz / 1e6:.1f} MHz to {stop_hz / 1e6:.1f} MHz at {resolution_hz / 1e3:.1f} kHz resolution:")
+    print(f"    adaptive: {run.coarse_points} coarse + {run.fine_points} fine points in {len(run.regions)} regions, "
+          f"{timing['total_s'] * 1e3:.1f} ms ({timing['coarse_s'] * 1e3:.1f} + {timing['fine_s'] * 1e3:.1f} ms)")
+    print(f"    estimated uniform sweep of {run.uniform_points} points: {timing['uniform_s'] * 1e3:.1f} ms, "
+          f"saving {timing['saved_s'] * 1e3:.1f} ms")
+
+    if run.uniform_points > MAX_POINTS:
+        print(f"    (no uniform sweep measured: more than {MAX_POINTS} points)")
+        sys.exit(0)
+
+    mc = build_uniform_configuration(run.uniform_points, start_hz, stop_hz, POWER_DBM, BANDWIDTH_HZ)
+    start = time.perf_counter()
+    uniform = SweepResult.from_points(instrument.performMeasurement(mc))
+    uniform_s = time.perf_counter() - start
+    print(f"    measured uniform sweep of {len(uniform)} points: {uniform_s * 1e3:.1f} ms "
+          f"({uniform_s / timing['total_s']:.1f}x the adaptive sweep)")
+
+    interpolated = RegridEngine().regrid(run.result.freqs, uniform.freqs, run.result.s)
+    for name in ("S11", "S21"):
+        error = np.abs(logmag(interpolated[:, int(name[1]) - 1, int(name[2]) - 1])
+                       - logmag(uniform.parameter(name)))
+        print(f"    |{name}| difference from the uniform sweep: max {np.max(error):.2f} dB, "
+              f"median {np.median(error):.3f} dB")
@@ -0,0 +1,100 @@
+"""
+asyncio_demo_devices
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Exercises `AsyncDevice` with several simulated demo VNAs driven concurrently
+from one event loop.
+
+Each device runs a streamed sweep, a synchronous-style `measure()`, and a
+streamed sweep that is cancelled part way through (by a timeout), followed by
+another `measure()` to show that the device is usable after an abandoned
+sweep. A ticker task measures how responsive the event loop stays throughout.
+
+Running the benchmark
+--------------------
+Requires the `vna` package and SDK libraries (see api/python/README.md).
+python3 asyncio_demo_devices.py [number of demo devices]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.aio import AsyncDevice
+
+
+NUM_POINTS = 2001
+
+
+async def exercise(device, index):
+    info = await device.get_info()
+    mc = vna.MeasurementConfiguration()
+    mc.addUniformFrequencySweep(NUM_POINTS, info.minSweepFrequencyHz, info.maxSweepFrequencyHz, 0, 1000)
+
+    start = time.perf_counter()
+    streamed = 0
+    async for pt in device.stream(mc):
+        streamed += 1
+    stream_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    points = await device.measure(mc)
+    measure_s = time.perf_counter() - start
+
+    # abandon a sweep part way through
+    received = 0
+
+    async def partial_stream():
+        nonlocal received
+        async for pt in device.stream(mc):
+            received += 1
+
+    try:
+        await asyncio.wait_for(partial_stream(), timeout=stream_s / 4)
+    except asyncio.TimeoutError:
+        pass
+
+    after = await device.measure(mc)
+    if streamed != NUM_POINTS or len(points) != NUM_POINTS or len(after) != NUM_POINTS:
+        raise Exception(f"ERROR: device {index} returned the wrong number of points.")
+
+    print(f"Device {index} ({info.serial}): stream {stream_s * 1e3:.0f} ms, measure {measure_s * 1e3:.0f} ms, "
+          f"cancelled after {received} points, measured {len(after)} points afterwards")
+
+
+async def main(num_devices):
+    max_gap_s = 0.0
+
+    async def ticker():
+        nonlocal max_gap_s
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            max_gap_s = max(max_gap_s, now - last)
+            last = now
+
+    tick_task = asyncio.create_task(ticker())
+    devices = await asyncio.gather(*[AsyncDevice.open(vna.Device.openDemo) for _ in range(num_devices)])
+
+    start = time.perf_counter()
+    await asyncio.gather(*[exercise(device, i) for i, device in enumerate(devices)])
+    elapsed_s = time.perf_counter() - start
+
+    for device in devices:
+        await device.close()
+    tick_task.cancel()
+
+    print(f"{num_devices} devices finished in {elapsed_s * 1e3:.0f} ms; "
+          f"longest event loop stall {max_gap_s * 1e3:.1f} ms (1 ms ticker)")
+
+
+if __name__ == '__main__':
+
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 4))
@@ -0,0 +1,87 @@
+"""
+batch_plotting
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Measures images per second when rendering per-DUT report images of 10,001-point
+sweeps:
+
+- as in the PLOT OUTPUT section of scpi/python/video_example_1/demo.py, with a
+  new pyplot figure per image and every point plotted,
+- with a reused `ReportRenderer` figure, without and with min/max decimation,
+- with `render_batch`, which runs one renderer per process in a process pool.
+
+The sweeps are synthetic, with measurement noise, so no instrument is needed.
+
+Running the benchmark
+--------------------
+Requires `numpy` and `matplotlib`.
+python3 batch_plotting.py [images]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.conversions import logmag, phase_deg
+from picovna5_tools.plotting import ReportRenderer, render_batch
+from picovna5_tools.scpi_emulator import synthetic_network
+
+
+NUM_POINTS = 10001
+
+
+def render_pyplot(freqs, s, path, title):
+    """One image the way demo.py does it."""
+    plt.rcParams.update({'font.size': 4})
+    fig, axs = plt.subplots(2, 2)
+    for column, (m, n) in enumerate(((0, 0), (1, 0))):
+        axs[0][column].plot(freqs * 1e-9, logmag(s[:, m, n]))
+        axs[1][column].plot(freqs * 1e-9, phase_deg(s[:, m, n]))
+        axs[0][column].set_ylim([-100, 0])
+    axs[0][0].set_title('S11')
+    axs[0][1].set_title('S21')
+    fig.suptitle(title)
+    fig.savefig(path, dpi=220)
+    plt.close(fig)
+
+
+def images_per_second(render, jobs):
+    start = time.perf_counter()
+    for path, freqs, s, title in jobs:
+        render(freqs, s, path, title)
+    return len(jobs) / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    rng = np.random.default_rng(0)
+    freqs = np.linspace(0.3e6, 8.5e9, NUM_POINTS)
+    base = synthetic_network(freqs)
+
+    with tempfile.TemporaryDirectory() as directory:
+        jobs = []
+        for i in range(count):
+            s = base + 1e-3 * (rng.standard_normal(base.shape) + 1j * rng.standard_normal(base.shape))
+            jobs.append((os.path.join(directory, f"dut_{i}.png"), freqs, s, f"DUT {i}"))
+
+        print(f"{count} report images of {NUM_POINTS}-point sweeps (images/s)")
+        print(f"    new pyplot figure per image:     {images_per_second(render_pyplot, jobs):8.1f}")
+        full = ReportRenderer(decimate=False)
+        print(f"    reused figure, all points:       {images_per_second(full.render, jobs):8.1f}")
+        decimated = ReportRenderer()
+        print(f"    reused figure, min/max decimated:{images_per_second(decimated.render, jobs):8.1f}")
+        for processes in sorted({1, os.cpu_count() or 1}):
+            stats = render_batch(jobs, processes=processes)
+            print(f"    render_batch, {processes} processes:       {stats['images_per_s']:8.1f} "
+                  f"(including process start-up)")
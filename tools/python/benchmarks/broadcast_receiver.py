@@ -0,0 +1,131 @@
+"""
+broadcast_receiver
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Measures the throughput and parse latency of the binary broadcast receiver,
+using the local replay sender in place of an instrument.
+
+- Parsing alone: frames of a 10,001-point sweep are fed to `SweepAssembler`
+  from memory, and compared with unpacking each point with `struct`.
+- Over UDP: a `ReplaySender` in another process sends sweeps as fast as it
+  can (or at a given rate) to a `BroadcastReceiver` on the local host, which
+  reports sustained frames and sweeps per second, dropped frames and the parse
+  latency of each frame.
+
+See picovna5_tools/broadcast.py for the (assumed) frame format.
+
+Running the benchmark
+--------------------
+Requires `numpy`.
+python3 broadcast_receiver.py [sweeps] [points per frame] [sweeps per second, 0 for no limit]
+"""
+
+import multiprocessing
+import os
+import struct
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.broadcast import HEADER, BroadcastReceiver, ReplaySender, SweepAssembler
+from picovna5_tools.scpi_emulator import synthetic_network
+
+
+NUM_POINTS = 10001
+POINT = struct.Struct("<9d")
+
+
+def network():
+    freqs = np.linspace(0.3e6, 8.5e9, NUM_POINTS)
+    return freqs, synthetic_network(freqs)
+
+
+def parse_with_struct(frames):
+    """Unpacks every point with `struct`, for comparison."""
+    freqs, s = [], []
+    for frame in frames:
+        num_points = struct.unpack_from("<I", frame, 20)[0]
+        for offset in range(HEADER.size, HEADER.size + num_points * POINT.size, POINT.size):
+            f, r11, i11, r21, i21, r12, i12, r22, i22 = POINT.unpack_from(frame, offset)
+            freqs.append(f)
+            s.append((complex(r11, i11), complex(r12, i12), complex(r21, i21), complex(r22, i22)))
+    return np.array(freqs), np.array(s).reshape(-1, 2, 2)
+
+
+def send(port, sweeps, points_per_frame, rate):
+    freqs, s = network()
+    with ReplaySender(("127.0.0.1", port), points_per_frame) as sender:
+        frames = sender.encode_sweep(freqs, s)
+        start = time.perf_counter()
+        for i in range(sweeps):
+            if rate:
+                delay = start + i / rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            sender.send_sweep(frames)
+
+
+if __name__ == '__main__':
+
+    num_sweeps = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    points_per_frame = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    rate = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+
+    freqs, s = network()
+    with ReplaySender(points_per_frame=points_per_frame) as sender:
+        frames = sender.encode_sweep(freqs, s)
+    print(f"{NUM_POINTS}-point sweeps, {points_per_frame} points per frame ({len(frames)} frames per sweep)")
+
+    repeats = 20
+    assembler = SweepAssembler(NUM_POINTS)
+    views = [memoryview(frame) for frame in frames]
+    start = time.perf_counter()
+    for sweep in range(repeats):
+        for frame, view in zip(frames, views):
+            struct.pack_into("<II", frame, 8, sweep * len(frames), sweep)
+            assembler.feed(view)
+    assembler_s = (time.perf_counter() - start) / repeats
+    if not (np.array_equal(assembler.buffer.result().s, s) and assembler.sweeps == repeats):
+        raise Exception("ERROR: the reassembled sweep differs from the sweep sent.")
+
+    start = time.perf_counter()
+    parse_with_struct(frames)
+    struct_s = time.perf_counter() - start
+
+    print("Parsing from memory:")
+    print(f"    struct, per point:   {struct_s * 1e3:8.2f} ms per sweep")
+    print(f"    SweepAssembler:      {assembler_s * 1e3:8.2f} ms per sweep "
+          f"({assembler_s / len(frames) * 1e6:.1f} us per frame, {struct_s / assembler_s:.0f}x)")
+
+    with BroadcastReceiver(port=0, max_points=NUM_POINTS) as receiver:
+        receiver.start()
+        sender_process = multiprocessing.Process(target=send, args=(receiver.address[1], num_sweeps,
+                                                                    points_per_frame, rate))
+        start = time.perf_counter()
+        sender_process.start()
+        sender_process.join()
+        # let the receiver drain its socket buffer
+        expected_frames = num_sweeps * len(frames)
+        while receiver.assembler.frames < expected_frames and time.perf_counter() - start < 60:
+            frames_before = receiver.assembler.frames
+            time.sleep(0.1)
+            if receiver.assembler.frames == frames_before:
+                break
+        elapsed_s = time.perf_counter() - start
+        receiver.stop()
+        stats = receiver.stats()
+
+    latency = stats["parse_latency"]
+    print(f"Over UDP on the local host, {num_sweeps} sweeps sent "
+          f"{f'at {rate:g} sweeps/s' if rate else 'as fast as possible'}:")
+    print(f"    {stats['frames'] / elapsed_s:10.0f} frames/s, {stats['sweeps'] / elapsed_s:.1f} sweeps/s "
+          f"({stats['frames'] * len(frames[0]) / elapsed_s / 1e6:.0f} MB/s)")
+    print(f"    {stats['sweeps']} sweeps complete, {stats['incomplete_sweeps']} incomplete, "
+          f"{stats['dropped_frames']} frames dropped, {stats['out_of_order_frames']} out of order, "
+          f"{stats['duplicate_frames']} duplicates")
+    print(f"    parse latency per frame: median {latency['p50'] * 1e6:.1f} us, "
+          f"p95 {latency['p95'] * 1e6:.1f} us, max {latency['max'] * 1e6:.1f} us")
@@ -0,0 +1,88 @@
+"""
+cascade_vs_skrf
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Compares the circuit emulation of scpi/python/video_example_1/demo.py
+(`attenuator ** coax_line ** band_pass_filter` with scikit-rf) against
+`CascadeEngine`, for every combination of a set of attenuators and a set of
+band-pass filters.
+
+The attenuators and filters are variations of the ideal networks in
+atten_ideal.s2p and bpf_ideal.s2p. The benchmark first checks the analytic
+coaxial line and the cascade against scikit-rf, then times both approaches.
+
+Running the benchmark
+--------------------
+Requires `numpy` and `scikit-rf`.
+python3 cascade_vs_skrf.py [attenuators] [filters]
+"""
+
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import skrf
+from skrf.media import Coaxial
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.cascade import CascadeEngine, coaxial_line
+
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..",
+                           "scpi", "python", "video_example_1")
+
+# the line used in demo.py: 50 mm of RG-58
+COAX = dict(Dint=0.91e-3, Dout=2.95e-3, epsilon_r=2.3)
+LENGTH_M = 50e-3
+
+
+if __name__ == '__main__':
+
+    num_attenuators = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    num_filters = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+
+    attenuator = skrf.Network(os.path.join(EXAMPLE_DIR, "atten_ideal.s2p"))
+    band_pass_filter = skrf.Network(os.path.join(EXAMPLE_DIR, "bpf_ideal.s2p"))
+    freqs = band_pass_filter.f
+
+    # as in demo.py
+    coax = Coaxial(frequency=band_pass_filter.frequency, z0_port=50, **COAX)
+    coax_line = coax.line(50, 'mm', z0=50)
+
+    line_error = np.max(np.abs(coaxial_line(freqs, LENGTH_M, z0=50, **COAX) - coax_line.s))
+    print(f"coaxial_line vs skrf Coaxial.line: max |dS| = {line_error:.2e}")
+
+    engine = CascadeEngine(freqs)
+    engine.add_coaxial_line("coax", LENGTH_M, z0=50, **COAX)
+    expected = attenuator ** coax_line ** band_pass_filter
+    error = np.max(np.abs(engine.run(attenuator.s, "coax", band_pass_filter.s) - expected.s))
+    print(f"CascadeEngine vs skrf cascade:     max |dS| = {error:.2e}")
+
+    # variations of the ideal networks, standing in for measured DUTs
+    rng = np.random.default_rng(0)
+    attenuators = [attenuator.s * rng.uniform(0.9, 1.1) for _ in range(num_attenuators)]
+    filters = [band_pass_filter.s * np.exp(1j * rng.uniform(-0.1, 0.1)) for _ in range(num_filters)]
+    combinations = num_attenuators * num_filters
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        attenuator_networks = [skrf.Network(frequency=attenuator.frequency, s=s) for s in attenuators]
+        filter_networks = [skrf.Network(frequency=band_pass_filter.frequency, s=s) for s in filters]
+        start = time.perf_counter()
+        for a in attenuator_networks:
+            for f in filter_networks:
+                a ** coax_line ** f
+        skrf_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = engine.run(np.stack(attenuators)[:, None], "coax", np.stack(filters)[None])
+    engine_s = time.perf_counter() - start
+
+    print(f"{combinations} combinations of {len(freqs)} points, result shape {result.shape}")
+    print(f"    skrf, one cascade per combination: {skrf_s * 1e3:9.1f} ms")
+    print(f"    CascadeEngine, one batched call:   {engine_s * 1e3:9.1f} ms ({skrf_s / engine_s:.0f}x)")
+    print(f"    element cache: {engine.hits} hits, {engine.misses} misses")
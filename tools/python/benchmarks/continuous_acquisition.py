@@ -0,0 +1,102 @@
+"""
+continuous_acquisition
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Measures sustained sweeps per second when sweeping the same 2001-point
+configuration of the simulated demo VNA back to back, with host processing
+after each sweep:
+
+- as in api/python/01_simple_frequency_sweep, one sweep at a time: start the
+  sweep, collect its points, process them, then start the next,
+- with `ContinuousAcquisition`, which starts the next sweep before processing
+  the last one, with processing taking 80% of a sweep time,
+- with `ContinuousAcquisition` and processing taking twice as long as a sweep,
+  where the oldest waiting sweeps are dropped (or, with `policy="block"`, the
+  instrument waits for the host).
+
+Processing is the log magnitude and phase of every S-parameter, plus a sleep
+standing in for export or network I/O.
+
+Running the benchmark
+--------------------
+Requires `numpy` and the `vna` package and SDK libraries (see api/python/README.md).
+python3 continuous_acquisition.py [seconds per case]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.continuous import ContinuousAcquisition
+from picovna5_tools.conversions import logmag, phase_deg
+from picovna5_tools.sweep_result import SweepResult
+
+
+NUM_POINTS = 2001
+
+
+def make_process(host_s):
+    logmag_out = np.empty((NUM_POINTS, 2, 2))
+    phase_out = np.empty((NUM_POINTS, 2, 2))
+
+    def process(result):
+        logmag(result.s, out=logmag_out)
+        phase_deg(result.s, out=phase_out)
+        time.sleep(host_s)
+
+    return process
+
+
+def one_at_a_time(instrument, mc, process, duration_s):
+    sweeps = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration_s:
+        process(SweepResult.from_sweep(instrument.startMeasurement(mc)))
+        sweeps += 1
+    return sweeps / (time.perf_counter() - start)
+
+
+def continuous(instrument, mc, process, duration_s, policy="drop_oldest"):
+    acquisition = ContinuousAcquisition(instrument, mc, NUM_POINTS, lambda buffer: process(buffer.result()),
+                                        policy=policy)
+    return acquisition.run(duration_s)
+
+
+if __name__ == '__main__':
+
+    duration_s = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+
+    instrument = vna.Device.openDemo()
+    info = instrument.getInfo()
+    mc = vna.MeasurementConfiguration()
+    mc.addUniformFrequencySweep(NUM_POINTS, info.minSweepFrequencyHz, info.maxSweepFrequencyHz, 0, 1000)
+
+    sweep_times = []
+    for _ in range(5):
+        start = time.perf_counter()
+        SweepResult.from_sweep(instrument.startMeasurement(mc))
+        sweep_times.append(time.perf_counter() - start)
+    sweep_s = float(np.median(sweep_times))
+    print(f"{NUM_POINTS}-point demo sweep: {sweep_s * 1e3:.1f} ms, {1 / sweep_s:.1f} sweeps/s at most")
+
+    process = make_process(0.8 * sweep_s)
+    print(f"Processing taking 80% of a sweep time, {duration_s:.0f} s per case:")
+    print(f"    one sweep at a time:       {one_at_a_time(instrument, mc, process, duration_s):6.1f} sweeps/s")
+    stats = continuous(instrument, mc, process, duration_s)
+    print(f"    ContinuousAcquisition:     {stats['sweeps_per_s']:6.1f} sweeps/s, {stats['dropped']} dropped, "
+          f"re-arm {stats['mean_rearm_s'] * 1e3:.2f} ms")
+
+    process = make_process(2.0 * sweep_s)
+    print("Processing taking twice a sweep time:")
+    print(f"    one sweep at a time:       {one_at_a_time(instrument, mc, process, duration_s):6.1f} sweeps/s")
+    for policy in ("drop_oldest", "block"):
+        stats = continuous(instrument, mc, process, duration_s, policy)
+        print(f"    {policy + ':':<26} {stats['sweeps_per_s']:6.1f} sweeps/s, "
+              f"{stats['processed_per_s']:5.1f} processed/s, {stats['dropped']} dropped, "
+              f"instrument waited {stats['acquisition_wait_s']:.2f} s")
@@ -0,0 +1,106 @@
+"""
+conversions_vs_vna
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Checks that the vectorised `conversions.logmag` and `conversions.phase_deg`
+agree with the scalar `vna.toLogMag()` and `vna.toPhaseDeg()` on data from the
+simulated demo VNA, to within `LOGMAG_TOLERANCE_DB` and `PHASE_TOLERANCE_DEG`
+(phases are compared modulo 360 degrees), and compares the time taken to
+convert all four S-parameters of a sweep. The largest difference in ULP is
+reported too; the two are not expected to round identically.
+
+The scalar path is the loop used in
+api/python/02_load_user_cal_and_print_logmagarg_data (without the printing).
+
+Running the benchmark
+--------------------
+Requires `numpy` and the `vna` package and SDK libraries (see api/python/README.md).
+python3 conversions_vs_vna.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools import conversions
+from picovna5_tools.sweep_result import SweepResult
+
+
+NUM_POINTS = 10001
+REPEATS = 10
+LOGMAG_TOLERANCE_DB = 1e-9
+PHASE_TOLERANCE_DEG = 1e-9
+
+
+def scalar_loop(points):
+    return [
+        (vna.toLogMag(pt.s11), vna.toPhaseDeg(pt.s11), vna.toLogMag(pt.s21), vna.toPhaseDeg(pt.s21),
+         vna.toLogMag(pt.s12), vna.toPhaseDeg(pt.s12), vna.toLogMag(pt.s22), vna.toPhaseDeg(pt.s22))
+        for pt in points
+    ]
+
+
+def check_close(name, expected, actual, tolerance, period=None):
+    expected = np.asarray(expected, dtype=np.float64)
+    error = actual - expected
+    if period is not None:
+        error = (error + period / 2) % period - period / 2
+    error = np.abs(error)
+    # infinities (|s| = 0) must match exactly
+    error[expected == actual] = 0.0
+    ulps = np.abs(expected.view(np.int64) - actual.view(np.int64)).max()
+    worst = float(np.max(error))
+    if not worst <= tolerance:
+        raise Exception(f"ERROR: {name} differs from the vna package by up to {worst:.3g} "
+                        f"(tolerance {tolerance:g}).")
+    print(f"{name}: within {tolerance:g} of the vna package, max difference {worst:.3g} ({ulps} ULP, "
+          f"{expected.size} values)")
+
+
+def best_time(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+
+    instrument = vna.Device.openDemo()
+    info = instrument.getInfo()
+
+    mc = vna.MeasurementConfiguration()
+    mc.addUniformFrequencySweep(NUM_POINTS, info.minSweepFrequencyHz, info.maxSweepFrequencyHz, 0, 1000)
+    points = instrument.performMeasurement(mc)
+    result = SweepResult.from_points(points)
+
+    # S-matrix order: S11, S12, S21, S22
+    scalar = np.array([[(vna.toLogMag(s), vna.toPhaseDeg(s)) for s in (pt.s11, pt.s12, pt.s21, pt.s22)]
+                       for pt in points]).reshape(len(points), 2, 2, 2)
+    check_close("logmag", scalar[..., 0], conversions.logmag(result.s), LOGMAG_TOLERANCE_DB)
+    check_close("phase_deg", scalar[..., 1], conversions.phase_deg(result.s), PHASE_TOLERANCE_DEG, period=360.0)
+
+    logmag_out = np.empty(result.s.shape)
+    phase_out = np.empty(result.s.shape)
+
+    def vectorised():
+        conversions.logmag(result.s, out=logmag_out)
+        conversions.phase_deg(result.s, out=phase_out)
+
+    scalar_s = best_time(lambda: scalar_loop(points))
+    convert_s = best_time(lambda: SweepResult.from_points(points))
+    vector_s = best_time(vectorised)
+
+    print(f"{len(points)} points, LogMag and phase of all four S-parameters:")
+    print(f"    scalar vna.toLogMag/toPhaseDeg loop:   {scalar_s * 1e3:8.2f} ms")
+    print(f"    SweepResult conversion:                {convert_s * 1e3:8.2f} ms")
+    print(f"    vectorised, preallocated buffers:      {vector_s * 1e3:8.3f} ms")
+    print(f"    speedup (including conversion):        {scalar_s / (convert_s + vector_s):8.1f}x")
@@ -0,0 +1,92 @@
+"""
+instrumentation_overhead
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Measures the overhead of `InstrumentedDevice` on a 2001-point asynchronous
+sweep of the simulated demo VNA, as in api/python/01_simple_frequency_sweep.
+
+Plain and instrumented sweeps are run alternately and the median times
+compared. The overhead per point is also measured on its own, using a sweep
+object that returns points without doing any work, since it can be smaller
+than the variation between demo sweeps. Finally the collected histograms are
+printed with `LogExporter`.
+
+Running the benchmark
+--------------------
+Requires `numpy` and the `vna` package and SDK libraries (see api/python/README.md).
+python3 instrumentation_overhead.py [sweeps]
+"""
+
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.instrumentation import (InstrumentedDevice, InstrumentedSweep, LogExporter, SweepMetrics,
+                                            SweepTimeline)
+
+
+NUM_POINTS = 2001
+
+
+class NullSweep:
+    """Returns the same point NUM_POINTS times without waiting."""
+
+    def __init__(self, pt):
+        self.pt = pt
+        self.remaining = NUM_POINTS
+
+    def hasMorePoints(self):
+        return self.remaining > 0
+
+    def getNextPoint(self):
+        self.remaining -= 1
+        return self.pt
+
+
+def drain(sweep):
+    start = time.perf_counter()
+    while sweep.hasMorePoints():
+        sweep.getNextPoint()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    instrument = vna.Device.openDemo()
+    info = instrument.getInfo()
+    metrics = SweepMetrics([LogExporter()])
+    instrumented = InstrumentedDevice(instrument, metrics, labels={"serial": info.serial})
+
+    mc = vna.MeasurementConfiguration()
+    mc.addUniformFrequencySweep(NUM_POINTS, info.minSweepFrequencyHz, info.maxSweepFrequencyHz, 0, 1000)
+
+    plain, timed = [], []
+    for _ in range(count):
+        plain.append(drain(instrument.startMeasurement(mc)))
+        timed.append(drain(instrumented.startMeasurement(mc)))
+    plain_s, timed_s = np.median(plain), np.median(timed)
+
+    # the instrumentation cost alone, without any device time
+    pt = instrument.performMeasurement(mc)[0]
+    null_plain = min(drain(NullSweep(pt)) for _ in range(count))
+    null_timed = min(drain(InstrumentedSweep(NullSweep(pt), SweepTimeline(SweepMetrics())))
+                     for _ in range(count))
+    per_point_s = (null_timed - null_plain) / NUM_POINTS
+
+    print(f"{NUM_POINTS}-point demo sweeps, median of {count}:")
+    print(f"    plain:        {plain_s * 1e3:8.2f} ms")
+    print(f"    instrumented: {timed_s * 1e3:8.2f} ms ({(timed_s - plain_s) / plain_s * 100:+.2f}%)")
+    print(f"Instrumentation cost: {per_point_s * 1e9:.0f} ns per point, "
+          f"{per_point_s * NUM_POINTS / plain_s * 100:.3f}% of a demo sweep")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    metrics.export()
@@ -0,0 +1,51 @@
+"""
+orchestrator_scaling
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Measures how the aggregate sweep rate of `SweepOrchestrator` scales with the
+number of instruments in the pool.
+
+Real instruments are used if connected; otherwise (or if there are fewer than
+requested) the pool is topped up with simulated demo instruments.
+
+Running the benchmark
+--------------------
+Requires `numpy` and the `vna` package and SDK libraries (see api/python/README.md).
+python3 orchestrator_scaling.py [maximum number of instruments]
+"""
+
+import os
+import sys
+
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.orchestrator import SweepOrchestrator, open_pool
+
+
+NUM_POINTS = 2001
+JOBS_PER_DEVICE = 8
+
+
+if __name__ == '__main__':
+
+    max_devices = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    devices = open_pool(count=max_devices, demo_fallback=True)
+
+    info = devices[0].getInfo()
+    mc = vna.MeasurementConfiguration()
+    mc.addUniformFrequencySweep(NUM_POINTS, info.minSweepFrequencyHz, info.maxSweepFrequencyHz, 0, 1000)
+
+    print(f"{NUM_POINTS} points, {JOBS_PER_DEVICE} sweeps per instrument")
+    print(f"{'devices':>8} {'sweeps/s':>10} {'scaling':>8}  utilisation per device")
+    baseline = None
+    for count in range(1, len(devices) + 1):
+        with SweepOrchestrator(devices[:count]) as orchestrator:
+            orchestrator.run((job, mc) for job in range(JOBS_PER_DEVICE * count))
+            stats = orchestrator.stats()
+        if baseline is None:
+            baseline = stats["sweeps_per_s"]
+        utilisation = " ".join(f"{d['serial']}:{d['utilisation'] * 100:.0f}%" for d in stats["devices"])
+        print(f"{count:>8} {stats['sweeps_per_s']:>10.2f} {stats['sweeps_per_s'] / baseline:>7.2f}x  {utilisation}")
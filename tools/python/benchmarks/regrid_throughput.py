@@ -0,0 +1,93 @@
+"""
+regrid_throughput
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Compares ways of re-gridding many 2001-point sweeps onto a fixed 1001-point
+grid, and interpolating the 12 error terms of a 10,001-point calibration onto
+the sweep grid:
+
+- `np.interp` on the real and imaginary part of each S-parameter (or error
+  term) of each sweep,
+- `RegridEngine` one sweep at a time, where every call after the first reuses
+  the cached interpolation plan,
+- the same without the cache, computing the indices and weights every time,
+- `RegridEngine` on the whole stack of sweeps in one call.
+
+The data is synthetic, so no instrument is needed.
+
+Running the benchmark
+--------------------
+Requires `numpy`.
+python3 regrid_throughput.py [sweeps]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.regrid import ERROR_TERMS, InterpolationPlan, RegridEngine
+
+
+SOURCE_POINTS = 2001
+TARGET_POINTS = 1001
+CAL_POINTS = 10001
+
+
+def interp_complex(target, source, values):
+    return np.interp(target, source, values.real) + 1j * np.interp(target, source, values.imag)
+
+
+def regrid_with_interp(source, target, stack):
+    out = np.empty((len(stack), len(target), 2, 2), dtype=np.complex128)
+    for k, s in enumerate(stack):
+        for m in range(2):
+            for n in range(2):
+                out[k, :, m, n] = interp_complex(target, source, s[:, m, n])
+    return out
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+
+    num_sweeps = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    rng = np.random.default_rng(0)
+    source = np.linspace(0.3e6, 8.5e9, SOURCE_POINTS)
+    target = np.sort(rng.uniform(1e6, 8e9, TARGET_POINTS))
+    stack = (rng.standard_normal((num_sweeps, SOURCE_POINTS, 2, 2))
+             + 1j * rng.standard_normal((num_sweeps, SOURCE_POINTS, 2, 2)))
+
+    engine = RegridEngine()
+    interp_s, expected = timed(regrid_with_interp, source, target, stack)
+    cached_s, _ = timed(lambda: [engine.regrid(source, target, s) for s in stack])
+    uncached_s, _ = timed(lambda: [InterpolationPlan(source, target).apply(s) for s in stack])
+    batch_s, result = timed(engine.regrid, source, target, stack)
+    error = np.max(np.abs(result - expected))
+
+    print(f"{num_sweeps} sweeps of {SOURCE_POINTS} points onto {TARGET_POINTS} points "
+          f"(max difference from np.interp {error:.1e}):")
+    print(f"    np.interp per sweep and S-parameter:  {interp_s * 1e3:9.1f} ms")
+    print(f"    RegridEngine per sweep, uncached:     {uncached_s * 1e3:9.1f} ms")
+    print(f"    RegridEngine per sweep, cached plan:  {cached_s * 1e3:9.1f} ms ({interp_s / cached_s:.1f}x)")
+    print(f"    RegridEngine, one batched call:       {batch_s * 1e3:9.1f} ms ({interp_s / batch_s:.1f}x)")
+    print(f"    plan cache: {engine.hits} hits, {engine.misses} misses")
+
+    cal_freqs = np.linspace(0.3e6, 8.5e9, CAL_POINTS)
+    terms = rng.standard_normal((len(ERROR_TERMS), CAL_POINTS)) + 1j * rng.standard_normal((len(ERROR_TERMS),
+                                                                                           CAL_POINTS))
+    repeats = 200
+    interp_s, _ = timed(lambda: [[interp_complex(source, cal_freqs, t) for t in terms] for _ in range(repeats)])
+    engine_s, _ = timed(lambda: [engine.interpolate_error_terms(cal_freqs, source, terms) for _ in range(repeats)])
+    print(f"12 error terms of {CAL_POINTS} points onto the {SOURCE_POINTS}-point sweep grid, {repeats} times:")
+    print(f"    np.interp per term:                   {interp_s * 1e3:9.1f} ms")
+    print(f"    RegridEngine, cached plan:            {engine_s * 1e3:9.1f} ms ({interp_s / engine_s:.1f}x)")
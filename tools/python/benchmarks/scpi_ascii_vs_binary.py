@@ -0,0 +1,69 @@
+"""
+scpi_ascii_vs_binary
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Compares the throughput of retrieving trace data over SCPI in ASCII format
+(as in scpi/python/01_simple_frequency_sweep) against the default binary
+format, at 201, 2001 and 10001 points.
+
+The benchmark runs against the local SCPI emulator, so the PicoVNA 5
+software does not need to be running. Each iteration retrieves the same eight
+LogMag/Phase traces as the SCPI example.
+
+Running the benchmark
+--------------------
+Requires `numpy`, `pyvisa` and `pyvisa-py`.
+python3 scpi_ascii_vs_binary.py [repeats]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pyvisa
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.scpi_client import S_PARAMETERS, ScpiClient
+from picovna5_tools.scpi_emulator import ScpiEmulator
+
+
+POINT_COUNTS = (201, 2001, 10001)
+TRACES = [(p, fmt) for p in S_PARAMETERS for fmt in ("LOGMAG", "PHASE")]
+
+
+def fetch_all(client):
+    return [client.trace(p, fmt) for p, fmt in TRACES]
+
+
+def time_fetch(client, repeats):
+    fetch_all(client)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        data = fetch_all(client)
+    return (time.perf_counter() - start) / repeats, data
+
+
+if __name__ == '__main__':
+
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rm = pyvisa.ResourceManager("@py")
+
+    print(f"{'points':>8} {'ascii ms':>10} {'binary ms':>10} {'speedup':>8} {'binary MB/s':>12}")
+    for num_points in POINT_COUNTS:
+        with ScpiEmulator(num_points=num_points) as server:
+            with ScpiClient.open(server.address, rm, binary=False) as client:
+                ascii_s, ascii_data = time_fetch(client, repeats)
+            with ScpiClient.open(server.address, rm) as client:
+                binary_s, binary_data = time_fetch(client, repeats)
+
+        # ASCII values are printed with repr(), so both paths must agree exactly
+        for a, b in zip(ascii_data, binary_data):
+            if not np.array_equal(a, b):
+                raise Exception("ERROR: ASCII and binary transfers returned different data.")
+
+        megabytes = len(TRACES) * num_points * 8 / 1e6
+        print(f"{num_points:>8} {ascii_s * 1e3:>10.2f} {binary_s * 1e3:>10.2f} "
+              f"{ascii_s / binary_s:>7.1f}x {megabytes / binary_s:>12.1f}")
@@ -0,0 +1,77 @@
+"""
+scpi_emulator_clients
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Load-tests the local SCPI emulator with several concurrent clients, each
+repeatedly starting a sweep (`INIT`) and importing the live S-matrix, with an
+emulated sweep time and network round-trip time.
+
+This shows the emulator serving many clients at once, and gives an offline
+baseline for client throughput work: with a sweep time of T, each client can
+complete at most 1/T sweeps per second.
+
+Running the benchmark
+--------------------
+Requires `numpy`, `pyvisa` and `pyvisa-py`.
+python3 scpi_emulator_clients.py [sweep time in ms] [round trip time in ms]
+"""
+
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pyvisa
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.scpi_client import ScpiClient
+from picovna5_tools.scpi_emulator import ScpiEmulator
+
+
+NUM_POINTS = 2001
+CLIENT_COUNTS = (1, 2, 4, 8)
+DURATION_S = 2.0
+
+
+def run_clients(address, count):
+    rm = pyvisa.ResourceManager("@py")
+    clients = [ScpiClient.open(address, rm) for _ in range(count)]
+    latencies = [[] for _ in range(count)]
+    deadline = time.perf_counter() + DURATION_S
+
+    def worker(client, result):
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            client.start_sweep()
+            client.fetch_s_matrix()
+            result.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker, args=args) for args in zip(clients, latencies)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed_s = time.perf_counter() - start
+    for client in clients:
+        client.close()
+    return elapsed_s, np.concatenate([np.array(result) for result in latencies])
+
+
+if __name__ == '__main__':
+
+    sweep_time_s = (float(sys.argv[1]) if len(sys.argv) > 1 else 20.0) * 1e-3
+    rtt_s = (float(sys.argv[2]) if len(sys.argv) > 2 else 1.0) * 1e-3
+
+    with ScpiEmulator(num_points=NUM_POINTS, sweep_time_s=sweep_time_s, latency_s=rtt_s) as server:
+        print(f"{NUM_POINTS} points, emulated sweep time {sweep_time_s * 1e3:.1f} ms, "
+              f"round trip time {rtt_s * 1e3:.1f} ms")
+        print(f"{'clients':>7} {'sweeps/s':>9} {'median ms':>10} {'p95 ms':>8}")
+        for count in CLIENT_COUNTS:
+            elapsed_s, latencies = run_clients(server.address, count)
+            print(f"{count:>7} {len(latencies) / elapsed_s:>9.1f} {np.median(latencies) * 1e3:>10.2f} "
+                  f"{np.percentile(latencies, 95) * 1e3:>8.2f}")
+        print(f"Emulator served {server.connections} connections, {server.commands} commands")
@@ -0,0 +1,88 @@
+"""
+scpi_pipelined_import
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Compares importing memory channels the way `import_data()` in
+scpi/python/video_example_1/demo.py does (eight REAL/IMAG queries plus three
+sweep queries, each a separate round trip) against `ScpiClient.fetch_s_matrices`,
+which pipelines every command into a single round trip.
+
+The benchmark runs against the local SCPI emulator with an emulated
+network round-trip time, so the PicoVNA 5 software does not need to be running.
+
+Running the benchmark
+--------------------
+Requires `numpy`, `pyvisa` and `pyvisa-py`.
+python3 scpi_pipelined_import.py [round trip time in ms]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pyvisa
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.scpi_client import S_MATRIX_INDEX, S_PARAMETERS, ScpiClient
+from picovna5_tools.scpi_emulator import ScpiEmulator
+
+
+NUM_POINTS = 2001
+CHANNEL_COUNTS = (1, 2, 4, 8)
+REPEATS = 5
+
+
+def import_sequential(client, memory_channel):
+    """One round trip per query, as in demo.py (but using binary transfers)."""
+    freqs = client.sweep_frequencies()
+    s = np.empty((len(freqs), 2, 2), dtype=np.complex128)
+    for parameter in S_PARAMETERS:
+        m, n = S_MATRIX_INDEX[parameter]
+        s[:, m, n] = (client.trace(parameter, "REAL", memory_channel)
+                      + 1j * client.trace(parameter, "IMAG", memory_channel))
+    return freqs, s
+
+
+def best_time(fn):
+    fn()  # warm up
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+
+    rtt_s = (float(sys.argv[1]) if len(sys.argv) > 1 else 1.0) * 1e-3
+    rm = pyvisa.ResourceManager("@py")
+
+    memory = {channel: None for channel in range(max(CHANNEL_COUNTS))}
+    with ScpiEmulator(num_points=NUM_POINTS, memory=memory, latency_s=rtt_s) as server:
+        with ScpiClient.open(server.address, rm) as client:
+
+            # check that both paths return identical data
+            result = client.fetch_s_matrices(range(max(CHANNEL_COUNTS)))
+            for channel, s in enumerate(result.s):
+                freqs, expected = import_sequential(client, channel)
+                if not (np.array_equal(s, expected) and np.array_equal(result.freqs, freqs)):
+                    raise Exception("ERROR: pipelined and sequential imports returned different data.")
+
+            print(f"{NUM_POINTS} points, emulated round trip time {rtt_s * 1e3:.1f} ms")
+            print(f"{'channels':>8} {'sequential ms':>14} {'pipelined ms':>13} {'speedup':>8}")
+            for count in CHANNEL_COUNTS:
+                channels = list(range(count))
+                sequential_s = best_time(lambda: [import_sequential(client, c) for c in channels])
+                pipelined_s = best_time(lambda: client.fetch_s_matrices(channels))
+                print(f"{count:>8} {sequential_s * 1e3:>14.2f} {pipelined_s * 1e3:>13.2f} "
+                      f"{sequential_s / pipelined_s:>7.1f}x")
+
+            timing = client.fetch_s_matrices(channels).timing
+            print(f"Latency breakdown for {count} channels ({timing['commands']} commands, "
+                  f"{timing['round_trips']} round trip):")
+            for stage in ("write", "first_response", "transfer", "assemble", "total"):
+                print(f"    {stage:<15} {timing[stage] * 1e3:8.3f} ms")
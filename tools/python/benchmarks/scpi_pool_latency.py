@@ -0,0 +1,94 @@
+"""
+scpi_pool_latency
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Measures the latency of importing one memory channel with and without an
+`ScpiPool`, against the local SCPI emulator.
+
+Without pooling, each import creates a new `pyvisa.ResourceManager`, opens a
+session, configures it and closes it again, as `import_data()` in
+scpi/python/video_example_1/demo.py does. With pooling, each import leases an
+already-configured session. The pooled imports are also run from several
+threads at once.
+
+Running the benchmark
+--------------------
+Requires `numpy`, `pyvisa` and `pyvisa-py`.
+python3 scpi_pool_latency.py [imports]
+"""
+
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pyvisa
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.scpi_client import ScpiClient
+from picovna5_tools.scpi_emulator import ScpiEmulator
+from picovna5_tools.scpi_pool import ScpiPool
+
+
+NUM_POINTS = 2001
+THREADS = 4
+
+
+def import_unpooled(address):
+    rm = pyvisa.ResourceManager("@py")
+    with ScpiClient.open(address, rm) as client:
+        return client.fetch_s_matrix(0)
+
+
+def import_pooled(pool):
+    with pool.lease() as client:
+        return client.fetch_s_matrix(0)
+
+
+def latencies(fn, count):
+    result = []
+    for _ in range(count):
+        start = time.perf_counter()
+        fn()
+        result.append(time.perf_counter() - start)
+    return np.array(result)
+
+
+def describe(name, values):
+    print(f"{name:<26} median {np.median(values) * 1e3:7.2f} ms   "
+          f"p95 {np.percentile(values, 95) * 1e3:7.2f} ms   max {values.max() * 1e3:7.2f} ms")
+
+
+if __name__ == '__main__':
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    with ScpiEmulator(num_points=NUM_POINTS) as server:
+        unpooled = latencies(lambda: import_unpooled(server.address), count)
+
+        with ScpiPool(server.address, size=THREADS, resource_manager=pyvisa.ResourceManager("@py")) as pool:
+            pool.warm_up()
+            pooled = latencies(lambda: import_pooled(pool), count)
+
+            threaded = []
+
+            def worker():
+                threaded.extend(latencies(lambda: import_pooled(pool), count))
+
+            threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            threaded_s = time.perf_counter() - start
+            stats = pool.stats()
+
+    print(f"Import of one {NUM_POINTS}-point memory channel, {count} imports:")
+    describe("new session per import", unpooled)
+    describe("pooled session", pooled)
+    describe(f"pooled, {THREADS} threads", np.array(threaded))
+    print(f"{THREADS} threads: {THREADS * count / threaded_s:.0f} imports/s; pool {stats}")
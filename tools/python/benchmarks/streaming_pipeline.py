@@ -0,0 +1,76 @@
+"""
+streaming_pipeline
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Shows how slow downstream processing delays draining an asynchronous sweep
+when it is done inline (as in the API examples), and how `StreamingPipeline`
+keeps draining at the device rate.
+
+A "publish" stage that sleeps for a configurable time per point stands in for
+slow formatting, disk or network work. For both approaches the benchmark
+reports when the last point was received from the device and when processing
+finished, together with the pipeline's backpressure statistics.
+
+Running the benchmark
+--------------------
+Requires `numpy` and the `vna` package and SDK libraries (see api/python/README.md).
+python3 streaming_pipeline.py [publish delay per point in ms]
+"""
+
+import os
+import sys
+import time
+
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.streaming import ArrayCollector, StreamingPipeline, convert_point
+
+
+NUM_POINTS = 2001
+
+
+if __name__ == '__main__':
+
+    delay_s = (float(sys.argv[1]) if len(sys.argv) > 1 else 0.2) * 1e-3
+
+    def publish(row):
+        time.sleep(delay_s)
+        return row
+
+    instrument = vna.Device.openDemo()
+    info = instrument.getInfo()
+
+    mc = vna.MeasurementConfiguration()
+    mc.addUniformFrequencySweep(NUM_POINTS, info.minSweepFrequencyHz, info.maxSweepFrequencyHz, 0, 1000)
+
+    # inline processing, as in the examples
+    collector = ArrayCollector(NUM_POINTS)
+    start = time.perf_counter()
+    sweep = instrument.startMeasurement(mc)
+    while sweep.hasMorePoints():
+        pt = sweep.getNextPoint()
+        last_point_s = time.perf_counter() - start
+        publish(collector(convert_point(pt)))
+    inline_done_s = time.perf_counter() - start
+
+    # streaming pipeline; the buffer is large enough to hold the whole sweep
+    collector = ArrayCollector(NUM_POINTS)
+    start = time.perf_counter()
+    pipeline = StreamingPipeline(instrument.startMeasurement(mc), [convert_point, collector, publish],
+                                 capacity=NUM_POINTS)
+    stats = pipeline.run()
+    pipeline_done_s = time.perf_counter() - start
+
+    print(f"{NUM_POINTS} points, publish delay {delay_s * 1e3:.2f} ms per point")
+    print(f"{'':<10} {'last point received':>20} {'processing done':>16}")
+    print(f"{'inline':<10} {last_point_s * 1e3:>17.1f} ms {inline_done_s * 1e3:>13.1f} ms")
+    print(f"{'pipeline':<10} {stats['drain_s'] * 1e3:>17.1f} ms {pipeline_done_s * 1e3:>13.1f} ms")
+    print(f"Collected {collector.result()}")
+    print("Buffer statistics (buffer i feeds stage i: convert, collect, publish):")
+    for i, buffer in enumerate(stats["buffers"]):
+        print(f"    {i}: max depth {buffer['max_depth']}/{buffer['capacity']}, "
+              f"producer blocked {buffer['full_waits']} times ({buffer['producer_wait_s'] * 1e3:.1f} ms), "
+              f"consumer starved {buffer['consumer_wait_s'] * 1e3:.1f} ms")
@@ -0,0 +1,281 @@
+"""
+suite
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+A reproducible benchmark suite for the API and SCPI paths, with the results
+stored as JSON and compared against a stored baseline.
+
+At each point count, the suite times the workflows of
+api/python/01_simple_frequency_sweep and scpi/python/01_simple_frequency_sweep
+and the processing that usually follows them:
+
+- api_sync:        `performMeasurement` on the simulated demo VNA, collected into a `SweepResult`
+- api_async:       `startMeasurement`, draining the points as they arrive into a `SweepResult`
+- scpi_ascii:      the SCPI example as written: `FORMAT ASCII`, `INIT` and eight `CALC:DATA` queries
+- scpi_binary:     `INIT` and a pipelined binary import of the S-matrix with `ScpiClient`
+- conversions:     log magnitude, phase, group delay and VSWR of all four S-parameters
+- time_domain:     a low-pass step transform of all four S-parameters
+- touchstone:      writing the sweep as a .s2p file
+
+The SCPI workflows run against the local `ScpiEmulator` with no emulated sweep
+or network time, so they measure the host-side cost of each path. The
+processing workflows use the data of the API sweep.
+
+Each case is run `--warmup` times untimed and then `--repeats` times, with the
+garbage collector run before and disabled during the timed runs. The median,
+minimum, 95th percentile and points per second are stored with the Python,
+NumPy and platform versions. A case is flagged as a regression if its median is
+more than `--tolerance` (relative) and `--min-delta-ms` (absolute) slower than
+in the baseline; the suite then exits with status 1.
+
+Running the benchmark
+--------------------
+Requires `numpy`, `pyvisa` and `pyvisa-py`, and for the API workflows the `vna`
+package and SDK libraries (see api/python/README.md).
+python3 suite.py [--points 201 2001 10001] [--paths api scpi processing] [--output results.json]
+                 [--baseline baseline.json] [--save-baseline]
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+import pyvisa
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools import conversions, time_domain
+from picovna5_tools.scpi_client import ScpiClient
+from picovna5_tools.scpi_emulator import ScpiEmulator
+from picovna5_tools.sweep_result import SweepResult
+from picovna5_tools.touchstone import write_touchstone
+
+
+POINT_COUNTS = (201, 2001, 10001)
+PATHS = ("api", "scpi", "processing")
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+FORMAT_VERSION = 1
+
+# the queries of scpi/python/01_simple_frequency_sweep, in its order
+ASCII_QUERIES = [f"CALC:DATA {p},{fmt}" for p in ("S11", "S21", "S12", "S22") for fmt in ("LOGMAG", "PHASE")]
+
+
+def time_case(function, warmup, repeats):
+    """Returns the duration of each timed call of `function`, in seconds."""
+    for _ in range(warmup):
+        function()
+    gc.collect()
+    gc.disable()
+    try:
+        durations = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            function()
+            durations.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return durations
+
+
+def summarise(durations, num_points):
+    durations = np.asarray(durations)
+    median_s = float(np.median(durations))
+    return {
+        "points": num_points,
+        "repeats": len(durations),
+        "median_ms": median_s * 1e3,
+        "min_ms": float(durations.min()) * 1e3,
+        "p95_ms": float(np.percentile(durations, 95)) * 1e3,
+        "points_per_s": num_points / median_s if median_s > 0 else None,
+    }
+
+
+#### Workflows
+###############################################################################
+
+def api_cases(num_points):
+    from vna import vna
+
+    instrument = vna.Device.openDemo()
+    info = instrument.getInfo()
+    mc = vna.MeasurementConfiguration()
+    mc.addUniformFrequencySweep(num_points, info.minSweepFrequencyHz, info.maxSweepFrequencyHz, 0, 1000)
+
+    def api_sync():
+        return SweepResult.from_points(instrument.performMeasurement(mc))
+
+    def api_async():
+        return SweepResult.from_sweep(instrument.startMeasurement(mc))
+
+    return {"api_sync": api_sync, "api_async": api_async}, api_sync()
+
+
+def scpi_cases(address, resource_manager):
+    ascii_session = resource_manager.open_resource(address)
+    ascii_session.read_termination = "\n"
+    ascii_session.write_termination = "\n"
+    ascii_session.query("FORMAT ASCII")
+    client = ScpiClient.open(address, resource_manager)
+
+    def scpi_ascii():
+        ascii_session.query("INIT")
+        return [ascii_session.query_ascii_values(query) for query in ASCII_QUERIES]
+
+    def scpi_binary():
+        client.start_sweep()
+        return client.fetch_s_matrix()
+
+    def close():
+        ascii_session.close()
+        client.close()
+
+    return {"scpi_ascii": scpi_ascii, "scpi_binary": scpi_binary}, close
+
+
+def processing_cases(result):
+    freqs, s = result.freqs, result.s
+    # a harmonic grid with the same number of points, as 03_time_domain_transform sets up
+    harmonic = freqs[0] * np.arange(1, len(freqs) + 1)
+
+    def convert():
+        # lossless synthetic networks have |S| = 1 somewhere, where the VSWR is infinite
+        with np.errstate(divide="ignore"):
+            return (conversions.logmag(s), conversions.phase_deg(s), conversions.group_delay(freqs, s),
+                    conversions.vswr(s))
+
+    def transform():
+        return time_domain.transform(harmonic, s, mode="lowpass_step", window="hanning")
+
+    def touchstone():
+        buffer = io.StringIO()
+        write_touchstone(buffer, freqs, s)
+        return buffer
+
+    return {"conversions": convert, "time_domain": transform, "touchstone": touchstone}
+
+
+def synthetic_result(num_points):
+    """The live sweep of the emulator, for the processing workflows when the API path is not run."""
+    emulator = ScpiEmulator(num_points=num_points)
+    return SweepResult(emulator.freqs, emulator.s)
+
+
+def run_suite(point_counts, paths, warmup, repeats, log=print):
+    results = {}
+
+    def record(cases, num_points):
+        for name, function in cases.items():
+            summary = summarise(time_case(function, warmup, repeats), num_points)
+            results[f"{name}/{num_points}"] = summary
+            log(f"    {name:<12} {summary['median_ms']:10.3f} ms (p95 {summary['p95_ms']:.3f} ms)")
+
+    resource_manager = pyvisa.ResourceManager("@py") if "scpi" in paths else None
+    for num_points in point_counts:
+        log(f"{num_points} points:")
+        result = None
+        if "api" in paths:
+            cases, result = api_cases(num_points)
+            record(cases, num_points)
+        if "scpi" in paths:
+            with ScpiEmulator(num_points=num_points) as server:
+                cases, close = scpi_cases(server.address, resource_manager)
+                try:
+                    record(cases, num_points)
+                finally:
+                    close()
+        if "processing" in paths:
+            record(processing_cases(result or synthetic_result(num_points)), num_points)
+    return results
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pyvisa": pyvisa.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+#### Baseline comparison
+###############################################################################
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """Returns `(case, baseline median, median, ratio, status)` for every case in both result sets.
+
+    The status is "regression" or "improvement" when the medians differ by
+    more than both `tolerance` (relative) and `min_delta_ms`, otherwise "ok".
+    """
+    rows = []
+    for case, summary in results.items():
+        reference = baseline.get(case)
+        if reference is None:
+            continue
+        before, after = reference["median_ms"], summary["median_ms"]
+        ratio = after / before if before > 0 else float("inf")
+        status = "ok"
+        if abs(after - before) > min_delta_ms:
+            if ratio > 1 + tolerance:
+                status = "regression"
+            elif ratio < 1 / (1 + tolerance):
+                status = "improvement"
+        rows.append((case, before, after, ratio, status))
+    return rows
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Benchmarks the API and SCPI paths at several point counts.")
+    parser.add_argument("--points", type=int, nargs="+", default=list(POINT_COUNTS))
+    parser.add_argument("--paths", nargs="+", choices=PATHS, default=list(PATHS))
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--repeats", type=int, default=15)
+    parser.add_argument("--output", help="JSON file to write the results to")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="stored results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="relative slow-down flagged as a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05,
+                        help="smaller differences are never flagged, however large relative to the baseline")
+    args = parser.parse_args()
+
+    results = run_suite(args.points, args.paths, args.warmup, args.repeats)
+    report = {
+        "format": FORMAT_VERSION,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": environment(),
+        "settings": {"points": args.points, "paths": args.paths, "warmup": args.warmup, "repeats": args.repeats},
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1)
+
+    regressions = 0
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["environment"] != report["environment"]:
+            print("NOTE: the baseline was recorded in a different environment.")
+        rows = compare(results, baseline["results"], args.tolerance, args.min_delta_ms)
+        print(f"Compared with {args.baseline} ({baseline['time']}):")
+        for case, before, after, ratio, status in rows:
+            flag = "" if status == "ok" else f"  <-- {status}"
+            print(f"    {case:<20} {before:10.3f} -> {after:10.3f} ms ({ratio:5.2f}x){flag}")
+        regressions = sum(status == "regression" for *_, status in rows)
+        print(f"{regressions} regressions in {len(rows)} cases")
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=1)
+        print(f"Stored the results as the baseline in {args.baseline}")
+
+    sys.exit(1 if regressions else 0)
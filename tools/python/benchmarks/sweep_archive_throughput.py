@@ -0,0 +1,93 @@
+"""
+sweep_archive_throughput
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Measures logging sweeps to a `SweepArchive`, with each compression option,
+against writing one Touchstone file per sweep.
+
+The sweeps are synthetic 2001-point sweeps with measurement noise, so no
+instrument is needed. For each option the benchmark reports sweeps appended per
+second, random reads per second, the time taken by a time-range query and the
+size on disk.
+
+Running the benchmark
+--------------------
+Requires `numpy`.
+python3 sweep_archive_throughput.py [number of sweeps]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.scpi_emulator import synthetic_network
+from picovna5_tools.sweep_archive import SweepArchive
+from picovna5_tools.touchstone import write_touchstone
+
+
+NUM_POINTS = 2001
+READS = 1000
+
+
+def directory_size(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+if __name__ == '__main__':
+
+    num_sweeps = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    rng = np.random.default_rng(0)
+    freqs = np.linspace(0.3e6, 8.5e9, NUM_POINTS)
+    base = synthetic_network(freqs)
+    sweeps = [base + 1e-3 * (rng.standard_normal(base.shape) + 1j * rng.standard_normal(base.shape))
+              for _ in range(16)]
+    start_ns = time.time_ns()
+    timestamps = start_ns + np.arange(num_sweeps) * 10_000_000   # one sweep every 10 ms
+
+    print(f"{num_sweeps} sweeps of {NUM_POINTS} points")
+    print(f"{'storage':<22} {'appends/s':>10} {'reads/s':>10} {'query ms':>9} {'MB':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        touchstone_dir = os.path.join(directory, "touchstone")
+        os.mkdir(touchstone_dir)
+        start = time.perf_counter()
+        for i in range(num_sweeps):
+            write_touchstone(os.path.join(touchstone_dir, f"sweep_{i}.s2p"), freqs, sweeps[i % len(sweeps)])
+        append_rate = num_sweeps / (time.perf_counter() - start)
+        print(f"{'Touchstone per sweep':<22} {append_rate:>10.0f} {'':>10} {'':>9} "
+              f"{directory_size(touchstone_dir) / 1e6:>8.1f}")
+
+        for compression in (None, "zlib", "lzma"):
+            path = os.path.join(directory, f"archive_{compression}")
+            with SweepArchive(path, compression=compression, level=1) as archive:
+                start = time.perf_counter()
+                for i in range(num_sweeps):
+                    archive.append(freqs, sweeps[i % len(sweeps)], int(timestamps[i]),
+                                   calibration="calibration_name.cal", serial="DEMO")
+                archive.flush()
+                append_rate = num_sweeps / (time.perf_counter() - start)
+
+            with SweepArchive(path, mode="r") as archive:
+                indices = rng.integers(0, num_sweeps, READS)
+                start = time.perf_counter()
+                for i in indices:
+                    np.abs(archive[int(i)].s[:, 1, 0]).max()
+                read_rate = READS / (time.perf_counter() - start)
+
+                # one second of sweeps from the middle of the log
+                middle = int(timestamps[num_sweeps // 2])
+                start = time.perf_counter()
+                found = archive.query(middle, middle + 1_000_000_000)
+                query_s = time.perf_counter() - start
+                if not np.array_equal(found, np.arange(num_sweeps // 2, min(num_sweeps // 2 + 100, num_sweeps))):
+                    raise Exception("ERROR: time-range query returned the wrong sweeps.")
+
+            name = f"archive ({compression or 'none'})"
+            print(f"{name:<22} {append_rate:>10.0f} {read_rate:>10.0f} {query_s * 1e3:>9.3f} "
+                  f"{directory_size(path) / 1e6:>8.1f}")
@@ -0,0 +1,73 @@
+"""
+sweep_builder_cache
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Compares the time taken to build the logarithmic sweep of
+api/python/04_log_frequency_sweep point by point in Python, with
+`sweep_builder` building it from a precomputed frequency array, and with
+a `ConfigurationCache` hit for the same sweep definition.
+
+Running the benchmark
+--------------------
+Requires `numpy` and the `vna` package and SDK libraries (see api/python/README.md).
+python3 sweep_builder_cache.py
+"""
+
+import os
+import sys
+import time
+
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.sweep_builder import ConfigurationCache, build_configuration, log_frequencies_by_ratio
+
+
+START_HZ = 0.3e6
+RATIO = 1.002
+REPEATS = 5
+
+
+def build_like_example(stop_hz):
+    mc = vna.MeasurementConfiguration()
+    measurementFrequencyHz = START_HZ
+    while measurementFrequencyHz < stop_hz:
+        pt = vna.MeasurementPoint()
+        pt.frequencyHz = measurementFrequencyHz
+        pt.powerLeveldBm = 0.0
+        pt.bandwidthHz = 10000
+        mc.addPoint(pt)
+        measurementFrequencyHz = measurementFrequencyHz * RATIO
+    if len(mc.getPoints()) > 10001:
+        raise Exception("ERROR: sweep exceeds 10,001 points in length.")
+    return mc
+
+
+def best_time(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+
+    instrument = vna.Device.openDemo()
+    stop_hz = instrument.getInfo().maxSweepFrequencyHz
+
+    cache = ConfigurationCache()
+    num_points = len(cache.logarithmic_by_ratio(START_HZ, stop_hz, RATIO, 0.0, 10000).getPoints())
+
+    example_s = best_time(lambda: build_like_example(stop_hz))
+    vector_s = best_time(lambda: build_configuration(log_frequencies_by_ratio(START_HZ, stop_hz, RATIO), 0.0, 10000))
+    cached_s = best_time(lambda: cache.logarithmic_by_ratio(START_HZ, stop_hz, RATIO, 0.0, 10000))
+
+    print(f"Logarithmic sweep, ratio {RATIO}, {num_points} points:")
+    print(f"    point-by-point loop (as in the example):   {example_s * 1e3:9.3f} ms")
+    print(f"    built from a precomputed array:            {vector_s * 1e3:9.3f} ms")
+    print(f"    cache hit:                                 {cached_s * 1e3:9.4f} ms")
+    print(f"Cache: {cache.hits} hits, {cache.misses} misses")
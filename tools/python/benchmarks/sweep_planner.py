@@ -0,0 +1,97 @@
+"""
+sweep_planner
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Calibrates a `SweepTimeModel` and a `NoiseModel` on the demo VNA, then plans
+a three-segment sweep with a different noise-floor target per segment, and
+compares it with the same segments at the 1 kHz IF bandwidth used by the
+examples, which the strictest target needs:
+
+- the predicted and measured time of each sweep,
+- for each segment of the planned sweep, the target, the noise floor
+  expected at the chosen bandwidth, and the noise floor measured from two
+  repeated sweeps.
+
+Running the benchmark
+--------------------
+Requires `numpy` and the `vna` package and SDK libraries (see api/python/README.md).
+python3 sweep_planner.py [repeats]
+"""
+
+import math
+import os
+import sys
+import time
+
+import numpy as np
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.sweep_builder import build_configuration, segmented_frequencies
+from picovna5_tools.sweep_planner import NoiseModel, SweepPlanner, SweepTimeModel
+from picovna5_tools.sweep_result import SweepResult
+
+
+FIXED_BANDWIDTH_HZ = 1000
+
+
+def timed(device, mc):
+    start = time.perf_counter()
+    device.performMeasurement(mc)
+    return time.perf_counter() - start
+
+
+def measured_floor_db(a, b):
+    rms = math.sqrt(np.mean(np.abs(a - b) ** 2) / 2)
+    return 20 * math.log10(max(rms, 1e-300))
+
+
+if __name__ == '__main__':
+
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    instrument = vna.Device.openDemo()
+    info = instrument.getInfo()
+    start_hz, stop_hz = info.minSweepFrequencyHz, info.maxSweepFrequencyHz
+
+    time_model, samples = SweepTimeModel.calibrate(instrument, start_hz, stop_hz)
+    noise_model = NoiseModel.measure(instrument, start_hz, stop_hz)
+    print(f"{time_model}, fitted to {len(samples)} sweeps:")
+    for num_points, bandwidth_hz, measured_s in samples:
+        predicted_s = time_model.predict(bandwidth_hz, num_points)
+        print(f"    {num_points:5d} points at {bandwidth_hz / 1e3:6.1f} kHz: predicted {predicted_s * 1e3:8.1f} ms, "
+              f"measured {measured_s * 1e3:8.1f} ms")
+    print(noise_model)
+
+    # a wide-band overview, a low-loss passband and a deep stopband
+    floor_1k = float(noise_model.floor_at(1000))
+    segments = [
+        (1001, start_hz, 2e9, 0.0, floor_1k + 30),
+        (2001, 2e9, 4e9, 0.0, floor_1k + 15),
+        (1001, 4e9, stop_hz, 0.0, floor_1k + 0.5),
+    ]
+    plan = SweepPlanner(time_model, noise_model).plan(segments)
+    predicted_s, measured_s = plan.compare(instrument, repeats)
+    print(f"Planned {plan.num_points}-point sweep: predicted {predicted_s * 1e3:.1f} ms, "
+          f"measured {measured_s * 1e3:.1f} ms")
+
+    mc = plan.configuration()
+    a = SweepResult.from_points(instrument.performMeasurement(mc)).s
+    b = SweepResult.from_points(instrument.performMeasurement(mc)).s
+    first = 0
+    for segment in plan.segments:
+        last = first + segment.num_points
+        floor_db = measured_floor_db(a[first:last], b[first:last])
+        print(f"    {segment.start_hz / 1e9:5.2f} to {segment.stop_hz / 1e9:5.2f} GHz at "
+              f"{segment.bandwidth_hz / 1e3:6.2f} kHz: target {segment.noise_floor_db:6.1f} dB, "
+              f"expected {segment.expected_floor_db:6.1f} dB, measured {floor_db:6.1f} dB")
+        first = last
+
+    fixed = build_configuration(*segmented_frequencies([segment[:4] + (FIXED_BANDWIDTH_HZ,)
+                                                        for segment in plan.segments]))
+    fixed_s = float(np.median([timed(instrument, fixed) for _ in range(repeats)]))
+    print(f"Same segments at {FIXED_BANDWIDTH_HZ / 1e3:g} kHz: predicted "
+          f"{time_model.predict_configuration(fixed) * 1e3:.1f} ms, measured {fixed_s * 1e3:.1f} ms "
+          f"({fixed_s / measured_s:.1f}x the planned sweep)")
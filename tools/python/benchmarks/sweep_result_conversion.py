@@ -0,0 +1,87 @@
+"""
+sweep_result_conversion
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Measures the cost of converting a 10,001-point sweep from the simulated demo
+VNA into a `SweepResult`, compared with the per-point attribute-walking loop
+used in the API examples.
+
+The attribute loop reads `pt.measurementFrequencyHz` and `pt.s11` ... `pt.s22`
+for every point and collects them into Python lists, which is the minimum
+work done by the examples before printing. `SweepResult.from_points` does the
+same attribute reads once and leaves the data as NumPy arrays, so any number of
+later operations (here: |S21| over the whole sweep) cost no further Python-level
+iteration.
+
+Running the benchmark
+--------------------
+Requires `numpy` and the `vna` package and SDK libraries (see api/python/README.md).
+python3 sweep_result_conversion.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.sweep_result import SweepResult
+
+
+NUM_POINTS = 10001
+REPEATS = 10
+
+
+def attribute_loop(points):
+    freqs, s11, s21, s12, s22 = [], [], [], [], []
+    for pt in points:
+        freqs.append(pt.measurementFrequencyHz)
+        s11.append(pt.s11)
+        s21.append(pt.s21)
+        s12.append(pt.s12)
+        s22.append(pt.s22)
+    return freqs, s11, s21, s12, s22
+
+
+def best_time(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+
+    instrument = vna.Device.openDemo()
+    info = instrument.getInfo()
+
+    mc = vna.MeasurementConfiguration()
+    mc.addUniformFrequencySweep(NUM_POINTS, info.minSweepFrequencyHz, info.maxSweepFrequencyHz, 0, 1000)
+
+    start = time.perf_counter()
+    points = instrument.performMeasurement(mc)
+    sweep_s = time.perf_counter() - start
+
+    result = SweepResult.from_points(points)
+    for i in (0, len(points) // 2, len(points) - 1):
+        pt = points[i]
+        if (result.freqs[i] != pt.measurementFrequencyHz or result.s11[i] != pt.s11 or result.s12[i] != pt.s12
+                or result.s21[i] != pt.s21 or result.s22[i] != pt.s22):
+            raise Exception("ERROR: SweepResult does not match the measured points.")
+
+    loop_s = best_time(lambda: attribute_loop(points))
+    convert_s = best_time(lambda: SweepResult.from_points(points))
+    loop_mag_s = best_time(lambda: [abs(s) for s in attribute_loop(points)[2]])
+    array_mag_s = best_time(lambda: np.abs(result.s21))
+
+    print(f"Demo sweep of {len(points)} points took {sweep_s * 1e3:.1f} ms")
+    print(f"Attribute-walking loop:        {loop_s * 1e3:8.2f} ms")
+    print(f"SweepResult.from_points:       {convert_s * 1e3:8.2f} ms")
+    print(f"|S21| from loop lists:         {loop_mag_s * 1e3:8.2f} ms (including the loop)")
+    print(f"|S21| from SweepResult view:   {array_mag_s * 1e3:8.3f} ms (after conversion)")
@@ -0,0 +1,155 @@
+"""
+time_domain_vs_vna
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Compares `time_domain.transform` with `vna.transform()` on data from the
+simulated demo VNA, using the sweep of api/python/03_time_domain_transform
+(512 harmonic points) in every mode with the Hanning window, and in low-pass
+step mode with every window. It then times both when transforming all four
+S-parameters of many sweeps with the options of that example (low-pass step,
+Hanning window).
+
+Agreement is reported as the RMS difference between the two responses,
+relative to the RMS of the `vna.transform()` response, after interpolating
+the batched result onto the time samples returned by `vna.transform()`. The
+benchmark exits with an error if any S-parameter differs by more than
+`TOLERANCE`, if `vna.transform()` returns only zeros, or if the options of a
+case cannot be set.
+
+NOTE: the examples only set `TimeDomainOptions.window` to
+`TimeDomainWindowFunction_HANNING`. The other option and enum names in
+`VNA_MODES`, `VNA_WINDOWS` and `VNA_KAISER_BETA` follow the same naming but
+are assumed; correct them here if the `vna` package names them differently.
+
+Running the benchmark
+--------------------
+Requires `numpy` and the `vna` package and SDK libraries (see api/python/README.md).
+python3 time_domain_vs_vna.py [number of sweeps]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools import time_domain
+from picovna5_tools.sweep_result import SweepResult
+
+
+NUM_POINTS = 512
+TOLERANCE = 1e-2    # relative RMS difference from vna.transform()
+KAISER_BETA = 6.0
+PARAMETERS = {
+    "S11": vna.MeasurementParameter_S11,
+    "S12": vna.MeasurementParameter_S12,
+    "S21": vna.MeasurementParameter_S21,
+    "S22": vna.MeasurementParameter_S22,
+}
+
+# TimeDomainOptions attribute and vna enum name for each setting
+VNA_MODES = {
+    "lowpass_impulse": [("mode", "TimeDomainMode_LOW_PASS"), ("response", "TimeDomainResponse_IMPULSE")],
+    "lowpass_step": [("mode", "TimeDomainMode_LOW_PASS"), ("response", "TimeDomainResponse_STEP")],
+    "bandpass_impulse": [("mode", "TimeDomainMode_BAND_PASS"), ("response", "TimeDomainResponse_IMPULSE")],
+}
+VNA_WINDOWS = {
+    "rectangular": "TimeDomainWindowFunction_RECTANGULAR",
+    "hanning": "TimeDomainWindowFunction_HANNING",
+    "kaiser": "TimeDomainWindowFunction_KAISER",
+}
+VNA_KAISER_BETA = "kaiserBeta"
+
+CASES = [
+    ("lowpass_step", "hanning"),
+    ("lowpass_impulse", "hanning"),
+    ("bandpass_impulse", "hanning"),
+    ("lowpass_step", "rectangular"),
+    ("lowpass_step", "kaiser"),
+]
+
+
+def vna_options(mode, window):
+    options = vna.TimeDomainOptions()
+    for attribute, value in VNA_MODES[mode]:
+        setattr(options, attribute, getattr(vna, value))
+    options.window = getattr(vna, VNA_WINDOWS[window])
+    if window == "kaiser":
+        setattr(options, VNA_KAISER_BETA, KAISER_BETA)
+    return options
+
+
+def compare(points, freqs, s, mode, window):
+    """Returns a list of failures, after printing the agreement of each S-parameter."""
+    try:
+        options = vna_options(mode, window)
+    except AttributeError as e:
+        print(f"    {mode}, {window}: not compared, the options cannot be set ({e})")
+        return [f"{mode}, {window} (options not set)"]
+    times, response = time_domain.transform(freqs, s, mode=mode, window=window, kaiser_beta=KAISER_BETA)
+    failures = []
+    for name, parameter in PARAMETERS.items():
+        samples = vna.transform(options, parameter, points)
+        vna_times = np.array([sample.time for sample in samples])
+        vna_values = np.array([sample.sample for sample in samples])
+        m, n = int(name[1]) - 1, int(name[2]) - 1
+        ours = response[:, m, n]
+        if not np.iscomplexobj(vna_values):
+            # a real band-pass response is taken to be the magnitude
+            ours = np.abs(ours) if np.iscomplexobj(ours) else ours
+        ours = np.interp(vna_times, times, ours)
+        rms = np.sqrt(np.mean(np.abs(vna_values) ** 2)) if len(samples) else 0.0
+        if not rms > 0:
+            print(f"    {mode}, {window}, {name}: vna.transform() returned only zeros")
+            failures.append(f"{mode}, {window}, {name} (reference all zero)")
+            continue
+        error = np.sqrt(np.mean(np.abs(ours - vna_values) ** 2)) / rms
+        print(f"    {mode}, {window}, {name}: relative RMS difference {error:.2e} over {len(samples)} samples")
+        if not error <= TOLERANCE:
+            failures.append(f"{mode}, {window}, {name} ({error:.2e})")
+    return failures
+
+
+if __name__ == '__main__':
+
+    num_sweeps = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    instrument = vna.Device.openDemo()
+    info = instrument.getInfo()
+
+    mc = vna.MeasurementConfiguration()
+    mc.addUniformFrequencySweep(NUM_POINTS, info.minSweepFrequencyHz, info.minSweepFrequencyHz * NUM_POINTS, 0, 1000)
+
+    sweeps = [instrument.performMeasurement(mc) for _ in range(num_sweeps)]
+    results = [SweepResult.from_points(points) for points in sweeps]
+    freqs = results[0].freqs
+    stack = np.stack([result.s for result in results])   # (sweeps, N, 2, 2)
+
+    print("Agreement with vna.transform() on the first sweep:")
+    failures = []
+    for mode, window in CASES:
+        failures += compare(sweeps[0], freqs, stack[0], mode, window)
+
+    if failures:
+        sys.exit(f"Disagreement with vna.transform() (tolerance {TOLERANCE:g}): {', '.join(failures)}")
+
+    options = vna.TimeDomainOptions()
+    options.window = vna.TimeDomainWindowFunction_HANNING
+
+    start = time.perf_counter()
+    for points in sweeps:
+        for parameter in PARAMETERS.values():
+            vna.transform(options, parameter, points)
+    vna_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    time_domain.transform(freqs, stack, mode="lowpass_step", window="hanning")
+    batch_s = time.perf_counter() - start
+
+    print(f"{num_sweeps} sweeps x 4 S-parameters:")
+    print(f"    vna.transform() per sweep and parameter:   {vna_s * 1e3:9.1f} ms")
+    print(f"    time_domain.transform() in one call:       {batch_s * 1e3:9.1f} ms")
@@ -0,0 +1,72 @@
+"""
+touchstone_reader_vs_skrf
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Compares reading 10,001-point .s2p files with `touchstone.read_touchstone`
+(memory-mapped, vectorised parsing) against `skrf.Network(path)`, as used in
+scpi/python/video_example_1/demo.py.
+
+The files are written to a temporary directory in each of the RI, MA and DB
+formats, with a header comment and frequencies in MHz. The benchmark checks
+that both readers return the same S-parameters, then reports files/s for each
+reader, including `touchstone.read_network`, which returns a `skrf.Network`.
+
+Running the benchmark
+--------------------
+Requires `numpy` and `scikit-rf`.
+python3 touchstone_reader_vs_skrf.py [files per format]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import skrf
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.scpi_emulator import synthetic_network
+from picovna5_tools.touchstone import DATA_FORMATS, read_network, read_touchstone, write_touchstone
+
+
+NUM_POINTS = 10001
+
+
+def files_per_second(reader, paths):
+    start = time.perf_counter()
+    for path in paths:
+        reader(path)
+    return len(paths) / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    freqs = np.linspace(0.3e6, 8.5e9, NUM_POINTS)
+    s = synthetic_network(freqs)
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{NUM_POINTS}-point .s2p files, {count} files per format (files/s)")
+        print(f"{'format':<8} {'skrf.Network':>13} {'read_touchstone':>16} {'read_network':>13}")
+        for fmt in DATA_FORMATS:
+            paths = []
+            for i in range(count):
+                path = os.path.join(directory, f"sweep_{fmt}_{i}.s2p")
+                with open(path, "w", newline="\n") as f:
+                    f.write("! synthetic sweep\n")
+                    write_touchstone(f, freqs, s, fmt=fmt, unit="MHZ")
+                paths.append(path)
+
+            ours_freqs, ours_s, _ = read_touchstone(paths[0])
+            network = skrf.Network(paths[0])
+            if not (np.allclose(ours_freqs, network.f) and np.allclose(ours_s, network.s, atol=1e-9)):
+                raise Exception(f"ERROR: read_touchstone and skrf disagree on the {fmt} file.")
+
+            skrf_rate = files_per_second(skrf.Network, paths)
+            ours_rate = files_per_second(read_touchstone, paths)
+            network_rate = files_per_second(read_network, paths)
+            print(f"{fmt:<8} {skrf_rate:>13.1f} {ours_rate:>16.1f} {network_rate:>13.1f}")
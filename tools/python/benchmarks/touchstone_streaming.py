@@ -0,0 +1,72 @@
+"""
+touchstone_streaming
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Compares exporting a sweep from the simulated demo VNA to Touchstone after the
+sweep has finished (`write_touchstone`) with writing it while the sweep is
+running (`TouchstoneStreamWriter`).
+
+For each data format the benchmark reports how long after the last point was
+received each file was complete, and checks that both files are identical.
+
+Running the benchmark
+--------------------
+Requires `numpy` and the `vna` package and SDK libraries (see api/python/README.md).
+python3 touchstone_streaming.py [output directory]
+"""
+
+import filecmp
+import os
+import sys
+import tempfile
+import time
+
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.sweep_result import SweepResult
+from picovna5_tools.touchstone import DATA_FORMATS, TouchstoneStreamWriter, write_touchstone
+
+
+NUM_POINTS = 10001
+
+
+if __name__ == '__main__':
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else tempfile.mkdtemp()
+
+    instrument = vna.Device.openDemo()
+    info = instrument.getInfo()
+
+    mc = vna.MeasurementConfiguration()
+    mc.addUniformFrequencySweep(NUM_POINTS, info.minSweepFrequencyHz, info.maxSweepFrequencyHz, 0, 1000)
+
+    print(f"{NUM_POINTS} points; time from last point received to file complete")
+    print(f"{'format':<8} {'after sweep ms':>15} {'streaming ms':>13}")
+    for fmt in DATA_FORMATS:
+        full_path = os.path.join(directory, f"full_{fmt}.s2p")
+        streamed_path = os.path.join(directory, f"streamed_{fmt}.s2p")
+
+        # write rows while the sweep is running, keeping the points for the full-array export
+        points = []
+        writer = TouchstoneStreamWriter(streamed_path, fmt=fmt)
+        sweep = instrument.startMeasurement(mc)
+        while sweep.hasMorePoints():
+            pt = sweep.getNextPoint()
+            writer.write_point(pt)
+            points.append(pt)
+        last_point = time.perf_counter()
+        writer.close()
+        streamed_s = time.perf_counter() - last_point
+
+        # export the same points once the whole sweep has been received
+        start = time.perf_counter()
+        result = SweepResult.from_points(points)
+        write_touchstone(full_path, result.freqs, result.s, fmt=fmt)
+        full_s = time.perf_counter() - start
+
+        if not filecmp.cmp(full_path, streamed_path, shallow=False):
+            raise Exception(f"ERROR: streamed {fmt} file differs from the full-array export.")
+        print(f"{fmt:<8} {full_s * 1e3:>15.2f} {streamed_s * 1e3:>13.2f}")
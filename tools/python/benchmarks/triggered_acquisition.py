@@ -0,0 +1,118 @@
+"""
+triggered_acquisition
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Measures missed triggers and trigger-to-data latency for triggered 2001-point
+sweeps of the simulated demo VNA, with a simulated trigger source firing
+every two sweep times and processing taking 1.5 sweep times, so that each
+sweep can be measured before the next trigger but not also processed:
+
+- as in api/python/05_trigger, arming each sweep only after the previous one
+  has been processed,
+- with `TriggeredAcquisition`, which keeps the next sweep armed while the
+  previous one is processed, for every trigger mode of the `vna` package.
+
+Running the benchmark
+--------------------
+Requires `numpy` and the `vna` package and SDK libraries (see api/python/README.md).
+python3 triggered_acquisition.py [triggers]
+"""
+
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+from vna import vna
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from picovna5_tools.continuous import AcquisitionStopped
+from picovna5_tools.conversions import logmag
+from picovna5_tools.sweep_result import SweepResult
+from picovna5_tools.triggered import (SimulatedTriggerSource, TriggerGatedDevice, TriggeredAcquisition,
+                                      trigger_modes)
+
+
+NUM_POINTS = 2001
+
+
+def configuration(info):
+    mc = vna.MeasurementConfiguration()
+    mc.addUniformFrequencySweep(NUM_POINTS, info.minSweepFrequencyHz, info.maxSweepFrequencyHz, 0, 1000)
+    return mc
+
+
+def make_process(host_s):
+    def process(result):
+        logmag(result.s)
+        time.sleep(host_s)
+
+    return process
+
+
+def arm_after_processing(instrument, mc, process, source):
+    """The 05_trigger approach in a loop: arm, wait for the sweep, process, then arm again."""
+    device = TriggerGatedDevice(instrument, source)
+    sweeps = 0
+    while True:
+        try:
+            result = SweepResult.from_sweep(device.startMeasurement(mc))
+        except AcquisitionStopped:
+            return sweeps
+        process(result)
+        sweeps += 1
+
+
+def finish(source, settle_s):
+    source.join()
+    time.sleep(settle_s)
+    source.close()
+
+
+if __name__ == '__main__':
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+
+    instrument = vna.Device.openDemo()
+    info = instrument.getInfo()
+
+    sweep_times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        SweepResult.from_sweep(instrument.startMeasurement(configuration(info)))
+        sweep_times.append(time.perf_counter() - start)
+    sweep_s = float(np.median(sweep_times))
+    interval_s = 2.0 * sweep_s
+    process_s = 1.5 * sweep_s
+    process = make_process(process_s)
+    print(f"{NUM_POINTS}-point demo sweep: {sweep_s * 1e3:.1f} ms; {count} triggers every {interval_s * 1e3:.1f} ms, "
+          f"processing {process_s * 1e3:.1f} ms per sweep")
+
+    source = SimulatedTriggerSource().start(interval_s, count)
+    finisher = threading.Thread(target=finish, args=(source, 3 * sweep_s))
+    finisher.start()
+    sweeps = arm_after_processing(instrument, configuration(info), process, source)
+    finisher.join()
+    print(f"    arming after processing:        {sweeps:4d} sweeps, {source.missed} triggers missed")
+
+    for mode in sorted(trigger_modes()):
+        source = SimulatedTriggerSource()
+        acquisition = TriggeredAcquisition(TriggerGatedDevice(instrument, source), configuration(info), NUM_POINTS,
+                                           lambda buffer: process(buffer.result()), trigger_mode=mode)
+        acquisition.start()
+        source.start(interval_s, count)
+        finish(source, 3 * sweep_s)
+        acquisition.stop()
+        acquisition.join()
+        stats = acquisition.stats()
+        arm, trigger, sweep = (stats[name] for name in ("start_to_first_point_s", "trigger_to_first_point_s",
+                                                        "first_to_last_point_s"))
+        print(f"    TriggeredAcquisition, {mode + ':':<12} {stats['sweeps']:4d} sweeps, "
+              f"{source.missed} triggers missed")
+        print(f"        arm to first point:     median {arm['p50'] * 1e3:8.2f} ms, p95 {arm['p95'] * 1e3:8.2f} ms")
+        print(f"        trigger to first point: median {trigger['p50'] * 1e3:8.2f} ms, "
+              f"p95 {trigger['p95'] * 1e3:8.2f} ms")
+        print(f"        first to last point:    median {sweep['p50'] * 1e3:8.2f} ms, p95 {sweep['p95'] * 1e3:8.2f} ms")
@@ -0,0 +1,13 @@
+"""
+picovna5_tools
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Reusable helpers for building high-throughput applications on top of the
+PicoVNA 5 API and SCPI interfaces.
+
+Each module is imported on its own (for example
+`from picovna5_tools.scpi_client import ScpiClient`) so that only the
+dependencies needed by that module (`vna`, `pyvisa`, `numpy`, ...) have to be
+installed.
+"""
@@ -0,0 +1,202 @@
+"""
+adaptive
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Adaptive two-pass sweeps, which measure densely only where the response
+needs it.
+
+Uniform and logarithmic sweeps (01_simple_frequency_sweep,
+04_log_frequency_sweep) spread their points evenly, so resolving a few narrow
+resonances takes thousands of points across the whole band. `AdaptiveSweep`
+first measures a coarse uniform sweep, then finds the intervals between coarse
+points that need more points:
+
+- where a trace's log magnitude departs from a straight line between its
+  neighbours by more than `curvature_db` (peaks, nulls and edges), unless
+  all three points are below `floor_db`, where the deviation is mostly noise,
+- where the group delay across an interval exceeds `group_delay_s`, so the
+  phase changes quickly between coarse points,
+- wherever an interval overlaps one of the target `bands`,
+
+widens them by `margin` intervals on each side, and measures the points of a
+uniform grid of spacing `resolution_hz` that lie inside them, using
+`MeasurementConfiguration.addPoint` (through `sweep_builder`). The two passes
+are merged into one `SweepResult` in frequency order.
+
+The time saved is estimated against a uniform sweep at `resolution_hz` over the
+whole band. The duration of each pass is modelled as a fixed time per sweep
+plus a time per point, fitted from the two passes, and the uniform sweep is
+split into sweeps of at most 10,001 points.
+"""
+
+import math
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from .conversions import logmag
+from .sweep_builder import MAX_POINTS, build_configuration, build_uniform_configuration
+from .sweep_result import S_MATRIX_INDEX, SweepResult
+
+
+# Result of `AdaptiveSweep.run()`:
+#   result            -- the merged sweep, as a SweepResult in frequency order
+#   coarse_points     -- points in the coarse pass
+#   fine_points       -- points added in the fine pass
+#   uniform_points    -- points in a uniform sweep at the fine resolution
+#   regions           -- (start_hz, stop_hz) of each refined region
+#   timing            -- coarse_s, fine_s, total_s (measured), uniform_s (estimated) and saved_s
+AdaptiveSweepResult = namedtuple("AdaptiveSweepResult", [
+    "result", "coarse_points", "fine_points", "uniform_points", "regions", "timing",
+])
+
+
+def refinement_mask(freqs, s, parameters=("S21",), curvature_db=None, group_delay_s=None, bands=(), margin=1,
+                    floor_db=None):
+    """Returns a boolean mask of the `N - 1` intervals between the points of a sweep that need more points.
+
+    `s` is the `(N, 2, 2)` S-matrix; the criteria are described in the module
+    docstring, and are applied to each S-parameter named in `parameters`.
+    """
+    freqs = np.asarray(freqs, dtype=np.float64)
+    s = np.asarray(s)
+    mask = np.zeros(max(len(freqs) - 1, 0), dtype=bool)
+    if len(mask) == 0:
+        return mask
+
+    for name in parameters:
+        m, n = S_MATRIX_INDEX[name.upper()]
+        trace = s[:, m, n]
+        if curvature_db is not None and len(freqs) >= 3:
+            db = logmag(trace)
+            # deviation of each interior point from the straight line between its neighbours
+            fraction = (freqs[1:-1] - freqs[:-2]) / (freqs[2:] - freqs[:-2])
+            deviation = np.abs(db[1:-1] - (db[:-2] + (db[2:] - db[:-2]) * fraction))
+            curved = deviation > curvature_db
+            if floor_db is not None:
+                curved &= np.maximum(np.maximum(db[:-2], db[1:-1]), db[2:]) > floor_db
+            mask[:-1] |= curved
+            mask[1:] |= curved
+        if group_delay_s is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                step = np.angle(trace[1:] / trace[:-1])
+            delay = -step / (2 * np.pi * np.diff(freqs))
+            mask |= np.abs(np.nan_to_num(delay)) > group_delay_s
+
+    for low, high in bands:
+        mask |= (freqs[1:] > low) & (freqs[:-1] < high)
+
+    if margin > 0 and mask.any():
+        widened = mask.copy()
+        for shift in range(1, margin + 1):
+            widened[shift:] |= mask[:-shift]
+            widened[:-shift] |= mask[shift:]
+        mask = widened
+    return mask
+
+
+def mask_regions(freqs, mask):
+    """Returns `(start_hz, stop_hz)` for each run of consecutive flagged intervals."""
+    flags = np.concatenate([[False], mask, [False]])
+    edges = np.flatnonzero(flags[1:] != flags[:-1])
+    return [(float(freqs[a]), float(freqs[b])) for a, b in zip(edges[0::2], edges[1::2])]
+
+
+def grid_points_in(regions, origin_hz, resolution_hz, exclude=()):
+    """Returns the points `origin_hz + k * resolution_hz` inside `regions`, leaving out those in `exclude`."""
+    indices = [np.arange(math.ceil((start - origin_hz) / resolution_hz - 1e-9),
+                         math.floor((stop - origin_hz) / resolution_hz + 1e-9) + 1) for start, stop in regions]
+    indices = np.unique(np.concatenate(indices)) if indices else np.empty(0, dtype=np.int64)
+    # excluded points that lie on the grid (to within a millionth of the resolution)
+    position = (np.asarray(exclude, dtype=np.float64) - origin_hz) / resolution_hz
+    nearest = np.rint(position)
+    on_grid = nearest[np.abs(position - nearest) < 1e-6].astype(np.int64)
+    indices = np.setdiff1d(indices, on_grid, assume_unique=False)
+    return origin_hz + indices * resolution_hz
+
+
+class AdaptiveSweep:
+    """Coarse sweep, then dense points only where needed, on `device`.
+
+    The band `start_hz` to `stop_hz` is first measured with `coarse_points`
+    uniformly spaced points. Refined regions are filled with the points of
+    the uniform grid of spacing `resolution_hz` from `start_hz`. If
+    `(coarse_points - 1)` divides the number of fine steps across the band,
+    the coarse points lie on that grid too, so the merged sweep is a subset of
+    the equivalent uniform sweep. All points use `power_dbm` and
+    `bandwidth_hz`.
+    """
+
+    def __init__(self, device, start_hz, stop_hz, resolution_hz, coarse_points=401, power_dbm=0.0,
+                 bandwidth_hz=1000.0, parameters=("S11", "S21"), curvature_db=0.5, group_delay_s=None, bands=(),
+                 margin=1, floor_db=None):
+        if resolution_hz <= 0 or stop_hz <= start_hz:
+            raise ValueError("Expected start_hz < stop_hz and a positive resolution_hz")
+        self.device = device
+        self.start_hz = start_hz
+        self.stop_hz = stop_hz
+        self.resolution_hz = resolution_hz
+        self.coarse_points = coarse_points
+        self.power_dbm = power_dbm
+        self.bandwidth_hz = bandwidth_hz
+        self.parameters = parameters
+        self.curvature_db = curvature_db
+        self.group_delay_s = group_delay_s
+        self.bands = bands
+        self.margin = margin
+        self.floor_db = floor_db
+
+    @property
+    def uniform_points(self):
+        """Points in a uniform sweep of the band at `resolution_hz`."""
+        return int(math.floor((self.stop_hz - self.start_hz) / self.resolution_hz + 1e-9)) + 1
+
+    def _measure(self, mc):
+        start = time.perf_counter()
+        points = self.device.performMeasurement(mc)
+        return SweepResult.from_points(points), time.perf_counter() - start
+
+    def run(self):
+        mc = build_uniform_configuration(self.coarse_points, self.start_hz, self.stop_hz, self.power_dbm,
+                                         self.bandwidth_hz)
+        coarse, coarse_s = self._measure(mc)
+
+        mask = refinement_mask(coarse.freqs, coarse.s, self.parameters, self.curvature_db, self.group_delay_s,
+                               self.bands, self.margin, self.floor_db)
+        regions = mask_regions(coarse.freqs, mask)
+        fine_freqs = grid_points_in(regions, self.start_hz, self.resolution_hz, exclude=coarse.freqs)
+        fine_freqs = fine_freqs[(fine_freqs >= self.start_hz) & (fine_freqs <= self.stop_hz)]
+
+        freqs, s, fine_s, fine_sweeps = [coarse.freqs], [coarse.s], 0.0, 0
+        for first in range(0, len(fine_freqs), MAX_POINTS):
+            chunk = fine_freqs[first:first + MAX_POINTS]
+            fine, elapsed_s = self._measure(build_configuration(chunk, self.power_dbm, self.bandwidth_hz))
+            freqs.append(fine.freqs)
+            s.append(fine.s)
+            fine_s += elapsed_s
+            fine_sweeps += 1
+
+        freqs = np.concatenate(freqs)
+        order = np.argsort(freqs, kind="stable")
+        result = SweepResult(freqs[order], np.concatenate(s)[order])
+
+        uniform_s = self.estimate_uniform_s(len(coarse), coarse_s, len(fine_freqs), fine_s, fine_sweeps)
+        total_s = coarse_s + fine_s
+        timing = {"coarse_s": coarse_s, "fine_s": fine_s, "total_s": total_s, "uniform_s": uniform_s,
+                  "saved_s": uniform_s - total_s}
+        return AdaptiveSweepResult(result, len(coarse), len(fine_freqs), self.uniform_points, regions, timing)
+
+    def estimate_uniform_s(self, coarse_points, coarse_s, fine_points, fine_s, fine_sweeps):
+        """Estimates the time of a uniform sweep at `resolution_hz` from the times of the two passes."""
+        if fine_sweeps == 1 and fine_points != coarse_points:
+            # fit coarse_s = per_sweep + per_point * coarse_points and the same for the fine pass
+            per_point = (fine_s - coarse_s) / (fine_points - coarse_points)
+            per_sweep = coarse_s - per_point * coarse_points
+            if per_point <= 0 or per_sweep < 0:
+                per_sweep, per_point = 0.0, (coarse_s + fine_s) / (coarse_points + fine_points)
+        else:
+            per_sweep, per_point = 0.0, (coarse_s + fine_s) / (coarse_points + fine_points)
+        uniform_points = self.uniform_points
+        return math.ceil(uniform_points / MAX_POINTS) * per_sweep + uniform_points * per_point
@@ -0,0 +1,126 @@
+"""
+aio
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+An asyncio adapter for `vna.Device`.
+
+`performMeasurement()` and `sweep.getNextPoint()` block, so calling them from a
+coroutine stalls every other task on the event loop. `AsyncDevice` runs all
+calls to one device on a single worker thread owned by that device, and hands
+points back to the event loop as they arrive:
+
+    device = await AsyncDevice.open(vna.Device.openDemo)
+    points = await device.measure(mc)
+    async for pt in device.stream(mc):
+        ...
+
+A whole sweep is drained by one call on the worker thread, rather than one
+executor call per point. Leaving `stream()` early (break, exception or task
+cancellation) abandons the sweep: the worker discards the remaining points so
+that the device is idle again before the next call on it runs.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+_END = object()
+
+
+class _Failure:
+    def __init__(self, error):
+        self.error = error
+
+
+class AsyncDevice:
+    """Wraps an open `vna.Device` for use from asyncio code.
+
+    All blocking SDK calls for this device run, one at a time and in order, on
+    `executor` (by default a private single-thread executor).
+    """
+
+    def __init__(self, device, executor=None):
+        self.device = device
+        self._owns_executor = executor is None
+        self._executor = executor if executor is not None else ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="vna-device"
+        )
+
+    @classmethod
+    async def open(cls, opener, *args):
+        """Opens a device without blocking the event loop, e.g. `await AsyncDevice.open(vna.Device.openDemo)`."""
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vna-device")
+        try:
+            device = await asyncio.get_running_loop().run_in_executor(executor, opener, *args)
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+        instance = cls(device, executor)
+        instance._owns_executor = True
+        return instance
+
+    async def close(self):
+        """Waits for outstanding work on the device (including abandoned sweeps) to finish."""
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def call(self, fn, *args):
+        """Runs any blocking call on the device's worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def get_info(self):
+        return await self.call(self.device.getInfo)
+
+    async def measure(self, mc):
+        """Runs `performMeasurement(mc)` to completion and returns the points."""
+        return await self.call(self.device.performMeasurement, mc)
+
+    async def stream(self, mc):
+        """Starts an asynchronous sweep and yields each point as soon as the device returns it.
+
+        To abandon the sweep promptly when breaking out of the loop, close the
+        generator explicitly (for example with `contextlib.aclosing()`);
+        otherwise it is abandoned when the generator is garbage collected.
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        abandoned = threading.Event()
+
+        def deliver(item):
+            if abandoned.is_set():
+                return
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # the event loop has been closed
+                abandoned.set()
+
+        def drain():
+            try:
+                sweep = self.device.startMeasurement(mc)
+                while sweep.hasMorePoints():
+                    deliver(sweep.getNextPoint())
+            except Exception as e:
+                deliver(_Failure(e))
+            else:
+                deliver(_END)
+
+        loop.run_in_executor(self._executor, drain)
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+        finally:
+            abandoned.set()
@@ -0,0 +1,370 @@
+"""
+broadcast
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+A receiver for binary data broadcasts of sweep data over UDP, and a replay
+sender to drive it without an instrument.
+
+NOTE: the wire format of the PicoVNA 5 binary data broadcasts is described in
+the PicoVNA 5 User Manual, not in this repository. The frame layout below is
+an assumed format with the information such a stream must carry; it is
+defined in one place (`HEADER`, `POINT_DTYPE`) so that it can be matched to
+the format given in the manual.
+
+Each UDP datagram is one frame: a 40-byte little-endian header followed by a
+block of points.
+
+    offset  type     field
+    0       4 bytes  magic, b"PVB5"
+    4       uint16   format version (1)
+    6       uint16   header size in bytes (40)
+    8       uint32   frame sequence number, incremented for every frame sent
+    12      uint32   sweep number
+    16      uint32   index of the first point of this frame in the sweep
+    20      uint32   number of points in this frame
+    24      uint32   number of points in the sweep
+    28      uint32   flags (reserved)
+    32      uint64   send time, `time.time_ns()` of the sender
+    40      points   per point: frequency (float64, Hz), then S11, S21, S12, S22
+                     (each complex128: real, imaginary float64)
+
+Frames are received with `recv_into` into one reusable `bytearray`. The points
+of each frame are read as a structured NumPy view of that buffer (no copy)
+and copied into the sweep with one slice assignment per field, so no Python
+code runs per point. `SweepAssembler` places each frame at its point index, so
+frames of a sweep may arrive in any order. Gaps in the sequence numbers count
+as dropped frames; a missing frame that arrives later (within
+`REORDER_WINDOW` frames) counts as out of order instead, and any other frame
+with an earlier sequence number as a duplicate. A sweep that is superseded by
+a newer one before all its points have arrived is counted as incomplete and
+discarded. Frames that cannot be parsed count as invalid, and frames of a
+sweep larger than the receiver's `max_points`, or whose sweep size differs
+from that of earlier frames of the same sweep, as rejected; neither stops the
+receiver.
+"""
+
+import socket
+import struct
+import threading
+import time
+
+import numpy as np
+
+from .continuous import SweepBuffer
+from .instrumentation import DURATION_BOUNDS_S, Histogram
+
+
+DEFAULT_PORT = 5030
+MAGIC = b"PVB5"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIIIIIQ")
+POINT_DTYPE = np.dtype([("freq", "<f8"), ("s11", "<c16"), ("s21", "<c16"), ("s12", "<c16"), ("s22", "<c16")])
+MAX_DATAGRAM = 65507
+MAX_POINTS_PER_FRAME = (MAX_DATAGRAM - HEADER.size) // POINT_DTYPE.itemsize
+SEQUENCE_MODULUS = 1 << 32
+# how many frames behind the newest a missing frame may arrive and still be counted as out of order
+REORDER_WINDOW = 4096
+
+# field of POINT_DTYPE -> index into the flattened (2, 2) S-matrix
+S_FIELDS = (("s11", 0), ("s12", 1), ("s21", 2), ("s22", 3))
+
+
+class FrameError(Exception):
+    """Raised for a datagram that is not a valid frame."""
+
+
+def parse_frame(view):
+    """Returns the header fields and a structured view of the points of one frame.
+
+    `view` is a `memoryview` (or bytes-like object) holding exactly one frame.
+    The points are a view into `view`, so they are only valid until the
+    buffer is reused.
+    """
+    if len(view) < HEADER.size:
+        raise FrameError(f"Frame of {len(view)} bytes is shorter than the header")
+    (magic, version, header_size, sequence, sweep, first_point, num_points, sweep_points, _flags,
+     send_time_ns) = HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise FrameError(f"Not a version {VERSION} frame")
+    if header_size + num_points * POINT_DTYPE.itemsize != len(view):
+        raise FrameError(f"Frame of {len(view)} bytes does not hold {num_points} points")
+    if first_point + num_points > sweep_points:
+        raise FrameError(f"Points {first_point} to {first_point + num_points} are outside a sweep of "
+                         f"{sweep_points} points")
+    points = np.frombuffer(view, dtype=POINT_DTYPE, count=num_points, offset=header_size)
+    return (sequence, sweep, first_point, sweep_points, send_time_ns), points
+
+
+class SweepAssembler:
+    """Reassembles whole sweeps from frames, calling `on_sweep(buffer)` for each complete sweep.
+
+    `max_points` is the largest sweep expected. The `SweepBuffer` passed to
+    `on_sweep` is reused for the next sweep, so it is only valid until
+    `on_sweep` returns; `buffer.sequence` is the sweep number and
+    `buffer.timestamp_ns` the `time.perf_counter_ns()` at which it completed.
+    """
+
+    def __init__(self, max_points, on_sweep=None):
+        self.on_sweep = on_sweep
+        self.buffer = SweepBuffer(0, max_points)
+        self._s_flat = self.buffer.s.reshape(-1, 4)
+        self._received = np.zeros(max_points, dtype=bool)
+        self._sweep = None
+        self._sweep_points = 0
+        self._points = 0
+        self._expected_sequence = None
+        self._missing = set()
+
+        self.frames = 0
+        self.sweeps = 0
+        self.dropped_frames = 0
+        self.out_of_order_frames = 0
+        self.duplicate_frames = 0
+        self.duplicate_points = 0
+        self.late_frames = 0
+        self.incomplete_sweeps = 0
+        self.invalid_frames = 0
+        self.rejected_frames = 0
+        self.last_send_time_ns = 0
+
+    def _check_sequence(self, sequence):
+        expected = self._expected_sequence
+        if expected is None or sequence == expected:
+            self._expected_sequence = (sequence + 1) % SEQUENCE_MODULUS
+            return
+        gap = (sequence - expected) % SEQUENCE_MODULUS
+        if gap < SEQUENCE_MODULUS // 2:
+            # frames expected..sequence-1 are missing, for now; only the latest REORDER_WINDOW are remembered
+            self.dropped_frames += gap
+            self._expected_sequence = (sequence + 1) % SEQUENCE_MODULUS
+            missing = self._missing
+            missing.update(n % SEQUENCE_MODULUS for n in range(sequence - min(gap, REORDER_WINDOW), sequence))
+            if len(missing) > REORDER_WINDOW:
+                newest = self._expected_sequence
+                missing.difference_update([n for n in missing if (newest - n) % SEQUENCE_MODULUS > REORDER_WINDOW])
+        elif sequence in self._missing:
+            # an earlier frame that was counted as missing has arrived after all
+            self._missing.remove(sequence)
+            self.out_of_order_frames += 1
+            self.dropped_frames -= 1
+        else:
+            # a frame that was already received (or is too old to tell), sent again
+            self.duplicate_frames += 1
+
+    def _begin(self, sweep, sweep_points):
+        if self._sweep is not None and self._points < self._sweep_points:
+            self.incomplete_sweeps += 1
+        self._sweep = sweep
+        self._sweep_points = sweep_points
+        self._points = 0
+        self._received[:sweep_points] = False
+
+    def feed(self, view):
+        """Processes one frame. Returns True if it completed a sweep."""
+        try:
+            (sequence, sweep, first, sweep_points, send_time_ns), points = parse_frame(view)
+        except FrameError:
+            self.invalid_frames += 1
+            return False
+        self.frames += 1
+        self._check_sequence(sequence)
+        self.last_send_time_ns = send_time_ns
+
+        if sweep != self._sweep:
+            if self._sweep is not None and (sweep - self._sweep) % SEQUENCE_MODULUS >= SEQUENCE_MODULUS // 2:
+                # a frame of a sweep that has already been completed or abandoned
+                self.late_frames += 1
+                return False
+            if sweep_points > self.buffer.capacity:
+                self.rejected_frames += 1
+                return False
+            self._begin(sweep, sweep_points)
+        elif sweep_points != self._sweep_points:
+            # the point count changed within a sweep
+            self.rejected_frames += 1
+            return False
+        elif self._points >= self._sweep_points:
+            self.late_frames += 1
+            return False
+
+        end = first + len(points)
+        received = self._received[first:end]
+        duplicates = int(np.count_nonzero(received))
+        received[:] = True
+        self.duplicate_points += duplicates
+        self._points += len(points) - duplicates
+
+        buffer = self.buffer
+        buffer.freqs[first:end] = points["freq"]
+        s = self._s_flat[first:end]
+        for field, column in S_FIELDS:
+            s[:, column] = points[field]
+
+        if self._points < self._sweep_points:
+            return False
+        buffer.count = self._sweep_points
+        buffer.sequence = sweep
+        buffer.timestamp_ns = time.perf_counter_ns()
+        self.sweeps += 1
+        if self.on_sweep is not None:
+            self.on_sweep(buffer)
+        return True
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "sweeps": self.sweeps,
+            "dropped_frames": self.dropped_frames,
+            "out_of_order_frames": self.out_of_order_frames,
+            "duplicate_frames": self.duplicate_frames,
+            "late_frames": self.late_frames,
+            "duplicate_points": self.duplicate_points,
+            "incomplete_sweeps": self.incomplete_sweeps,
+            "invalid_frames": self.invalid_frames,
+            "rejected_frames": self.rejected_frames,
+        }
+
+
+class BroadcastReceiver:
+    """Receives broadcast frames on a UDP port and reassembles them into sweeps.
+
+    `on_sweep` is called on the receiving thread for each complete sweep (see
+    `SweepAssembler`). `port=0` picks a free port; `address` gives the bound
+    `(host, port)`. The socket receive buffer is enlarged to `rcvbuf_bytes`
+    so that bursts of frames are not lost while a sweep is being processed.
+    """
+
+    def __init__(self, port=DEFAULT_PORT, host="", max_points=10001, on_sweep=None, rcvbuf_bytes=8 << 20,
+                 timeout_s=0.2):
+        self.assembler = SweepAssembler(max_points, on_sweep)
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf_bytes)
+        self.socket.bind((host, port))
+        self.socket.settimeout(timeout_s)
+        self.address = self.socket.getsockname()
+        self.parse_latency = Histogram(DURATION_BOUNDS_S)
+        self._buffer = bytearray(MAX_DATAGRAM)
+        self._view = memoryview(self._buffer)
+        self._stopping = False
+        self._thread = None
+        self.error = None
+
+    def receive(self):
+        """Receives and processes one frame. Returns False if none arrived before the timeout."""
+        try:
+            size = self.socket.recv_into(self._buffer)
+        except socket.timeout:
+            return False
+        start = time.perf_counter_ns()
+        self.assembler.feed(self._view[:size])
+        self.parse_latency.observe((time.perf_counter_ns() - start) * 1e-9)
+        return True
+
+    def _run(self):
+        try:
+            while not self._stopping:
+                self.receive()
+        except Exception as e:
+            self.error = e
+
+    def start(self):
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="broadcast-receiver", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the receiving thread (within `timeout_s`) and re-raises any error from it."""
+        self._stopping = True
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        self.stop()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def stats(self):
+        return dict(self.assembler.stats(), parse_latency=self.parse_latency.snapshot())
+
+
+#### Replay sender
+###############################################################################
+
+class ReplaySender:
+    """Sends sweeps as broadcast frames, for testing and benchmarking receivers without an instrument.
+
+    Frames are sent to `address`, by default the local host; use
+    `("255.255.255.255", port)` with `broadcast=True` to broadcast on the local
+    network.
+    """
+
+    def __init__(self, address=("127.0.0.1", DEFAULT_PORT), points_per_frame=256, broadcast=False):
+        if not 0 < points_per_frame <= MAX_POINTS_PER_FRAME:
+            raise ValueError(f"points_per_frame must be between 1 and {MAX_POINTS_PER_FRAME}")
+        self.address = address
+        self.points_per_frame = points_per_frame
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if broadcast:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        self.sequence = 0
+        self.sweeps = 0
+        self.frames = 0
+
+    def encode_sweep(self, freqs, s):
+        """Encodes a sweep (`(N,)` frequencies, `(N, 2, 2)` S-parameters) as a list of frames.
+
+        The sequence number, sweep number and send time of each frame are set
+        when it is sent, so the frames can be sent any number of times.
+        """
+        freqs = np.asarray(freqs, dtype=np.float64)
+        s = np.asarray(s, dtype=np.complex128).reshape(-1, 4)
+        num_points = len(freqs)
+        frames = []
+        for first in range(0, num_points, self.points_per_frame):
+            count = min(self.points_per_frame, num_points - first)
+            frame = bytearray(HEADER.size + count * POINT_DTYPE.itemsize)
+            HEADER.pack_into(frame, 0, MAGIC, VERSION, HEADER.size, 0, 0, first, count, num_points, 0, 0)
+            points = np.frombuffer(frame, dtype=POINT_DTYPE, count=count, offset=HEADER.size)
+            points["freq"] = freqs[first:first + count]
+            for field, column in S_FIELDS:
+                points[field] = s[first:first + count, column]
+            frames.append(frame)
+        return frames
+
+    def send_sweep(self, frames, order=None):
+        """Sends the frames of one encoded sweep.
+
+        Sequence numbers follow the order of `frames`; `order` lists the
+        indices of the frames to send, in the order to send them, so that lost
+        (left out) and reordered frames can be simulated.
+        """
+        base = self.sequence
+        sweep = self.sweeps
+        for i in (range(len(frames)) if order is None else order):
+            frame = frames[i]
+            struct.pack_into("<II", frame, 8, (base + i) % SEQUENCE_MODULUS, sweep % SEQUENCE_MODULUS)
+            struct.pack_into("<Q", frame, 32, time.time_ns())
+            self.socket.sendto(frame, self.address)
+            self.frames += 1
+        self.sequence = (base + len(frames)) % SEQUENCE_MODULUS
+        self.sweeps += 1
+
+    def close(self):
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
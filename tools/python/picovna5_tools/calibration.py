@@ -0,0 +1,213 @@
+"""
+calibration
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Indexes a directory of PicoVNA 5 calibration (.cal) files so that the best
+calibration for a sweep can be chosen without applying every candidate.
+
+The API only reports calibration settings for the calibration that is
+currently applied (`getMetadataForCurrentCalibration()`). `CalibrationIndex`
+therefore reads each file's metadata once, when the file is first seen or has
+changed, and keeps it in a persistent JSON index together with the file's size,
+modification time and SHA-256 hash. Later scans only re-read new or changed
+files, and `select()` works from the index alone.
+
+`CalibrationManager` ties an index to an open device, and skips
+`applyCalibrationFromFile()` when the selected calibration is already active.
+"""
+
+import hashlib
+import json
+import math
+import os
+from collections import namedtuple
+
+
+INDEX_VERSION = 1
+
+CalibrationEntry = namedtuple("CalibrationEntry", [
+    "path", "size", "mtime_ns", "sha256",
+    "start_hz", "stop_hz", "num_points", "power_dbm", "bandwidth_hz",
+])
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def device_metadata_reader(device, on_applied=None):
+    """Returns a metadata reader that applies each calibration to `device` and reads back its settings.
+
+    `on_applied(path)`, if given, is called as soon as each calibration has
+    been applied, before its metadata is read.
+    """
+
+    def read_metadata(path):
+        device.applyCalibrationFromFile(path)
+        if on_applied is not None:
+            on_applied(path)
+        info = device.getMetadataForCurrentCalibration()
+        return {
+            "start_hz": float(info.startFreqHz),
+            "stop_hz": float(info.stopFreqHz),
+            "num_points": int(info.numPoints),
+            "power_dbm": float(info.powerLevelDbm),
+            "bandwidth_hz": float(info.bandwidthHz),
+        }
+
+    return read_metadata
+
+
+class CalibrationIndex:
+    """Persistent index of the calibration files in `directory`.
+
+    The index is stored as JSON in `index_path` (by default `.cal_index.json`
+    in the calibration directory).
+    """
+
+    def __init__(self, directory, index_path=None):
+        self.directory = os.path.abspath(directory)
+        self.index_path = index_path or os.path.join(self.directory, ".cal_index.json")
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.index_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == INDEX_VERSION:
+            self.entries = {e["path"]: CalibrationEntry(**e) for e in data["entries"]}
+
+    def save(self):
+        data = {"version": INDEX_VERSION, "entries": [e._asdict() for e in self.entries.values()]}
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def scan(self, read_metadata):
+        """Brings the index up to date with the calibration directory.
+
+        `read_metadata(path)` is called only for files that are new or whose
+        contents have changed, and must return a dict with `start_hz`,
+        `stop_hz`, `num_points`, `power_dbm` and `bandwidth_hz` (see
+        `device_metadata_reader`). Returns the paths that were read.
+        """
+        read = []
+        entries = {}
+        for root, _, files in os.walk(self.directory):
+            for name in sorted(files):
+                if not name.lower().endswith(".cal"):
+                    continue
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                old = self.entries.get(path)
+                if old is not None and old.size == stat.st_size and old.mtime_ns == stat.st_mtime_ns:
+                    entries[path] = old
+                    continue
+                sha256 = file_sha256(path)
+                if old is not None and old.sha256 == sha256:
+                    entries[path] = old._replace(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                    continue
+                entries[path] = CalibrationEntry(
+                    path=path, size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=sha256, **read_metadata(path)
+                )
+                read.append(path)
+        self.entries = entries
+        self.save()
+        return read
+
+    def select(self, start_hz, stop_hz, num_points, power_dbm=None, bandwidth_hz=None):
+        """Returns the calibration that best matches a uniform sweep, using only the index.
+
+        Only calibrations whose frequency range covers the sweep are
+        considered. An exact match of frequency grid, power and bandwidth is
+        preferred (no interpolation is needed); otherwise the calibration
+        whose point spacing is closest to the sweep's is chosen, then the one
+        with the closest power level and bandwidth. Raises `LookupError` if no
+        calibration covers the sweep, and `ValueError` if `bandwidth_hz` is
+        not positive.
+        """
+        if bandwidth_hz is not None and not bandwidth_hz > 0:
+            raise ValueError(f"bandwidth_hz must be positive, not {bandwidth_hz}")
+        spacing = (stop_hz - start_hz) / max(num_points - 1, 1)
+
+        def score(e):
+            exact_grid = e.start_hz == start_hz and e.stop_hz == stop_hz and e.num_points == num_points
+            cal_spacing = (e.stop_hz - e.start_hz) / max(e.num_points - 1, 1)
+            if spacing <= 0:
+                # a single-frequency sweep: every covering calibration has a point there or interpolates to it
+                spacing_error = 0.0
+            elif cal_spacing <= 0:
+                spacing_error = math.inf
+            else:
+                spacing_error = abs(math.log(cal_spacing / spacing))
+            power_error = 0.0 if power_dbm is None else abs(e.power_dbm - power_dbm)
+            if bandwidth_hz is None:
+                bandwidth_error = 0.0
+            elif e.bandwidth_hz > 0:
+                bandwidth_error = abs(math.log(e.bandwidth_hz / bandwidth_hz))
+            else:
+                bandwidth_error = math.inf
+            return (not exact_grid, spacing_error, power_error, bandwidth_error, e.path)
+
+        candidates = [e for e in self.entries.values() if e.start_hz <= start_hz and e.stop_hz >= stop_hz]
+        if not candidates:
+            raise LookupError(f"No calibration covers {start_hz} Hz to {stop_hz} Hz.")
+        return min(candidates, key=score)
+
+
+class CalibrationManager:
+    """Applies calibrations from an index to one device, skipping calibrations that are already active.
+
+    The manager assumes that it is the only code applying calibrations to the
+    device; call `invalidate()` if a calibration is applied by other means.
+    """
+
+    def __init__(self, device, index):
+        self.device = device
+        self.index = index
+        self.active_sha256 = None
+
+    def scan(self):
+        """Updates the index, applying new or changed calibrations to this device to read their metadata.
+
+        The active calibration is only forgotten when a file is about to be
+        applied, and is tracked as each file is applied, so it stays correct
+        if the scan applies nothing or reading a file fails partway through.
+        """
+        def applied(path):
+            self.active_sha256 = file_sha256(path)
+
+        reader = device_metadata_reader(self.device, applied)
+
+        def read_metadata(path):
+            # until this file has been applied, the device's calibration is unknown
+            self.invalidate()
+            return reader(path)
+
+        return self.index.scan(read_metadata)
+
+    def invalidate(self):
+        self.active_sha256 = None
+
+    def apply(self, entry):
+        """Applies `entry` unless it is already active. Returns True if it was applied."""
+        if entry.sha256 == self.active_sha256:
+            return False
+        self.device.applyCalibrationFromFile(entry.path)
+        self.active_sha256 = entry.sha256
+        return True
+
+    def use_for_sweep(self, start_hz, stop_hz, num_points, power_dbm=None, bandwidth_hz=None):
+        """Selects and applies the best calibration for a uniform sweep, returning its index entry."""
+        entry = self.index.select(start_hz, stop_hz, num_points, power_dbm, bandwidth_hz)
+        self.apply(entry)
+        return entry
@@ -0,0 +1,240 @@
+"""
+cascade
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Batched cascading of two-port networks, for emulating circuits such as the
+attenuator -- coaxial line -- band-pass filter chain of
+scpi/python/video_example_1/demo.py across many measured networks at once.
+
+Networks are `(..., N, 2, 2)` S-parameter arrays on a common frequency grid,
+with any number of leading batch axes. Each network is converted to transfer
+(T) parameters, the chain is multiplied with broadcasting over the batch axes,
+and the product is converted back to S-parameters. The 2x2 products are
+written out element by element, which for large stacks of 2x2 matrices is
+several times faster than `np.matmul` or `np.einsum`.
+
+Cascading a stack of 100 attenuators with a stack of 50 filters, for example,
+gives all 5000 combinations in one call if the stacks are given shapes
+`(100, 1, N, 2, 2)` and `(1, 50, N, 2, 2)`.
+
+T-parameters are defined here by [a1, b1] = T [b2, a2], so that the T matrix of
+a cascade is the product of the T matrices of its networks in order. They
+are undefined for networks with S21 = 0 at any frequency.
+
+`coaxial_line` is an analytic model of the `skrf.media.Coaxial` line used in
+demo.py, and `CascadeEngine` caches the T-parameters of fixed elements such as
+this line so that only the measured networks are converted for each batch.
+"""
+
+import collections
+import threading
+
+import numpy as np
+
+
+MU_0 = 1.25663706212e-6
+EPSILON_0 = 8.8541878128e-12
+COPPER_CONDUCTIVITY = 58e6
+
+
+def s_to_t(s, out=None):
+    """Converts `(..., 2, 2)` S-parameters to T-parameters."""
+    s = np.asarray(s)
+    s11, s12, s21, s22 = s[..., 0, 0], s[..., 0, 1], s[..., 1, 0], s[..., 1, 1]
+    if out is None:
+        out = np.empty(s.shape, dtype=np.result_type(s.dtype, np.complex128))
+    inv_s21 = 1.0 / s21
+    out[..., 0, 0] = (s12 * s21 - s11 * s22) * inv_s21
+    out[..., 0, 1] = s11 * inv_s21
+    out[..., 1, 0] = -s22 * inv_s21
+    out[..., 1, 1] = inv_s21
+    return out
+
+
+def t_to_s(t, out=None):
+    """Converts `(..., 2, 2)` T-parameters to S-parameters."""
+    t = np.asarray(t)
+    t11, t12, t21, t22 = t[..., 0, 0], t[..., 0, 1], t[..., 1, 0], t[..., 1, 1]
+    if out is None:
+        out = np.empty(t.shape, dtype=np.result_type(t.dtype, np.complex128))
+    inv_t22 = 1.0 / t22
+    # compute the determinant before writing, in case `out` is `t`
+    det = t11 * t22 - t12 * t21
+    out[..., 0, 0] = t12 * inv_t22
+    out[..., 0, 1] = det * inv_t22
+    out[..., 1, 0] = inv_t22
+    out[..., 1, 1] = -t21 * inv_t22
+    return out
+
+
+def matmul_2x2(a, b):
+    """Returns `a @ b` for `(..., 2, 2)` arrays, broadcasting over the leading axes."""
+    a11, a12, a21, a22 = a[..., 0, 0], a[..., 0, 1], a[..., 1, 0], a[..., 1, 1]
+    b11, b12, b21, b22 = b[..., 0, 0], b[..., 0, 1], b[..., 1, 0], b[..., 1, 1]
+    out = np.empty(np.broadcast_shapes(a.shape, b.shape), dtype=np.result_type(a.dtype, b.dtype))
+    out[..., 0, 0] = a11 * b11 + a12 * b21
+    out[..., 0, 1] = a11 * b12 + a12 * b22
+    out[..., 1, 0] = a21 * b11 + a22 * b21
+    out[..., 1, 1] = a21 * b12 + a22 * b22
+    return out
+
+
+def cascade_t(*t):
+    """Multiplies a chain of T-parameter arrays, broadcasting over the batch axes."""
+    result = t[0]
+    for other in t[1:]:
+        result = matmul_2x2(result, other)
+    return result
+
+
+def cascade(*networks):
+    """Cascades S-parameter arrays in order, as `skrf`'s `a ** b ** c` does."""
+    return t_to_s(cascade_t(*[s_to_t(s) for s in networks]))
+
+
+def line_s(gamma_length, zc, z0_port=50.0):
+    """Returns the `(N, 2, 2)` S-parameters of a transmission line.
+
+    `gamma_length` is the propagation constant times the length of the line,
+    and `zc` its characteristic impedance, between ports of impedance `z0_port`.
+    """
+    delay = np.exp(-np.asarray(gamma_length, dtype=np.complex128))
+    gamma = (zc - z0_port) / (zc + z0_port) * np.ones_like(delay)
+    denominator = 1.0 - gamma * gamma * delay * delay
+    s = np.empty((len(delay), 2, 2), dtype=np.complex128)
+    s[:, 0, 0] = s[:, 1, 1] = gamma * (1.0 - delay * delay) / denominator
+    s[:, 0, 1] = s[:, 1, 0] = delay * (1.0 - gamma * gamma) / denominator
+    return s
+
+
+def coaxial_propagation(freqs, Dint, Dout, epsilon_r=1.0, tan_delta=0.0, sigma=COPPER_CONDUCTIVITY):
+    """Returns the propagation constant and characteristic impedance of a coaxial line.
+
+    The parameters are those of `skrf.media.Coaxial`. Conductor loss uses the
+    skin-effect surface impedance with a first-order correction for the
+    curvature of each conductor, which is the large-argument expansion of the
+    Bessel-function (Schelkunoff) model used by scikit-rf.
+    """
+    freqs = np.asarray(freqs, dtype=np.float64)
+    w = 2 * np.pi * freqs
+    a, b = Dint / 2.0, Dout / 2.0
+    log_ratio = np.log(b / a)
+
+    epsilon = EPSILON_0 * epsilon_r
+    capacitance = 2 * np.pi * epsilon / log_ratio
+    conductance = 2 * np.pi * w * epsilon * tan_delta / log_ratio
+    inductance = MU_0 / (2 * np.pi) * log_ratio
+
+    conductor = np.zeros_like(w, dtype=np.complex128)
+    if np.isfinite(sigma):
+        g = np.sqrt(1j * w * MU_0 * sigma)              # propagation constant inside the metal
+        zs = g / sigma                                   # surface impedance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inner = zs / (2 * np.pi * a) * (1 + 1 / (2 * g * a))
+            outer = zs / (2 * np.pi * b) * (1 - 1 / (2 * g * b))
+        conductor = np.where(freqs > 0, inner + outer, 0.0)
+
+    z = conductor + 1j * w * inductance
+    y = conductance + 1j * w * capacitance
+    gamma = np.sqrt(z * y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zc = np.where(freqs > 0, np.sqrt(z / y), np.sqrt(inductance / capacitance))
+    return gamma, zc
+
+
+def coaxial_line(freqs, length_m, Dint, Dout, epsilon_r=1.0, tan_delta=0.0, sigma=COPPER_CONDUCTIVITY,
+                 z0=None, z0_port=50.0):
+    """Returns the `(N, 2, 2)` S-parameters of a length of coaxial line.
+
+    Matches `Coaxial(frequency, Dint=..., Dout=..., epsilon_r=..., z0_port=z0_port).line(length, 'm', z0=z0)`:
+    if `z0` is given, the line is given that characteristic impedance (demo.py
+    uses `z0=50`, giving a matched line); otherwise the impedance of the
+    coaxial geometry is used.
+    """
+    gamma, zc = coaxial_propagation(freqs, Dint, Dout, epsilon_r, tan_delta, sigma)
+    return line_s(gamma * length_m, zc if z0 is None else z0, z0_port)
+
+
+class CascadeEngine:
+    """Cascades batches of measured networks with cached fixed elements.
+
+    Fixed elements are registered by name with `add_element` or
+    `add_coaxial_line`, which convert them to T-parameters once. `run` takes a
+    chain of element names and `(..., N, 2, 2)` arrays, converts only the
+    arrays, and returns the cascaded S-parameters. Elements and conversions
+    are held in an LRU cache of `maxsize` entries; `hits` and `misses` count
+    lookups.
+    """
+
+    def __init__(self, freqs, maxsize=64):
+        self.freqs = np.asarray(freqs, dtype=np.float64)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._names = {}
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get_or_build(self, key, build):
+        with self._lock:
+            t = self._entries.get(key)
+            if t is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return t
+            self.misses += 1
+        t = build()
+        t.setflags(write=False)
+        with self._lock:
+            self._entries[key] = t
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return t
+
+    def _check_grid(self, s):
+        if s.shape[-3:] != (len(self.freqs), 2, 2):
+            raise ValueError(f"Expected S-parameters of shape (..., {len(self.freqs)}, 2, 2), got {s.shape}")
+
+    def add_element(self, name, s):
+        """Registers a fixed network, such as a fixture or adapter, under `name`."""
+        s = np.asarray(s)
+        self._check_grid(s)
+        key = ("element", name)
+        with self._lock:
+            self._entries.pop(key, None)
+        self._names[name] = (key, lambda: s_to_t(s))
+        return self.element_t(name)
+
+    def add_coaxial_line(self, name, length_m, Dint, Dout, epsilon_r=1.0, tan_delta=0.0,
+                         sigma=COPPER_CONDUCTIVITY, z0=None, z0_port=50.0):
+        """Registers a `coaxial_line` under `name`.
+
+        Lines with the same parameters share one cache entry, so registering
+        the same line again, under any name, does not recompute it.
+        """
+        key = ("coaxial_line", length_m, Dint, Dout, epsilon_r, tan_delta, sigma, z0, z0_port)
+        self._names[name] = (key, lambda: s_to_t(coaxial_line(
+            self.freqs, length_m, Dint, Dout, epsilon_r, tan_delta, sigma, z0, z0_port)))
+        return self.element_t(name)
+
+    def element_t(self, name):
+        """Returns the cached T-parameters of a registered element."""
+        key, build = self._names[name]
+        return self._get_or_build(key, build)
+
+    def run(self, *chain):
+        """Cascades a chain of element names and S-parameter arrays, in order."""
+        t = []
+        for item in chain:
+            if isinstance(item, str):
+                t.append(self.element_t(item))
+            else:
+                item = np.asarray(item)
+                self._check_grid(item)
+                t.append(s_to_t(item))
+        return t_to_s(cascade_t(*t))
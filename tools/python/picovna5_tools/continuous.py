@@ -0,0 +1,281 @@
+"""
+continuous
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Continuous acquisition: the same `MeasurementConfiguration` swept back to back,
+with host processing overlapped with the next sweep.
+
+`ContinuousAcquisition` runs an acquisition thread, which drains each
+asynchronous sweep and starts the next one as soon as the last point has
+arrived, and a processing thread, which calls the application's `process`
+callable on each completed sweep while the instrument measures the next.
+
+Sweeps are written into a fixed pool of preallocated `SweepBuffer`s, used
+round-robin, so no arrays are allocated per sweep. A buffer returns to the
+pool when `process` returns. If processing falls behind and every buffer is
+waiting to be processed, the oldest waiting sweep is dropped and its buffer
+reused, so the instrument never waits for the host (`policy="drop_oldest"`);
+with `policy="block"`, the acquisition thread instead waits for a free
+buffer, and no sweeps are dropped. Every sweep has a sequence number, so
+gaps show which sweeps were dropped.
+
+Like `StreamingPipeline`, an exception on either thread stops the acquisition
+and is re-raised by `join()`. A device or sweep can instead raise
+`AcquisitionStopped` to end the acquisition without an error (for example,
+when its trigger source is closed); sweeps already acquired are still
+processed.
+"""
+
+import collections
+import threading
+import time
+
+import numpy as np
+
+from .sweep_result import SweepResult
+
+
+POLICIES = ("drop_oldest", "block")
+
+
+class AcquisitionStopped(Exception):
+    """Raised by `startMeasurement` or a sweep to end a `ContinuousAcquisition` without an error."""
+
+
+class SweepBuffer:
+    """One preallocated sweep of the pool.
+
+    `freqs` and `s` hold `count` valid points (shape `(capacity,)` and
+    `(capacity, 2, 2)`); `sequence` numbers the sweeps from 0, and
+    `timestamp_ns` is the `time.perf_counter_ns()` of the last point.
+    """
+
+    def __init__(self, index, capacity):
+        self.index = index
+        self.capacity = capacity
+        self.freqs = np.zeros(capacity, dtype=np.float64)
+        self.s = np.zeros((capacity, 2, 2), dtype=np.complex128)
+        self.count = 0
+        self.sequence = -1
+        self.timestamp_ns = 0
+        # the points are first stored in Python lists, which is several times faster per point than
+        # assigning to NumPy arrays, and then copied into the arrays in one step
+        self._freq_list = [0.0] * capacity
+        self._s_list = [0j] * (4 * capacity)
+
+    def fill(self, sweep):
+        """Drains an asynchronous sweep into the buffer."""
+        freqs, values = self._freq_list, self._s_list
+        capacity = self.capacity
+        i = j = 0
+        while sweep.hasMorePoints():
+            if i == capacity:
+                raise ValueError(f"The sweep has more than the {capacity} points of the buffer")
+            pt = sweep.getNextPoint()
+            freqs[i] = pt.measurementFrequencyHz
+            values[j] = pt.s11
+            values[j + 1] = pt.s12
+            values[j + 2] = pt.s21
+            values[j + 3] = pt.s22
+            i += 1
+            j += 4
+        self.timestamp_ns = time.perf_counter_ns()
+        if i == capacity:
+            self.freqs[:] = freqs
+            self.s.reshape(-1)[:] = values
+        else:
+            self.freqs[:i] = freqs[:i]
+            self.s.reshape(-1)[:j] = values[:j]
+        self.count = i
+
+    def result(self):
+        """Returns the valid points as a `SweepResult` of views into the buffer (no copy)."""
+        return SweepResult(self.freqs[:self.count], self.s[:self.count])
+
+
+class ContinuousAcquisition:
+    """Sweeps `mc` on `device` back to back, calling `process(buffer)` for each completed sweep.
+
+    `device` is a `vna.Device` (or anything with `startMeasurement(mc)`) and
+    `num_points` the number of points of each sweep. `buffers` is the size of
+    the pool, at least 2: one being filled and one being processed. `process`
+    receives a `SweepBuffer`, which is only valid until it returns; use
+    `buffer.result()` for the data. `max_sweeps` stops the acquisition after
+    that many sweeps.
+    """
+
+    def __init__(self, device, mc, num_points, process=None, buffers=4, policy="drop_oldest", max_sweeps=None):
+        if buffers < 2:
+            raise ValueError("At least 2 buffers are needed")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}; expected one of {POLICIES}")
+        self.device = device
+        self.mc = mc
+        self.process = process
+        self.policy = policy
+        self.max_sweeps = max_sweeps
+        self.buffers = [SweepBuffer(i, num_points) for i in range(buffers)]
+        self.error = None
+
+        self.sweeps = 0
+        self.processed = 0
+        self.dropped = 0
+        self.rearm_s = 0.0
+        self.acquisition_wait_s = 0.0
+        self.process_s = 0.0
+        self.start_s = None
+        self.stop_s = None
+
+        self._free = collections.deque(self.buffers)
+        self._ready = collections.deque()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._stopping = False
+        self._acquiring = False
+        self._threads = []
+
+    def start(self):
+        self._stopping = False
+        self._acquiring = True
+        self._threads = [
+            threading.Thread(target=self._acquire, name="continuous-acquisition", daemon=True),
+            threading.Thread(target=self._process, name="continuous-processing", daemon=True),
+        ]
+        self.start_s = time.perf_counter()
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        """Stops after the sweep in progress; sweeps already acquired are still processed."""
+        with self._lock:
+            self._stopping = True
+            self._changed.notify_all()
+
+    def join(self):
+        """Waits for both threads to finish, re-raising the first error from either."""
+        for thread in self._threads:
+            thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def run(self, duration_s=None):
+        """Runs for `duration_s` seconds (or until `max_sweeps`) and returns the statistics."""
+        self.start()
+        if duration_s is not None:
+            deadline = time.perf_counter() + duration_s
+            with self._lock:
+                while self._acquiring and not self._stopping:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self._changed.wait(remaining)
+            self.stop()
+        self.join()
+        return self.stats()
+
+    def stats(self):
+        with self._lock:
+            end_s = self.stop_s if self.stop_s is not None else time.perf_counter()
+            elapsed_s = end_s - self.start_s if self.start_s is not None else 0.0
+            return {
+                "sweeps": self.sweeps,
+                "processed": self.processed,
+                "dropped": self.dropped,
+                "elapsed_s": elapsed_s,
+                "sweeps_per_s": self.sweeps / elapsed_s if elapsed_s > 0 else 0.0,
+                "processed_per_s": self.processed / elapsed_s if elapsed_s > 0 else 0.0,
+                "mean_rearm_s": self.rearm_s / self.sweeps if self.sweeps else 0.0,
+                "mean_process_s": self.process_s / self.processed if self.processed else 0.0,
+                "acquisition_wait_s": self.acquisition_wait_s,
+                "buffers": len(self.buffers),
+            }
+
+    def _fail(self, error):
+        with self._lock:
+            if self.error is None:
+                self.error = error
+            self._stopping = True
+            self._changed.notify_all()
+
+    def _take_buffer(self):
+        with self._lock:
+            if not self._free and self.policy == "block":
+                start = time.perf_counter()
+                while not self._free and not self._stopping:
+                    self._changed.wait()
+                self.acquisition_wait_s += time.perf_counter() - start
+                if not self._free:
+                    return None
+            if self._free:
+                return self._free.popleft()
+            if self._ready:
+                # processing has fallen behind: reuse the buffer of the oldest unprocessed sweep
+                self.dropped += 1
+                return self._ready.popleft()
+            while not self._free and not self._stopping:
+                self._changed.wait()
+            return self._free.popleft() if self._free else None
+
+    def _acquire(self):
+        try:
+            sweep = self.device.startMeasurement(self.mc)
+            while True:
+                buffer = self._take_buffer()
+                if buffer is None:
+                    break
+                try:
+                    buffer.fill(sweep)
+                except AcquisitionStopped:
+                    with self._lock:
+                        self._free.append(buffer)
+                    break
+                sequence = self.sweeps
+                last = self._stopping or (self.max_sweeps is not None and sequence + 1 >= self.max_sweeps)
+                if not last:
+                    # re-arm before handing the sweep over, so the instrument measures while the host processes
+                    start = time.perf_counter()
+                    try:
+                        sweep = self.device.startMeasurement(self.mc)
+                    except AcquisitionStopped:
+                        last = True
+                    self.rearm_s += time.perf_counter() - start
+                buffer.sequence = sequence
+                with self._lock:
+                    self.sweeps = sequence + 1
+                    self._ready.append(buffer)
+                    self._changed.notify_all()
+                if last:
+                    break
+        except AcquisitionStopped:
+            pass
+        except Exception as e:
+            self._fail(e)
+        finally:
+            with self._lock:
+                self._acquiring = False
+                self.stop_s = time.perf_counter()
+                self._changed.notify_all()
+
+    def _process(self):
+        while True:
+            with self._lock:
+                while not self._ready and self._acquiring and self.error is None:
+                    self._changed.wait()
+                if self.error is not None or not self._ready:
+                    return
+                buffer = self._ready.popleft()
+            try:
+                start = time.perf_counter()
+                if self.process is not None:
+                    self.process(buffer)
+                elapsed_s = time.perf_counter() - start
+            except Exception as e:
+                self._fail(e)
+                return
+            with self._lock:
+                self.process_s += elapsed_s
+                self.processed += 1
+                self._free.append(buffer)
+                self._changed.notify_all()
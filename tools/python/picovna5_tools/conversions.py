@@ -0,0 +1,90 @@
+"""
+conversions
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Vectorised conversions from complex S-parameter data to display formats.
+
+`vna.toLogMag()` and `vna.toPhaseDeg()` convert one value per call, so the
+examples call them eight times per point inside a Python loop. The functions
+here convert a whole sweep in one call. They accept any array shape: a single
+trace (N,), an S-matrix (N, 2, 2) or a stack of sweeps. Where a conversion is
+element-wise an `out` array of the matching shape (float64, or complex128 for
+`impedance`) may be passed to reuse a preallocated buffer; the result is
+written into it and returned.
+
+`logmag` and `phase_deg` compute the same quantities as `vna.toLogMag()` and
+`vna.toPhaseDeg()`, but with NumPy's `log10` and `arctan2`, so results may
+differ from those of the SDK in the last bits.
+
+Functions that work along the frequency axis (`unwrapped_phase_deg`,
+`group_delay`) take it to be `axis` (0 by default, as in `SweepResult.s`).
+"""
+
+import numpy as np
+
+
+_RAD_TO_DEG = 180.0 / np.pi
+
+
+def linmag(s, out=None):
+    """Returns |s|."""
+    return np.abs(s, out=out)
+
+
+def logmag(s, out=None):
+    """Returns 20 * log10(|s|) in dB, the quantity of `vna.toLogMag()`."""
+    out = np.abs(s, out=out)
+    np.log10(out, out=out)
+    out *= 20.0
+    return out
+
+
+def phase_deg(s, out=None):
+    """Returns the phase of s in degrees, in the range [-180, 180], the quantity of `vna.toPhaseDeg()`."""
+    s = np.asarray(s)
+    out = np.arctan2(s.imag, s.real, out=out)
+    out *= _RAD_TO_DEG
+    return out
+
+
+def unwrapped_phase_rad(s, axis=0):
+    """Returns the phase of s in radians, unwrapped along the frequency axis."""
+    return np.unwrap(np.angle(s), axis=axis)
+
+
+def unwrapped_phase_deg(s, axis=0, out=None):
+    """Returns the phase of s in degrees, unwrapped along the frequency axis."""
+    return np.multiply(unwrapped_phase_rad(s, axis), _RAD_TO_DEG, out=out)
+
+
+def group_delay(freqs, s, axis=0, out=None):
+    """Returns the group delay -d(phase)/d(omega) in seconds.
+
+    `freqs` are the sweep frequencies in Hz and need not be uniformly spaced.
+    """
+    omega = 2.0 * np.pi * np.asarray(freqs, dtype=np.float64)
+    gd = np.gradient(unwrapped_phase_rad(s, axis), omega, axis=axis)
+    return np.negative(gd, out=out)
+
+
+def vswr(s, out=None):
+    """Returns the voltage standing wave ratio (1 + |s|) / (1 - |s|) of a reflection coefficient."""
+    mag = np.abs(s)
+    out = np.add(1.0, mag, out=out)
+    np.subtract(1.0, mag, out=mag)
+    out /= mag
+    return out
+
+
+def impedance(s, z0=50.0, out=None):
+    """Returns the impedance z0 * (1 + s) / (1 - s) of a reflection coefficient, in ohms.
+
+    The Smith chart coordinates of a reflection coefficient are simply its real
+    and imaginary parts; this gives the impedance read off the chart.
+    """
+    s = np.asarray(s)
+    out = np.add(1.0, s, out=out)
+    out /= 1.0 - s
+    out *= z0
+    return out
@@ -0,0 +1,427 @@
+"""
+instrumentation
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Timing instrumentation for sweeps through the API (`vna.Device`) and the SCPI
+client, with histograms exported to a log, a JSON file or a Prometheus text
+file.
+
+`InstrumentedDevice` wraps a `vna.Device`. Every sweep it starts gets a
+`SweepTimeline`, which records when the sweep was started and when its first
+and last points arrived, and into which the application can record its own
+stages (configure, post-processing, export) with `timeline.stage(name)`.
+When a sweep has been drained, the points per second and the intervals
+between points (and their standard deviation, the jitter) are added to the
+histograms of a shared `SweepMetrics`. `InstrumentedScpiClient` does the same
+for `ScpiClient` sweeps and imports.
+
+Per point, the instrumentation only appends a `time.perf_counter_ns()`
+timestamp to a list; everything else is computed with NumPy once per sweep.
+
+Histograms have fixed bucket bounds, like Prometheus histograms, so they use
+constant memory however many sweeps are recorded.
+"""
+
+import bisect
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+
+
+# default bucket upper bounds
+DURATION_BOUNDS_S = tuple(float(f"{b:.3g}") for b in 10.0 ** np.arange(-6.0, 2.01, 0.25))   # 1 us to 100 s
+RATE_BOUNDS = tuple(float(f"{b:.3g}") for b in 10.0 ** np.arange(0.0, 7.01, 0.25))          # 1 to 10^7 per second
+DEPTH_BOUNDS = tuple(float(2 ** k) for k in range(17))                                      # 1 to 65536 items
+
+# metric name -> (bucket bounds, description)
+METRICS = {
+    "configure_s": (DURATION_BOUNDS_S, "Time spent building the measurement configuration"),
+    "start_to_first_point_s": (DURATION_BOUNDS_S, "Time from starting a sweep to receiving its first point"),
+    "first_to_last_point_s": (DURATION_BOUNDS_S, "Time from the first to the last point of a sweep"),
+    "trigger_to_first_point_s": (DURATION_BOUNDS_S, "Time from a trigger event to the first point of its sweep"),
+    "sweep_s": (DURATION_BOUNDS_S, "Time from starting a sweep to receiving its last point"),
+    "post_process_s": (DURATION_BOUNDS_S, "Time spent post-processing a sweep"),
+    "export_s": (DURATION_BOUNDS_S, "Time spent exporting a sweep"),
+    "points_per_s": (RATE_BOUNDS, "Points received per second during a sweep"),
+    "point_interval_s": (DURATION_BOUNDS_S, "Time between consecutive points of a sweep"),
+    "jitter_s": (DURATION_BOUNDS_S, "Standard deviation of the time between points, per sweep"),
+    "queue_depth": (DEPTH_BOUNDS, "Maximum depth of a pipeline buffer, per sweep"),
+    "scpi_write_s": (DURATION_BOUNDS_S, "Time to send the commands of a SCPI import"),
+    "scpi_first_response_s": (DURATION_BOUNDS_S, "Time until the first response of a SCPI import"),
+    "scpi_transfer_s": (DURATION_BOUNDS_S, "Time to receive the responses of a SCPI import"),
+    "scpi_import_s": (DURATION_BOUNDS_S, "Total time of a SCPI import"),
+}
+
+
+class Histogram:
+    """Fixed-bucket histogram. `bounds` are the inclusive upper bounds of the buckets."""
+
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        self.counts = np.zeros(len(self.bounds) + 1, dtype=np.int64)   # the last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def observe_many(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        buckets = np.searchsorted(self.bounds, values, side="left")
+        self.counts += np.bincount(buckets, minlength=len(self.counts))
+        self.count += len(values)
+        self.sum += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def quantile(self, q):
+        """Estimates a quantile by linear interpolation within its bucket."""
+        if self.count == 0:
+            return float("nan")
+        rank = q * self.count
+        cumulative = np.cumsum(self.counts)
+        i = int(np.searchsorted(cumulative, rank, side="left"))
+        lower = self.bounds[i - 1] if i > 0 else min(self.min, self.bounds[0])
+        upper = self.bounds[i] if i < len(self.bounds) else self.max
+        below = cumulative[i - 1] if i > 0 else 0
+        fraction = (rank - below) / self.counts[i] if self.counts[i] else 0.0
+        return float(min(max(lower + fraction * (upper - lower), self.min), self.max))
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5) if self.count else None,
+            "p95": self.quantile(0.95) if self.count else None,
+            "bounds": list(self.bounds),
+            "counts": self.counts.tolist(),
+        }
+
+
+class SweepMetrics:
+    """Thread-safe registry of histograms, keyed by metric name and labels.
+
+    `exporters` are called by `export()`. If `export_interval_s` is set,
+    `export()` is also called after recording a sweep once that interval has
+    passed since the last export.
+    """
+
+    def __init__(self, exporters=(), export_interval_s=None):
+        self.exporters = list(exporters)
+        self.export_interval_s = export_interval_s
+        self.sweeps = 0
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._last_export = time.monotonic()
+
+    def histogram(self, name, labels=None):
+        key = (name, tuple(sorted((labels or {}).items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            bounds = METRICS[name][0] if name in METRICS else DURATION_BOUNDS_S
+            histogram = self._histograms.setdefault(key, Histogram(bounds))
+        return histogram
+
+    def observe(self, name, value, labels=None):
+        with self._lock:
+            self.histogram(name, labels).observe(value)
+
+    def observe_many(self, name, values, labels=None):
+        with self._lock:
+            self.histogram(name, labels).observe_many(values)
+
+    def observe_pipeline(self, stats, labels=None):
+        """Records the maximum depth of each buffer of a `StreamingPipeline` from its `stats()`."""
+        with self._lock:
+            for i, buffer in enumerate(stats["buffers"]):
+                self.histogram("queue_depth", dict(labels or {}, buffer=str(i))).observe(buffer["max_depth"])
+
+    def record_points(self, point_times_ns, start_ns, labels=None):
+        """Records the point timing of one sweep from the arrival time of each point."""
+        with self._lock:
+            self.sweeps += 1
+            if len(point_times_ns) == 0:
+                return
+            times = np.asarray(point_times_ns, dtype=np.int64)
+            first_s = (times[0] - start_ns) * 1e-9
+            last_s = (times[-1] - start_ns) * 1e-9
+            self.histogram("start_to_first_point_s", labels).observe(first_s)
+            self.histogram("sweep_s", labels).observe(last_s)
+            if len(times) > 1:
+                intervals = np.diff(times) * 1e-9
+                acquisition_s = (times[-1] - times[0]) * 1e-9
+                self.histogram("first_to_last_point_s", labels).observe(acquisition_s)
+                self.histogram("point_interval_s", labels).observe_many(intervals)
+                self.histogram("jitter_s", labels).observe(float(intervals.std()))
+                if acquisition_s > 0:
+                    self.histogram("points_per_s", labels).observe((len(times) - 1) / acquisition_s)
+        self._maybe_export()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "sweeps": self.sweeps,
+                "histograms": [
+                    dict(name=name, labels=dict(labels), **histogram.snapshot())
+                    for (name, labels), histogram in sorted(self._histograms.items())
+                ],
+            }
+
+    def export(self):
+        snapshot = self.snapshot()
+        for exporter in self.exporters:
+            exporter.export(snapshot)
+        self._last_export = time.monotonic()
+
+    def _maybe_export(self):
+        if self.export_interval_s is not None and time.monotonic() - self._last_export >= self.export_interval_s:
+            self.export()
+
+
+class SweepTimeline:
+    """Timestamps (`time.perf_counter_ns()`) of the stages of one sweep."""
+
+    def __init__(self, metrics, labels=None):
+        self.metrics = metrics
+        self.labels = labels
+        self.events = {}
+        self.point_times_ns = []
+
+    def mark(self, event):
+        self.events[event] = time.perf_counter_ns()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Times a stage of the sweep, such as "configure", "post_process" or "export"."""
+        start = time.perf_counter_ns()
+        self.events[f"{name}_start"] = start
+        try:
+            yield self
+        finally:
+            end = time.perf_counter_ns()
+            self.events[f"{name}_end"] = end
+            self.metrics.observe(f"{name}_s", (end - start) * 1e-9, self.labels)
+
+    def durations(self):
+        """Returns the times of the recorded events, in seconds from the start of the sweep."""
+        origin = self.events.get("start", min(self.events.values(), default=0))
+        return {event: (t - origin) * 1e-9 for event, t in sorted(self.events.items(), key=lambda e: e[1])}
+
+
+class InstrumentedSweep:
+    """Wraps an asynchronous sweep from `startMeasurement`, timestamping each point."""
+
+    def __init__(self, sweep, timeline):
+        self._sweep = sweep
+        self.timeline = timeline
+        timeline.events.setdefault("start", time.perf_counter_ns())
+        self._recorded = False
+        self._has_more_points = sweep.hasMorePoints
+        # a closure rather than a method, with everything it needs bound in advance,
+        # to keep the per-point overhead to a timestamp and a list append
+        append = timeline.point_times_ns.append
+        get_next_point = sweep.getNextPoint
+        perf_counter_ns = time.perf_counter_ns
+
+        def getNextPoint():
+            pt = get_next_point()
+            append(perf_counter_ns())
+            return pt
+
+        self.getNextPoint = getNextPoint
+
+    def hasMorePoints(self):
+        if self._has_more_points():
+            return True
+        if not self._recorded:
+            self._recorded = True
+            self._finish()
+        return False
+
+    def _finish(self):
+        timeline = self.timeline
+        times = timeline.point_times_ns
+        if times:
+            timeline.events["first_point"] = times[0]
+            timeline.events["last_point"] = times[-1]
+        timeline.metrics.record_points(times, timeline.events["start"], timeline.labels)
+
+
+class InstrumentedDevice:
+    """Wraps a `vna.Device`, recording the timing of each measurement in `metrics`.
+
+    Other attributes are passed through to the device. `last_timeline` is the
+    timeline of the most recently started sweep.
+    """
+
+    def __init__(self, device, metrics, labels=None):
+        self._device = device
+        self.metrics = metrics
+        self.labels = labels
+        self.last_timeline = None
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    def new_timeline(self):
+        """Returns a timeline for the next sweep, e.g. to time its configuration with `stage("configure")`."""
+        self.last_timeline = SweepTimeline(self.metrics, self.labels)
+        return self.last_timeline
+
+    def _timeline(self, timeline):
+        if timeline is None:
+            timeline = self.new_timeline()
+        self.last_timeline = timeline
+        return timeline
+
+    def startMeasurement(self, mc, timeline=None):
+        timeline = self._timeline(timeline)
+        timeline.mark("start")
+        return InstrumentedSweep(self._device.startMeasurement(mc), timeline)
+
+    def performMeasurement(self, mc, timeline=None):
+        """Synchronous measurement. Only the total time is known, so no per-point timing is recorded."""
+        timeline = self._timeline(timeline)
+        timeline.mark("start")
+        points = self._device.performMeasurement(mc)
+        timeline.mark("last_point")
+        elapsed_s = (timeline.events["last_point"] - timeline.events["start"]) * 1e-9
+        self.metrics.observe("sweep_s", elapsed_s, self.labels)
+        if elapsed_s > 0:
+            self.metrics.observe("points_per_s", len(points) / elapsed_s, self.labels)
+        return points
+
+
+class InstrumentedScpiClient:
+    """Wraps a `ScpiClient`, recording the timing of sweeps and pipelined imports in `metrics`.
+
+    A sweep is timed from `start_sweep()` to the end of the next import, since
+    the SCPI interface returns each trace only when the sweep is complete.
+    """
+
+    def __init__(self, client, metrics, labels=None):
+        self._client = client
+        self.metrics = metrics
+        self.labels = labels
+        self.last_timeline = None
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def start_sweep(self, timeline=None):
+        self.last_timeline = timeline or SweepTimeline(self.metrics, self.labels)
+        self.last_timeline.mark("start")
+        self._client.start_sweep()
+        return self.last_timeline
+
+    def _record(self, timing):
+        for stage in ("write", "first_response", "transfer"):
+            self.metrics.observe(f"scpi_{stage}_s", timing[stage], self.labels)
+        self.metrics.observe("scpi_import_s", timing["total"], self.labels)
+        timeline = self.last_timeline
+        if timeline is not None and "last_point" not in timeline.events:
+            timeline.mark("last_point")
+            self.metrics.observe("sweep_s", (timeline.events["last_point"] - timeline.events["start"]) * 1e-9,
+                                 self.labels)
+
+    def fetch_s_matrices(self, memory_channels=(None,)):
+        result = self._client.fetch_s_matrices(memory_channels)
+        self._record(result.timing)
+        return result
+
+    def fetch_s_matrix(self, memory_channel=None):
+        result = self.fetch_s_matrices((memory_channel,))
+        return result.freqs, result.s[0]
+
+
+#### Exporters
+###############################################################################
+
+def _write_atomically(path, text):
+    # write to a temporary file and rename it, so readers never see a partial file
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", newline="\n") as f:
+        f.write(text)
+    os.replace(temporary, path)
+
+
+class LogExporter:
+    """Logs a one-line summary of each histogram."""
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger("picovna5_tools.instrumentation")
+        self.level = level
+
+    def export(self, snapshot):
+        for h in snapshot["histograms"]:
+            if not h["count"]:
+                continue
+            labels = "".join(f" {k}={v}" for k, v in h["labels"].items())
+            self.logger.log(self.level, "%s%s: count %d, mean %.6g, p50 %.6g, p95 %.6g, max %.6g",
+                            h["name"], labels, h["count"], h["mean"], h["p50"], h["p95"], h["max"])
+
+
+class JsonExporter:
+    """Writes the snapshot of all histograms to a JSON file."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def export(self, snapshot):
+        _write_atomically(self.path, json.dumps(dict(snapshot, time=time.time()), indent=1))
+
+
+class PrometheusTextExporter:
+    """Writes histograms in the Prometheus text exposition format.
+
+    The file is replaced atomically, so it can be read by the node exporter's
+    textfile collector. Metric names are prefixed with `prefix`.
+    """
+
+    def __init__(self, path, prefix="picovna5_"):
+        self.path = path
+        self.prefix = prefix
+
+    @staticmethod
+    def _labels(labels, **extra):
+        items = list(labels.items()) + list(extra.items())
+        if not items:
+            return ""
+        return "{" + ",".join(f'{k}="{v}"' for k, v in items) + "}"
+
+    def export(self, snapshot):
+        lines = []
+        described = set()
+        for h in snapshot["histograms"]:
+            name = self.prefix + h["name"]
+            if name not in described:
+                description = METRICS.get(h["name"], (None, h["name"]))[1]
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} histogram")
+                described.add(name)
+            cumulative = np.cumsum(h["counts"])
+            for bound, count in zip(h["bounds"], cumulative):
+                lines.append(f"{name}_bucket{self._labels(h['labels'], le=repr(bound))} {count}")
+            lines.append(f"{name}_bucket{self._labels(h['labels'], le='+Inf')} {h['count']}")
+            lines.append(f"{name}_sum{self._labels(h['labels'])} {h['sum']!r}")
+            lines.append(f"{name}_count{self._labels(h['labels'])} {h['count']}")
+        _write_atomically(self.path, "\n".join(lines) + "\n")
@@ -0,0 +1,199 @@
+"""
+orchestrator
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Runs measurement jobs across a pool of PicoVNA instruments in parallel.
+
+`open_pool()` opens every instrument it can find (optionally only those with
+given serial numbers), topping up with simulated demo instruments if asked to.
+`SweepOrchestrator` dispatches `MeasurementConfiguration` jobs to whichever
+instrument is idle using a thread pool with one worker per instrument, stores
+each result as a `SweepResult` in a shared `ResultStore`, and reports the
+utilisation of each instrument and the aggregate sweep rate.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .sweep_result import SweepResult
+
+
+def close_device(device):
+    """Releases an instrument.
+
+    The SDK closes a device when its `vna.Device` object is destroyed (as the
+    C++ examples do when it goes out of scope); `close()` is called first if
+    the binding provides one.
+    """
+    close = getattr(device, "close", None)
+    if close is not None:
+        close()
+
+
+def open_pool(serials=None, count=None, demo_fallback=False):
+    """Opens a list of instruments.
+
+    Instruments are opened with `vna.Device.openAny()` until none are left. If
+    `serials` is given, only those instruments are kept, and the others are
+    closed. If fewer than `count` instruments (or fewer than `len(serials)`)
+    were found and `demo_fallback` is set, the pool is topped up with
+    `vna.Device.openDemo()` instances, which is useful for testing without
+    hardware. If the pool is still short, or opening fails, every instrument
+    opened so far is closed and `RuntimeError` (or the error) is raised.
+    """
+    from vna import vna
+
+    wanted = None if serials is None else set(serials)
+    if count is None and wanted is not None:
+        count = len(wanted)
+
+    devices = []
+    # unmatched instruments stay open until the search is over, so openAny() does not return them again
+    unmatched = []
+    try:
+        while count is None or len(devices) < count:
+            try:
+                device = vna.Device.openAny()
+            except vna.DeviceNotFoundException:
+                break
+            if wanted is None or device.getInfo().serial in wanted:
+                devices.append(device)
+            else:
+                unmatched.append(device)
+
+        if demo_fallback and count is not None:
+            while len(devices) < count:
+                devices.append(vna.Device.openDemo())
+
+        if not devices:
+            raise RuntimeError("No instruments found.")
+        if count is not None and len(devices) < count:
+            raise RuntimeError(f"Found {len(devices)} of {count} instruments.")
+    except BaseException:
+        for device in devices:
+            close_device(device)
+        raise
+    finally:
+        for device in unmatched:
+            close_device(device)
+    return devices
+
+
+class ResultStore:
+    """Thread-safe store of sweep results keyed by job ID.
+
+    Each entry is a dict with the `SweepResult` (`result`), the `serial` of the
+    instrument that measured it, and `start_s`/`end_s` (`time.perf_counter()`).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def put(self, job_id, entry):
+        with self._lock:
+            self._entries[job_id] = entry
+
+    def get(self, job_id):
+        with self._lock:
+            return self._entries[job_id]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def items(self):
+        with self._lock:
+            return list(self._entries.items())
+
+
+class SweepOrchestrator:
+    """Dispatches measurement jobs to a pool of open instruments.
+
+    Jobs are submitted with `submit(job_id, mc)`, which returns a future that
+    resolves to the job's store entry. Each job runs on whichever instrument
+    becomes idle first.
+    """
+
+    def __init__(self, devices, store=None):
+        if not devices:
+            raise ValueError("At least one device is required.")
+        self.store = store if store is not None else ResultStore()
+        self.serials = [device.getInfo().serial for device in devices]
+        self._idle = queue.Queue()
+        for index, device in enumerate(devices):
+            self._idle.put((index, device))
+        self._executor = ThreadPoolExecutor(max_workers=len(devices), thread_name_prefix="vna-orchestrator")
+        self._lock = threading.Lock()
+        self._busy_s = [0.0] * len(devices)
+        self._sweeps = [0] * len(devices)
+        self._points = [0] * len(devices)
+        self._start_s = None
+        self._end_s = None
+
+    def close(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def submit(self, job_id, mc):
+        with self._lock:
+            if self._start_s is None:
+                self._start_s = time.perf_counter()
+        return self._executor.submit(self._run_job, job_id, mc)
+
+    def run(self, jobs):
+        """Runs an iterable of `(job_id, mc)` jobs to completion and returns the store."""
+        futures = [self.submit(job_id, mc) for job_id, mc in jobs]
+        for future in futures:
+            future.result()
+        return self.store
+
+    def _run_job(self, job_id, mc):
+        index, device = self._idle.get()
+        try:
+            start_s = time.perf_counter()
+            result = SweepResult.from_points(device.performMeasurement(mc))
+            end_s = time.perf_counter()
+        finally:
+            self._idle.put((index, device))
+
+        entry = {"result": result, "serial": self.serials[index], "start_s": start_s, "end_s": end_s}
+        self.store.put(job_id, entry)
+        with self._lock:
+            self._busy_s[index] += end_s - start_s
+            self._sweeps[index] += 1
+            self._points[index] += len(result)
+            self._end_s = end_s if self._end_s is None else max(self._end_s, end_s)
+        return entry
+
+    def stats(self):
+        """Returns per-device utilisation (busy time / elapsed time) and the aggregate sweep rate."""
+        with self._lock:
+            if self._start_s is None or self._end_s is None:
+                return {"devices": [], "sweeps": 0, "elapsed_s": 0.0, "sweeps_per_s": 0.0}
+            elapsed_s = self._end_s - self._start_s
+            devices = [
+                {
+                    "serial": serial,
+                    "sweeps": self._sweeps[i],
+                    "points": self._points[i],
+                    "busy_s": self._busy_s[i],
+                    "utilisation": self._busy_s[i] / elapsed_s if elapsed_s > 0 else 0.0,
+                }
+                for i, serial in enumerate(self.serials)
+            ]
+            sweeps = sum(self._sweeps)
+            return {
+                "devices": devices,
+                "sweeps": sweeps,
+                "elapsed_s": elapsed_s,
+                "sweeps_per_s": sweeps / elapsed_s if elapsed_s > 0 else 0.0,
+            }
@@ -0,0 +1,190 @@
+"""
+plotting
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Headless rendering of per-DUT report images, in the layout of the PLOT OUTPUT
+section of scpi/python/video_example_1/demo.py (S11 and S21 log magnitude and
+phase on a 2x2 grid).
+
+The demo builds a new figure with pyplot and plots every point of every trace.
+`ReportRenderer` instead builds one figure on the Agg canvas, without pyplot
+or an interactive backend, and reuses it for each image. The axes, ticks and
+labels are drawn once and kept as a background bitmap (until the frequency
+range changes); for each image only the traces and title are updated with
+`set_data`/`set_text` and drawn over a copy of the background. Each trace is
+first reduced with `minmax_decimate` to two points per horizontal pixel of its
+axes, which keeps the visual envelope of the trace (including narrow peaks and
+nulls) while drawing far fewer line segments. Images are written as PNG with
+a low zlib compression level, which is much faster to encode.
+
+`render_batch` renders many images in a process pool, with one renderer per
+worker process.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .conversions import logmag, phase_deg
+
+
+# (row, column, S-parameter, quantity) of each plot, as in demo.py
+PANELS = ((0, 0, "S11", "db"), (0, 1, "S21", "db"), (1, 0, "S11", "deg"), (1, 1, "S21", "deg"))
+S_INDEX = {"S11": (0, 0), "S12": (0, 1), "S21": (1, 0), "S22": (1, 1)}
+
+
+def minmax_decimate(x, y, buckets):
+    """Reduces a trace to the minimum and maximum of `y` in each of `buckets` equal groups of points.
+
+    The minimum and maximum of each group are returned in the order in which
+    they occur, so the decimated line follows the same envelope as the full
+    trace. Traces of at most `2 * buckets` points are returned unchanged.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n <= 2 * buckets:
+        return x, y
+    size = -(-n // buckets)
+    buckets = -(-n // size)
+    # pad the last group by repeating the final point, which cannot change its minimum or maximum
+    padded = np.empty(buckets * size, dtype=y.dtype)
+    padded[:n] = y
+    padded[n:] = y[-1]
+    groups = padded.reshape(buckets, size)
+    starts = np.arange(buckets) * size
+    low = starts + groups.argmin(axis=1)
+    high = starts + groups.argmax(axis=1)
+    indices = np.empty(2 * buckets, dtype=np.intp)
+    indices[0::2] = np.minimum(low, high)
+    indices[1::2] = np.maximum(low, high)
+    indices = np.minimum(indices, n - 1)
+    return x[indices], y[indices]
+
+
+class ReportRenderer:
+    """Renders S11/S21 report images, reusing one Agg figure.
+
+    `width_in`, `height_in` and `dpi` set the image size. Traces are decimated
+    to the pixel width of their axes unless `decimate` is false.
+    `compress_level` is the PNG zlib compression level (0-9).
+    """
+
+    def __init__(self, width_in=6.4, height_in=4.8, dpi=220, font_size=4, db_limits=(-100, 0), decimate=True,
+                 compress_level=1):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.decimate = decimate
+        self.compress_level = compress_level
+        self.figure = Figure(figsize=(width_in, height_in), dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        axes = self.figure.subplots(2, 2)
+        self.lines = []
+        for row, column, parameter, quantity in PANELS:
+            ax = axes[row][column]
+            ax.tick_params(labelsize=font_size)
+            ax.set_xlabel("Frequency (GHz)", fontsize=font_size)
+            if quantity == "db":
+                ax.set_title(parameter, fontsize=font_size)
+                ax.set_ylabel("LogMag /dB", fontsize=font_size)
+                ax.set_ylim(db_limits)
+            else:
+                ax.set_ylabel("Phase /deg", fontsize=font_size)
+                ax.set_ylim(-180, 180)
+            ax.grid(True, linewidth=0.3)
+            # animated artists are left out of the background and drawn separately for each image
+            line, = ax.plot([], [], linewidth=0.5, animated=True)
+            self.lines.append((ax, line, parameter, quantity))
+        self.title = self.figure.suptitle("", fontsize=font_size, animated=True)
+        self.figure.tight_layout()
+        self._background = None
+        self._xlim = None
+        self.images = 0
+        self.background_draws = 0
+
+    def _pixel_width(self, ax):
+        return max(int(ax.get_window_extent().width), 1)
+
+    def _restore_background(self, xlim):
+        if xlim != self._xlim:
+            for ax, _, _, _ in self.lines:
+                ax.set_xlim(xlim)
+            self.canvas.draw()
+            self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+            self._xlim = xlim
+            self.background_draws += 1
+        else:
+            self.canvas.restore_region(self._background)
+
+    def render(self, freqs, s, path, title=""):
+        """Renders one sweep (`(N, 2, 2)` S-parameters) to a PNG file."""
+        from PIL import Image
+
+        freqs_ghz = np.asarray(freqs, dtype=np.float64) * 1e-9
+        s = np.asarray(s)
+        self._restore_background((float(freqs_ghz[0]), float(freqs_ghz[-1])))
+        renderer = self.canvas.get_renderer()
+        for ax, line, parameter, quantity in self.lines:
+            m, n = S_INDEX[parameter]
+            trace = s[:, m, n]
+            y = logmag(trace) if quantity == "db" else phase_deg(trace)
+            x = freqs_ghz
+            if self.decimate:
+                x, y = minmax_decimate(x, y, self._pixel_width(ax))
+            line.set_data(x, y)
+            ax.draw_artist(line)
+        self.title.set_text(title)
+        self.title.draw(renderer)
+
+        width, height = self.canvas.get_width_height()
+        image = Image.frombuffer("RGBA", (width, height), self.canvas.buffer_rgba(), "raw", "RGBA", 0, 1)
+        image.save(path, format="png", compress_level=self.compress_level)
+        self.images += 1
+
+
+# one renderer per worker process, created by _init_worker
+_renderer = None
+
+
+def _init_worker(renderer_options):
+    global _renderer
+    _renderer = ReportRenderer(**renderer_options)
+
+
+def _render_job(job):
+    if isinstance(job[1], (str, os.PathLike)):
+        # (output path, Touchstone path): load the network in the worker
+        from .touchstone import read_touchstone
+
+        path, source = job
+        freqs, s, _ = read_touchstone(source)
+        title = os.path.splitext(os.path.basename(str(source)))[0]
+    else:
+        path, freqs, s, title = (tuple(job) + ("",))[:4]
+    _renderer.render(freqs, s, path, title)
+    return path
+
+
+def render_batch(jobs, processes=None, chunksize=8, **renderer_options):
+    """Renders report images in a process pool.
+
+    Each job is `(output path, freqs, s[, title])`, or `(output path, Touchstone
+    path)` to load the network in the worker process, which avoids sending the
+    data between processes. `renderer_options` are passed to `ReportRenderer`.
+    Returns a dict with the number of `images`, `elapsed_s` and `images_per_s`.
+    """
+    jobs = list(jobs)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(renderer_options,)) as executor:
+        for _ in executor.map(_render_job, jobs, chunksize=chunksize):
+            pass
+    elapsed_s = time.perf_counter() - start
+    return {
+        "images": len(jobs),
+        "elapsed_s": elapsed_s,
+        "images_per_s": len(jobs) / elapsed_s if elapsed_s > 0 else float("inf"),
+    }
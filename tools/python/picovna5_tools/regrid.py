@@ -0,0 +1,161 @@
+"""
+regrid
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Host-side linear interpolation of sweeps and 12-term calibration error terms
+onto other frequency grids.
+
+02_load_user_cal_and_print_logmagarg_data and 03_time_domain_transform note
+that the device interpolates the calibration whenever the sweep grid does not
+match it. When many sweeps are re-gridded onto a few fixed grids on the host,
+the search for the neighbouring source points and the interpolation weights
+depend only on the two grids. `RegridEngine` computes them once per pair of
+grids, with `time_domain.linear_interpolation_weights`, and keeps them in an
+LRU cache as an `InterpolationPlan`. Applying a plan is one gather of the two
+neighbouring points and one multiply-add, `y0 + w * (y1 - y0)`, for the whole
+stack of sweeps at once.
+
+Values are interpolated linearly in real and imaginary parts, and targets
+outside the source range take the nearest end value, as in
+`linear_interpolation_weights`.
+
+The 12 error terms of a two-port calibration (`ERROR_TERMS`) are interpolated
+together, as one `(12, N)` array.
+"""
+
+import collections
+import hashlib
+import threading
+
+import numpy as np
+
+from .time_domain import linear_interpolation_weights
+
+
+# forward: directivity, source match, reflection tracking, isolation, load match, transmission tracking;
+# then the same six terms in the reverse direction
+ERROR_TERMS = ("EDF", "ESF", "ERF", "EXF", "ELF", "ETF", "EDR", "ESR", "ERR", "EXR", "ELR", "ETR")
+
+
+def _grid_key(freqs):
+    return len(freqs), hashlib.blake2b(freqs.tobytes(), digest_size=16).digest()
+
+
+class InterpolationPlan:
+    """Neighbour indices and weights for interpolating from `source_freqs` onto `target_freqs`."""
+
+    def __init__(self, source_freqs, target_freqs):
+        self.source_freqs = np.ascontiguousarray(source_freqs, dtype=np.float64)
+        self.target_freqs = np.ascontiguousarray(target_freqs, dtype=np.float64)
+        if len(self.source_freqs) < 2:
+            raise ValueError("At least two source frequencies are needed")
+        if np.any(np.diff(self.source_freqs) <= 0):
+            raise ValueError("Source frequencies must be strictly increasing")
+        self.lower, self.weight = linear_interpolation_weights(self.source_freqs, self.target_freqs)
+        self.upper = self.lower + 1
+        # if every target coincides with a source point (weight 0, or 1 at the top end), one gather is enough
+        self.exact = bool(np.all((self.weight == 0.0) | (self.weight == 1.0)))
+        self.nearest = np.where(self.weight == 1.0, self.upper, self.lower)
+        for array in (self.source_freqs, self.target_freqs, self.lower, self.upper, self.weight, self.nearest):
+            array.setflags(write=False)
+
+    def __len__(self):
+        return len(self.target_freqs)
+
+    def apply(self, values, axis=-3, out=None):
+        """Interpolates `values`, whose frequency axis is `axis` (by default the layout `(..., N, 2, 2)`).
+
+        Returns an array with the frequency axis replaced by the target grid,
+        written to `out` if given.
+        """
+        values = np.asarray(values)
+        axis = axis % values.ndim
+        if values.shape[axis] != len(self.source_freqs):
+            raise ValueError(f"values have {values.shape[axis]} points along axis {axis}, but the source grid "
+                             f"has {len(self.source_freqs)}")
+        if not np.issubdtype(values.dtype, np.inexact):
+            values = values.astype(np.float64)
+        result = np.take(values, self.nearest if self.exact else self.lower, axis=axis)
+        if not self.exact:
+            shape = [1] * values.ndim
+            shape[axis] = len(self.weight)
+            weight = self.weight.reshape(shape)
+            upper = np.take(values, self.upper, axis=axis)
+            # result = y0 + w * (y1 - y0), in place
+            upper -= result
+            upper *= weight
+            result += upper
+        if out is None:
+            return result
+        out[...] = result
+        return out
+
+
+class RegridEngine:
+    """Re-grids sweeps and error terms, with an LRU cache of `maxsize` interpolation plans.
+
+    Plans are keyed by the contents of the source and target frequency
+    arrays, so grids can be passed as new arrays each time. `hits` and
+    `misses` count lookups.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._plans = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._plans)
+
+    def plan(self, source_freqs, target_freqs):
+        """Returns the (cached) plan for interpolating from `source_freqs` onto `target_freqs`."""
+        source_freqs = np.ascontiguousarray(source_freqs, dtype=np.float64)
+        target_freqs = np.ascontiguousarray(target_freqs, dtype=np.float64)
+        key = (_grid_key(source_freqs), _grid_key(target_freqs))
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+        plan = InterpolationPlan(source_freqs, target_freqs)
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+        return plan
+
+    def regrid(self, source_freqs, target_freqs, values, axis=-3, out=None):
+        """Interpolates sweeps (by default `(..., N, 2, 2)`) from `source_freqs` onto `target_freqs`."""
+        return self.plan(source_freqs, target_freqs).apply(values, axis, out)
+
+    def regrid_result(self, result, target_freqs):
+        """Returns a `SweepResult` re-gridded onto `target_freqs`."""
+        from .sweep_result import SweepResult
+
+        return SweepResult(target_freqs, self.regrid(result.freqs, target_freqs, result.s))
+
+    def interpolate_error_terms(self, source_freqs, target_freqs, terms):
+        """Interpolates 12-term error terms onto `target_freqs`.
+
+        `terms` is either a dict of the names in `ERROR_TERMS` to `(N,)` complex
+        arrays, or an array of shape `(..., 12, N)` in the order of
+        `ERROR_TERMS`; the result has the same form. All terms are
+        interpolated in one call.
+        """
+        if isinstance(terms, dict):
+            missing = [name for name in ERROR_TERMS if name not in terms]
+            if missing:
+                raise ValueError(f"Missing error terms: {', '.join(missing)}")
+            stacked = np.stack([np.asarray(terms[name]) for name in ERROR_TERMS])
+            interpolated = self.regrid(source_freqs, target_freqs, stacked, axis=-1)
+            return dict(zip(ERROR_TERMS, interpolated))
+        terms = np.asarray(terms)
+        if terms.ndim < 2 or terms.shape[-2] != len(ERROR_TERMS):
+            raise ValueError(f"Expected error terms of shape (..., {len(ERROR_TERMS)}, N), got {terms.shape}")
+        return self.regrid(source_freqs, target_freqs, terms, axis=-1)
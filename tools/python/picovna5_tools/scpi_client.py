@@ -0,0 +1,215 @@
+"""
+scpi_client
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+A reusable SCPI client for the PicoVNA 5 software that retrieves trace data in
+the default binary format.
+
+The SCPI examples switch the software to `FORMAT ASCII` and parse every value
+as text, which dominates the retrieval time for long sweeps. This client leaves
+the software in its default binary format, where each trace is returned as an
+IEEE 488.2 definite-length block (`#<n><length><bytes>`), and reads the block
+straight into a NumPy array without parsing individual values.
+
+NOTE: SCPI is an interface for remotely controlling the PicoVNA 5 software. Therefore, please ensure that
+the PicoVNA 5 software is running before using this client.
+"""
+
+import time
+from collections import namedtuple
+
+import numpy as np
+import pyvisa
+
+from .sweep_result import S_MATRIX_INDEX
+
+
+DEFAULT_ADDRESS = "TCPIP::127.0.0.1::5025::SOCKET"
+
+TERMINATION = "\n"
+
+S_PARAMETERS = ("S11", "S21", "S12", "S22")
+
+SWEEP_QUERIES = ("SENSE:FREQUENCY:START?", "SENSE:FREQUENCY:STOP?", "SENSE:SWEEP:POINTS?")
+
+# Unit suffixes of frequency replies (matched without regard to case), as multiples of 1 Hz
+FREQUENCY_UNITS = {"HZ": 1.0, "KHZ": 1e3, "MHZ": 1e6, "GHZ": 1e9}
+
+# Result of a pipelined fetch. `s` is a list of (N, 2, 2) complex128 arrays, one per
+# memory channel requested. `timing` holds the latency breakdown in seconds:
+#   write          -- sending every command in a single write
+#   first_response -- waiting for the first response to arrive
+#   transfer       -- reading the remaining responses
+#   assemble       -- building the S-matrices
+#   total          -- the whole call
+# together with `round_trips` (always 1) and `commands`, the number of commands sent.
+PipelinedFetch = namedtuple("PipelinedFetch", ["freqs", "s", "timing"])
+
+
+def parse_frequency(reply):
+    """Returns the frequency in Hz of a reply such as `"300 MHz"`; a reply without a unit is taken to be in Hz."""
+    fields = reply.split()
+    if not 1 <= len(fields) <= 2 or (len(fields) == 2 and fields[1].upper() not in FREQUENCY_UNITS):
+        raise ValueError(f"Unexpected frequency reply {reply!r}")
+    scale = FREQUENCY_UNITS[fields[1].upper()] if len(fields) == 2 else 1.0
+    return float(fields[0]) * scale
+
+
+class ScpiClient:
+    """Wraps a pyvisa message-based session to the PicoVNA 5 SCPI endpoint.
+
+    `binary` selects how trace data is transferred. With `binary=True` (the
+    default) the software's default binary format is kept; `datatype` and
+    `is_big_endian` describe the values in each block, using `struct` codes.
+    With `binary=False` the session is switched to `FORMAT ASCII`, which is
+    mainly useful for comparison.
+    """
+
+    def __init__(self, resource, binary=True, datatype="d", is_big_endian=False):
+        self.resource = resource
+        self.resource.read_termination = TERMINATION
+        self.resource.write_termination = TERMINATION
+        self.dtype = np.dtype((">" if is_big_endian else "<") + datatype)
+        self.binary = True
+        if not binary:
+            self.set_format("ASCII")
+
+    @classmethod
+    def open(cls, address=DEFAULT_ADDRESS, resource_manager=None, **kwargs):
+        """Opens a new session to `address` and wraps it."""
+        if resource_manager is None:
+            resource_manager = pyvisa.ResourceManager()
+        return cls(resource_manager.open_resource(address), **kwargs)
+
+    def close(self):
+        self.resource.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def query(self, command):
+        return self.resource.query(command)
+
+    def identify(self):
+        return self.query("*IDN?")
+
+    def set_format(self, fmt):
+        """Sets the trace transfer format: "ASCII", or "REAL" for the binary default."""
+        self.query(f"FORMAT {fmt}")
+        self.binary = fmt.upper() != "ASCII"
+
+    def start_sweep(self):
+        self.query("INIT")
+
+    @staticmethod
+    def trace_command(parameter, fmt, memory_channel=None):
+        """Builds a `CALC:DATA` query, e.g. `CALC:DATA:MEM1 S21,REAL`."""
+        prefix = "CALC:DATA" if memory_channel is None else f"CALC:DATA:MEM{memory_channel}"
+        return f"{prefix} {parameter},{fmt}"
+
+    def read_block(self):
+        """Reads one IEEE 488.2 definite-length block into an array, without copying.
+
+        The termination character is disabled while the block is read: binary
+        data may contain newline bytes, and stopping the read at each of them
+        makes the transfer many times slower.
+        """
+        resource = self.resource
+        resource.read_termination = None
+        try:
+            header = resource.read_bytes(2)
+            if header[:1] != b"#" or header[1:2] == b"0":
+                raise ValueError(f"Expected a definite-length binary block, got {bytes(header)!r}")
+            length = int(resource.read_bytes(int(header[1:2])))
+            payload = resource.read_bytes(length + len(TERMINATION))
+        finally:
+            resource.read_termination = TERMINATION
+        return np.frombuffer(payload, dtype=self.dtype, count=length // self.dtype.itemsize)
+
+    def read_values(self):
+        """Reads one trace response that has already been requested with `write()`."""
+        if self.binary:
+            return self.read_block()
+        return self.resource.read_ascii_values(container=np.array)
+
+    def trace(self, parameter, fmt="LOGMAG", memory_channel=None):
+        """Returns one trace (e.g. `trace("S21", "PHASE")`) as a float64 array.
+
+        If `memory_channel` is given the trace is read from that memory channel
+        instead of the live measurement.
+        """
+        self.resource.write(self.trace_command(parameter, fmt, memory_channel))
+        return self.read_values()
+
+    def write_many(self, commands):
+        """Sends several commands back-to-back in one write, without waiting for responses.
+
+        The responses must then be read in order, one per command.
+        """
+        termination = self.resource.write_termination
+        self.resource.write_raw((termination.join(commands) + termination).encode())
+
+    def fetch_s_matrices(self, memory_channels=(None,)):
+        """Retrieves the full complex S-matrix of several memory channels in one round trip.
+
+        The sweep frequency queries and the REAL/IMAG queries for all four
+        S-parameters of every channel are written back-to-back, and the
+        responses are read in order, so the cost is a single round trip however
+        many channels are requested. Use `None` for the live measurement.
+        Returns a `PipelinedFetch`.
+        """
+        trace_commands = [
+            self.trace_command(parameter, fmt, channel)
+            for channel in memory_channels
+            for parameter in S_PARAMETERS
+            for fmt in ("REAL", "IMAG")
+        ]
+        commands = list(SWEEP_QUERIES) + trace_commands
+
+        t0 = time.perf_counter()
+        self.write_many(commands)
+        t1 = time.perf_counter()
+        start_hz = parse_frequency(self.resource.read())
+        t2 = time.perf_counter()
+        stop_hz = parse_frequency(self.resource.read())
+        num_points = int(self.resource.read().split(" ")[0])
+        traces = [self.read_values() for _ in trace_commands]
+        t3 = time.perf_counter()
+
+        matrices = []
+        for c in range(len(memory_channels)):
+            s = np.empty((num_points, 2, 2), dtype=np.complex128)
+            for p, parameter in enumerate(S_PARAMETERS):
+                m, n = S_MATRIX_INDEX[parameter]
+                s.real[:, m, n] = traces[8 * c + 2 * p]
+                s.imag[:, m, n] = traces[8 * c + 2 * p + 1]
+            matrices.append(s)
+        freqs = np.linspace(start_hz, stop_hz, num_points)
+        t4 = time.perf_counter()
+
+        timing = {
+            "write": t1 - t0,
+            "first_response": t2 - t1,
+            "transfer": t3 - t2,
+            "assemble": t4 - t3,
+            "total": t4 - t0,
+            "round_trips": 1,
+            "commands": len(commands),
+        }
+        return PipelinedFetch(freqs, matrices, timing)
+
+    def fetch_s_matrix(self, memory_channel=None):
+        """Retrieves `(freqs, s)` for one memory channel (or the live measurement) in one round trip."""
+        result = self.fetch_s_matrices((memory_channel,))
+        return result.freqs, result.s[0]
+
+    def sweep_frequencies(self):
+        """Returns the frequency grid of the current sweep, in Hz."""
+        start_hz = parse_frequency(self.query("SENSE:FREQUENCY:START?"))
+        stop_hz = parse_frequency(self.query("SENSE:FREQUENCY:STOP?"))
+        num_points = int(self.query("SENSE:SWEEP:POINTS?").split(" ")[0])
+        return np.linspace(start_hz, stop_hz, num_points)
@@ -0,0 +1,398 @@
+"""
+scpi_emulator
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+A self-contained emulator of the PicoVNA 5 SCPI socket endpoint, for testing
+and load-testing SCPI clients without the PicoVNA 5 software.
+
+The emulator serves the commands used by the SCPI examples:
+`*IDN?`, `FORMAT ASCII/REAL`, `INIT`, `CALC:DATA`, `CALC:DATA:MEM<n>`,
+`SENSE:FREQUENCY:START?`, `SENSE:FREQUENCY:STOP?`, `SENSE:SWEEP:POINTS?`,
+`MMEM:CD`, `MMEM:APPLY:CAL`, `MMEMory:STORe:TRACe` and the
+`MMEMory:STORe:TRACe:OPTion` settings. Long and short mnemonic forms are
+accepted in any case. Every command receives exactly one response line.
+
+The live measurement and the memory channels hold either synthetic networks
+or networks loaded from Touchstone files. `INIT` returns immediately and
+starts a sweep lasting `sweep_time_s`; queries for live data wait until the
+sweep has finished, as with the real software. Commands that arrive together
+are answered together after a single optional `latency_s` delay, which
+emulates the network round-trip time of a remote connection.
+
+The trace format (`FORMAT`), working directory (`MMEM:CD`) and Touchstone
+export options are kept per connection. Binary responses are IEEE 488.2
+definite-length blocks of little-endian 64-bit floats.
+
+Clients are served concurrently by an asyncio server. Use `ScpiEmulator` as a
+context manager to run it on a background thread within another program, or
+run this module as a script:
+
+python3 -m picovna5_tools.scpi_emulator --port 5025 --memory 0=bpf_ideal.s2p --memory 1=atten_ideal.s2p
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+from .touchstone import read_touchstone, write_touchstone
+
+
+S_PARAMETERS = ("S11", "S21", "S12", "S22")
+
+IDENTITY = "Pico Technology,PicoVNA 5 (emulator),0,0.0"
+
+# (short form, long form) of the SCPI mnemonics understood by the emulator
+MNEMONICS = (
+    ("CALC", "CALCULATE"), ("FORM", "FORMAT"), ("FREQ", "FREQUENCY"), ("INIT", "INITIATE"),
+    ("MEM", "MEMORY"), ("MMEM", "MMEMORY"), ("OPT", "OPTION"), ("POIN", "POINTS"), ("SENS", "SENSE"),
+    ("STAR", "START"), ("STOR", "STORE"), ("SWE", "SWEEP"), ("TRAC", "TRACE"),
+)
+
+# Touchstone export data formats accepted by MMEMory:STORe:TRACe:OPTion:TOUCHSTONEDATAFORMAT
+EXPORT_FORMATS = {"RI": "RI", "REALIMAG": "RI", "MA": "MA", "MAGANG": "MA", "DB": "DB", "DBANG": "DB"}
+
+
+def synthetic_network(freqs_hz):
+    """Returns an `(N, 2, 2)` complex S-matrix for a lossy, slightly mismatched line."""
+    freqs_hz = np.asarray(freqs_hz, dtype=np.float64)
+    delay = np.exp(-2j * np.pi * freqs_hz * 1.5e-9)
+    s = np.empty((len(freqs_hz), 2, 2), dtype=np.complex128)
+    s[:, 0, 0] = 0.05 * delay * delay
+    s[:, 1, 1] = 0.04 * delay * delay
+    s[:, 1, 0] = 0.9 * delay * np.exp(-freqs_hz / 2e10)
+    s[:, 0, 1] = s[:, 1, 0]
+    return s
+
+
+def format_trace(s, fmt):
+    """Converts one complex S-parameter trace to the named SCPI trace format."""
+    fmt = fmt.upper()
+    if fmt == "LOGMAG":
+        return 20 * np.log10(np.abs(s))
+    if fmt == "PHASE":
+        return np.degrees(np.angle(s))
+    if fmt == "REAL":
+        return s.real.copy()
+    if fmt == "IMAG":
+        return s.imag.copy()
+    raise ValueError(f"Unsupported trace format: {fmt}")
+
+
+def encode_block(values):
+    """Encodes an array as an IEEE 488.2 definite-length block of little-endian doubles."""
+    payload = np.ascontiguousarray(values, dtype="<f8").tobytes()
+    length = str(len(payload)).encode()
+    return b"#" + str(len(length)).encode() + length + payload
+
+
+def encode_ascii(values):
+    """Encodes an array as comma-separated text, as returned after `FORMAT ASCII`."""
+    return ",".join(repr(v) for v in np.asarray(values, dtype=np.float64).tolist()).encode()
+
+
+def short_mnemonic(token):
+    """Maps a mnemonic in short or long form (e.g. "Frequency", "FREQ") to its short form."""
+    match = re.fullmatch(r"([*A-Za-z]+)(\d*)(\??)", token)
+    if match is None:
+        return token.upper()
+    word, suffix, query = match.group(1).upper(), match.group(2), match.group(3)
+    for short, long in MNEMONICS:
+        if word.startswith(short) and long.startswith(word):
+            word = short
+            break
+    return word + suffix + query
+
+
+def normalise_header(header):
+    """Normalises a command header, e.g. "MMEMory:STORe:TRACe" -> "MMEM:STOR:TRAC"."""
+    return ":".join(short_mnemonic(token) for token in header.strip().lstrip(":").split(":"))
+
+
+def load_network(source, freqs):
+    """Returns `(freqs, s)` from a Touchstone path, a `(freqs, s)` pair, or synthetic data on `freqs`."""
+    if source is None:
+        return freqs, synthetic_network(freqs)
+    if isinstance(source, (str, os.PathLike)):
+        source_freqs, s, _ = read_touchstone(source)
+        return source_freqs, s
+    source_freqs, s = source
+    return np.asarray(source_freqs, dtype=np.float64), np.asarray(s, dtype=np.complex128)
+
+
+class _Session:
+    def __init__(self, cwd):
+        self.binary = True
+        self.cwd = cwd
+        self.export_format = "RI"
+        self.tabs = False
+        self.one_port_parameter = "S11"
+
+
+class ScpiEmulator:
+    """Emulated PicoVNA 5 SCPI endpoint.
+
+    `network` is the live measurement and `memory` maps memory channel numbers
+    to networks. Each network may be a Touchstone path, a `(freqs, s)` pair or
+    `None` for synthetic data. Without a live network, the live sweep is a
+    synthetic `num_points`-point sweep from `start_hz` to `stop_hz` (or uses the
+    frequency grid of memory channel 0, if loaded from a file).
+
+    `port=0` picks a free port; `address` gives the VISA resource string.
+    """
+
+    def __init__(self, network=None, memory=None, num_points=2001, start_hz=0.3e6, stop_hz=8.5e9,
+                 host="127.0.0.1", port=0, sweep_time_s=0.0, latency_s=0.0, cwd=None):
+        freqs = np.linspace(start_hz, stop_hz, num_points)
+        memory = dict(memory) if memory is not None else {0: None, 1: None}
+        self.memory = {}
+        for channel, source in memory.items():
+            self.memory[int(channel)] = load_network(source, freqs)
+        if network is None and isinstance(memory.get(0), (str, os.PathLike)):
+            freqs = self.memory[0][0]
+        self.freqs, self.s = load_network(network, freqs)
+        for channel, source in memory.items():
+            if source is None:
+                # give each synthetic memory channel different data so that mix-ups are visible
+                self.memory[int(channel)] = (self.freqs, self.s * (0.9 ** (int(channel) + 1)))
+
+        self.host = host
+        self.port = port
+        self.sweep_time_s = sweep_time_s
+        self.latency_s = latency_s
+        self.cwd = os.path.abspath(cwd or os.getcwd())
+        self.applied_calibration = None
+        self.sweeps = 0
+        self.commands = 0
+        self.connections = 0
+        self._sweep_done_at = 0.0
+        self._cache = {}
+        self._loop = None
+        self._server = None
+        self._thread = None
+
+    @property
+    def address(self):
+        return f"TCPIP::{self.host}::{self.port}::SOCKET"
+
+    #### Running the server
+    ###########################################################################
+
+    async def serve(self):
+        """Starts serving on the current event loop."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    def start(self):
+        """Runs the emulator on a background thread, returning once it is accepting connections.
+
+        Raises the error if the server cannot be started (for example, if the
+        port is in use).
+        """
+        ready = threading.Event()
+        failure = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(self.serve())
+            except BaseException as e:
+                failure.append(e)
+                self._loop.close()
+                return
+            finally:
+                ready.set()
+            self._loop.run_forever()
+            self._server.close()
+            # drop connections that clients left open
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self._loop.run_until_complete(asyncio.wait(tasks))
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="scpi-emulator", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failure:
+            self._thread.join()
+            self._thread = None
+            raise failure[0]
+        return self
+
+    def stop(self):
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    async def _handle_connection(self, reader, writer):
+        self.connections += 1
+        session = _Session(self.cwd)
+        pending = b""
+        try:
+            while True:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    break
+                *lines, pending = (pending + chunk).split(b"\n")
+                commands = [c.decode(errors="replace").strip() for c in lines]
+                commands = [c for c in commands if c]
+                if not commands:
+                    continue
+                if self.latency_s:
+                    await asyncio.sleep(self.latency_s)
+                responses = [await self.handle_command(c, session) for c in commands]
+                writer.write(b"".join(r + b"\n" for r in responses))
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    #### Commands
+    ###########################################################################
+
+    async def _wait_for_sweep(self):
+        remaining = self._sweep_done_at - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    def _trace_response(self, channel, parameter, fmt, binary):
+        # the live and memory data never change, so each trace is encoded once however many sweeps are run
+        key = (channel, parameter, fmt, binary)
+        response = self._cache.get(key)
+        if response is None:
+            m, n = int(parameter[1]) - 1, int(parameter[2]) - 1
+            s = self.s if channel is None else self.memory[channel][1]
+            values = format_trace(s[:, m, n], fmt)
+            response = encode_block(values) if binary else encode_ascii(values)
+            self._cache[key] = response
+        return response
+
+    def _export_touchstone(self, args, session):
+        parts = [a.strip() for a in args.split(",")]
+        if len(parts) != 3:
+            return b"ERROR"
+        _, kind, filename = parts
+        num_ports = 1 if kind.upper() == "S1P" else 2
+        path = os.path.join(session.cwd, filename.strip("\"'"))
+        write_touchstone(path, self.freqs, self.s, num_ports=num_ports, fmt=session.export_format,
+                         tabs=session.tabs, one_port_parameter=session.one_port_parameter)
+        return b"OK"
+
+    async def handle_command(self, command, session):
+        """Returns the response bytes (without terminator) for a single command."""
+        self.commands += 1
+        header, _, args = command.strip().partition(" ")
+        header = normalise_header(header)
+        args = args.strip()
+
+        try:
+            if header == "*IDN?":
+                return IDENTITY.encode()
+            if header == "FORM":
+                session.binary = args.upper() != "ASCII"
+                return b"OK"
+            if header == "INIT":
+                await self._wait_for_sweep()
+                self.sweeps += 1
+                self._sweep_done_at = time.monotonic() + self.sweep_time_s
+                return b"OK"
+            if header == "SENS:FREQ:STAR?":
+                await self._wait_for_sweep()
+                return f"{self.freqs[0]} Hz".encode()
+            if header == "SENS:FREQ:STOP?":
+                await self._wait_for_sweep()
+                return f"{self.freqs[-1]} Hz".encode()
+            if header == "SENS:SWE:POIN?":
+                await self._wait_for_sweep()
+                return str(len(self.freqs)).encode()
+            if header == "CALC:DATA" or header.startswith("CALC:DATA:MEM"):
+                channel = None
+                if header != "CALC:DATA":
+                    channel = int(header[len("CALC:DATA:MEM"):] or 0)
+                    if channel not in self.memory:
+                        return b"ERROR"
+                else:
+                    await self._wait_for_sweep()
+                parameter, fmt = (a.strip().upper() for a in args.split(","))
+                if parameter not in S_PARAMETERS:
+                    return b"ERROR"
+                return self._trace_response(channel, parameter, fmt, session.binary)
+            if header == "MMEM:CD":
+                path = os.path.join(session.cwd, args.strip("\"'"))
+                if not os.path.isdir(path):
+                    return b"ERROR"
+                session.cwd = os.path.abspath(path)
+                return b"OK"
+            if header == "MMEM:APPLY:CAL":
+                self.applied_calibration = os.path.join(session.cwd, args.strip("\"'"))
+                return b"OK"
+            if header == "MMEM:STOR:TRAC":
+                await self._wait_for_sweep()
+                return self._export_touchstone(args, session)
+            if header == "MMEM:STOR:TRAC:OPT:TOUCHSTONEDATAFORMAT":
+                session.export_format = EXPORT_FORMATS[args.upper()]
+                return b"OK"
+            if header == "MMEM:STOR:TRAC:OPT:TABS":
+                session.tabs = args.upper() in ("1", "ON", "TRUE")
+                return b"OK"
+            if header == "MMEM:STOR:TRAC:OPT:NUMPORTS":
+                # the number of ports is taken from the file type given to MMEMory:STORe:TRACe
+                int(args)
+                return b"OK"
+            if header == "MMEM:STOR:TRAC:OPT:ONEPORTPARAMETER":
+                session.one_port_parameter = args.upper()
+                return b"OK"
+        except Exception:
+            # any failure is reported to the client, as the software does, rather than closing the connection
+            return b"ERROR"
+        return b"ERROR"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Emulates the PicoVNA 5 SCPI endpoint.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5025)
+    parser.add_argument("--points", type=int, default=2001, help="points in the synthetic live sweep")
+    parser.add_argument("--live", help="Touchstone file to use as the live measurement")
+    parser.add_argument("--memory", action="append", default=[], metavar="N=FILE",
+                        help="load a Touchstone file into memory channel N (may be repeated)")
+    parser.add_argument("--sweep-time", type=float, default=0.0, help="duration of each sweep, in seconds")
+    parser.add_argument("--latency", type=float, default=0.0, help="emulated round-trip time, in seconds")
+    args = parser.parse_args()
+
+    memory = None
+    if args.memory:
+        memory = {int(n): path for n, path in (item.split("=", 1) for item in args.memory)}
+    emulator = ScpiEmulator(network=args.live, memory=memory, num_points=args.points, host=args.host,
+                            port=args.port, sweep_time_s=args.sweep_time, latency_s=args.latency)
+
+    async def run():
+        await emulator.serve()
+        print(f"Emulating PicoVNA 5 SCPI on {emulator.address}")
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""
+scpi_pool
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+A pool of persistent SCPI sessions to the PicoVNA 5 software, shared between
+threads.
+
+Opening a session (creating a `pyvisa.ResourceManager`, connecting the socket,
+setting terminations and `FORMAT`) costs far more than a typical query, and
+`import_data()` in scpi/python/video_example_1/demo.py pays it on every call.
+`ScpiPool` keeps sessions open and configured, and leases each one to a
+single thread at a time:
+
+    pool = ScpiPool(size=4)
+    with pool.lease() as client:
+        result = client.fetch_s_matrices([0])
+
+Sessions are configured once, when they are opened. A session that has been
+idle for longer than `health_check_interval_s` is checked with `*IDN?` before
+it is leased, and replaced if the check fails. A session is also discarded
+(rather than returned to the pool) if an exception escapes the `with` block,
+because it may have unread responses.
+"""
+
+import contextlib
+import threading
+import time
+
+import pyvisa
+
+from .scpi_client import DEFAULT_ADDRESS, ScpiClient
+
+
+class PoolExhausted(Exception):
+    """Raised when no session becomes free within the lease timeout."""
+
+
+class ScpiPool:
+    """Thread-safe pool of up to `size` `ScpiClient` sessions to `address`.
+
+    `binary` selects the transfer format that each session is configured with.
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, size=4, resource_manager=None, binary=True,
+                 health_check_interval_s=30.0, timeout_s=10.0):
+        self.address = address
+        self.size = size
+        self.binary = binary
+        self.health_check_interval_s = health_check_interval_s
+        self.timeout_s = timeout_s
+        self.resource_manager = resource_manager if resource_manager is not None else pyvisa.ResourceManager()
+        # idle (client, idle_since) pairs, most recently returned last
+        self._idle = []
+        self._lock = threading.Lock()
+        # notified when a session is returned or discarded, or the pool is closed
+        self._available = threading.Condition(self._lock)
+        self._open_count = 0
+        self._closed = False
+
+        self.sessions_opened = 0
+        self.sessions_discarded = 0
+        self.health_checks = 0
+        self.leases = 0
+
+    def _open_session(self):
+        client = ScpiClient.open(self.address, self.resource_manager)
+        try:
+            client.set_format("REAL" if self.binary else "ASCII")
+        except Exception:
+            client.close()
+            raise
+        with self._lock:
+            self.sessions_opened += 1
+        return client
+
+    def _discard(self, client):
+        with self._available:
+            self._open_count -= 1
+            self.sessions_discarded += 1
+            self._available.notify()
+        try:
+            client.close()
+        except Exception:
+            pass
+
+    def _healthy(self, client):
+        with self._lock:
+            self.health_checks += 1
+        try:
+            client.identify()
+            return True
+        except Exception:
+            return False
+
+    def _release(self, client):
+        with self._available:
+            if not self._closed:
+                self._idle.append((client, time.monotonic()))
+                self._available.notify()
+                return
+        self._discard(client)
+
+    def _acquire(self, timeout_s):
+        deadline = time.monotonic() + timeout_s
+        while True:
+            with self._available:
+                # wait for an idle session, or for room to open a new one
+                while True:
+                    if self._closed:
+                        raise RuntimeError("The pool has been closed.")
+                    if self._idle:
+                        client, idle_since = self._idle.pop()
+                        break
+                    if self._open_count < self.size:
+                        self._open_count += 1
+                        client = None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolExhausted(f"No SCPI session became free within {timeout_s} s.")
+                    self._available.wait(remaining)
+
+            if client is None:
+                try:
+                    return self._open_session()
+                except Exception:
+                    with self._available:
+                        self._open_count -= 1
+                        self._available.notify()
+                    raise
+            if time.monotonic() - idle_since < self.health_check_interval_s or self._healthy(client):
+                return client
+            self._discard(client)
+
+    @contextlib.contextmanager
+    def lease(self, timeout_s=None):
+        """Leases a session to the calling thread for the duration of a `with` block."""
+        client = self._acquire(self.timeout_s if timeout_s is None else timeout_s)
+        with self._lock:
+            self.leases += 1
+        try:
+            yield client
+        except BaseException:
+            self._discard(client)
+            raise
+        self._release(client)
+
+    def warm_up(self, count=None):
+        """Opens sessions up front so that the first leases do not pay the connection cost."""
+        clients = []
+        for _ in range(self.size if count is None else min(count, self.size)):
+            clients.append(self._acquire(self.timeout_s))
+        for client in clients:
+            self._release(client)
+
+    def close(self):
+        """Closes every idle session; sessions currently leased are closed when they are returned."""
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._available.notify_all()
+        for client, _ in idle:
+            self._discard(client)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def stats(self):
+        return {
+            "size": self.size,
+            "open": self._open_count,
+            "idle": len(self._idle),
+            "leases": self.leases,
+            "sessions_opened": self.sessions_opened,
+            "sessions_discarded": self.sessions_discarded,
+            "health_checks": self.health_checks,
+        }
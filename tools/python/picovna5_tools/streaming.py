@@ -0,0 +1,240 @@
+"""
+streaming
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+A threaded pipeline for processing the points of an asynchronous sweep while
+the instrument is still measuring.
+
+In the examples, the loop that calls `sweep.getNextPoint()` also prints each
+point, so any slow processing delays draining points from the device.
+`StreamingPipeline` drains `getNextPoint()` on a dedicated producer thread into
+a bounded `RingBuffer`. Each consumer stage (for example: convert, write,
+publish) runs on its own thread and is connected to the next by another
+buffer, so all stages run concurrently. The producer only ever waits when its
+buffer is full, and each buffer records backpressure statistics.
+
+A stage is any callable taking one item and returning the item to pass on to
+the next stage. Returning `None` drops the item.
+"""
+
+import collections
+import threading
+import time
+
+import numpy as np
+
+from .sweep_result import SweepResult
+
+
+class PipelineAborted(Exception):
+    """Raised inside pipeline threads when another stage has failed."""
+
+
+class RingBuffer:
+    """Bounded, thread-safe FIFO connecting two pipeline threads.
+
+    `put()` returns immediately unless the buffer holds `capacity` items, in
+    which case it waits for the consumer (backpressure). `get()` waits while
+    the buffer is empty and returns `RingBuffer.CLOSED` once the producer has
+    called `close()` and every item has been consumed.
+    """
+
+    CLOSED = object()
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._items = collections.deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+        self._aborted = False
+
+        self.items_in = 0
+        self.max_depth = 0
+        self.full_waits = 0
+        self.producer_wait_s = 0.0
+        self.consumer_wait_s = 0.0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def put(self, item):
+        with self._lock:
+            if len(self._items) >= self.capacity:
+                self.full_waits += 1
+                start = time.perf_counter()
+                while len(self._items) >= self.capacity and not self._aborted:
+                    self._not_full.wait()
+                self.producer_wait_s += time.perf_counter() - start
+            if self._aborted:
+                raise PipelineAborted()
+            self._items.append(item)
+            self.items_in += 1
+            self.max_depth = max(self.max_depth, len(self._items))
+            self._not_empty.notify()
+
+    def get(self):
+        with self._lock:
+            if not self._items and not self._closed:
+                start = time.perf_counter()
+                while not self._items and not self._closed and not self._aborted:
+                    self._not_empty.wait()
+                self.consumer_wait_s += time.perf_counter() - start
+            if self._aborted:
+                raise PipelineAborted()
+            if not self._items:
+                return RingBuffer.CLOSED
+            item = self._items.popleft()
+            self._not_full.notify()
+            return item
+
+    def close(self):
+        """Marks the end of the stream; consumers drain the remaining items."""
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+
+    def abort(self):
+        """Wakes and stops both ends immediately, discarding buffered items."""
+        with self._lock:
+            self._aborted = True
+            self._items.clear()
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "capacity": self.capacity,
+                "items": self.items_in,
+                "depth": len(self._items),
+                "max_depth": self.max_depth,
+                "full_waits": self.full_waits,
+                "producer_wait_s": self.producer_wait_s,
+                "consumer_wait_s": self.consumer_wait_s,
+            }
+
+
+class StreamingPipeline:
+    """Drains an asynchronous sweep on a producer thread and feeds it through concurrent stages.
+
+    `sweep` is the object returned by `instrument.startMeasurement(mc)` (anything
+    with `hasMorePoints()` and `getNextPoint()`). `stages` is a list of callables,
+    and `capacity` is the size of each buffer between threads.
+    """
+
+    def __init__(self, sweep, stages, capacity=1024):
+        self.sweep = sweep
+        self.stages = list(stages)
+        self.buffers = [RingBuffer(capacity) for _ in self.stages]
+        self.error = None
+        self.first_point_s = None
+        self.last_point_s = None
+        self._threads = []
+        self._error_lock = threading.Lock()
+
+    def start(self):
+        self._threads = [threading.Thread(target=self._produce, name="sweep-producer", daemon=True)]
+        for i, stage in enumerate(self.stages):
+            output = self.buffers[i + 1] if i + 1 < len(self.buffers) else None
+            self._threads.append(threading.Thread(
+                target=self._consume, args=(stage, self.buffers[i], output), name=f"sweep-stage-{i}", daemon=True
+            ))
+        self.start_s = time.perf_counter()
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def join(self):
+        """Waits for every stage to finish, re-raising the first error from any thread."""
+        for thread in self._threads:
+            thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def run(self):
+        """Runs the pipeline to completion and returns its statistics."""
+        self.start()
+        self.join()
+        return self.stats()
+
+    def stats(self):
+        """Returns drain timing and the statistics of each buffer (buffer i feeds stage i)."""
+        stats = {"buffers": [b.stats() for b in self.buffers]}
+        if self.first_point_s is not None and self.last_point_s is not None:
+            stats["first_point_s"] = self.first_point_s - self.start_s
+            stats["drain_s"] = self.last_point_s - self.start_s
+        return stats
+
+    def _fail(self, error):
+        with self._error_lock:
+            if self.error is None:
+                self.error = error
+        for buffer in self.buffers:
+            buffer.abort()
+
+    def _produce(self):
+        output = self.buffers[0] if self.buffers else None
+        try:
+            while self.sweep.hasMorePoints():
+                pt = self.sweep.getNextPoint()
+                self.last_point_s = time.perf_counter()
+                if self.first_point_s is None:
+                    self.first_point_s = self.last_point_s
+                if output is not None:
+                    output.put(pt)
+            if output is not None:
+                output.close()
+        except PipelineAborted:
+            pass
+        except Exception as e:
+            self._fail(e)
+
+    def _consume(self, stage, source, output):
+        try:
+            while True:
+                item = source.get()
+                if item is RingBuffer.CLOSED:
+                    break
+                item = stage(item)
+                if item is not None and output is not None:
+                    output.put(item)
+            if output is not None:
+                output.close()
+        except PipelineAborted:
+            pass
+        except Exception as e:
+            self._fail(e)
+
+
+def convert_point(pt):
+    """Stage converting a point object to a `(frequency, s11, s12, s21, s22)` tuple."""
+    return (pt.measurementFrequencyHz, pt.s11, pt.s12, pt.s21, pt.s22)
+
+
+class ArrayCollector:
+    """Stage that stores converted points in preallocated arrays.
+
+    Use after `convert_point`. Once the pipeline has finished, `result()` returns
+    the collected points as a `SweepResult`. The item is passed on unchanged.
+    """
+
+    def __init__(self, num_points):
+        self.freqs = np.empty(num_points, dtype=np.float64)
+        self.s = np.empty((num_points, 2, 2), dtype=np.complex128)
+        self.count = 0
+
+    def __call__(self, row):
+        i = self.count
+        self.freqs[i] = row[0]
+        self.s[i].flat = row[1:]
+        self.count = i + 1
+        return row
+
+    def result(self):
+        return SweepResult(self.freqs[:self.count], self.s[:self.count])
@@ -0,0 +1,442 @@
+"""
+sweep_archive
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+An append-only, memory-mappable archive for logging large numbers of sweeps.
+
+An archive is a directory of flat files:
+
+    meta.json        format version and block size
+    records.bin      one fixed-size record per sweep (`RECORD_DTYPE`)
+    data.bin         the `(N, 2, 2)` complex128 data of every sweep, back to back
+    grids.bin        each distinct frequency grid, stored once
+    grid_table.bin   (offset, length) of each grid in grids.bin
+    strings.txt      calibration IDs and device serial numbers, one per line
+    time_index.bin   (min, max) timestamp of each block of `block_size` records
+
+Records have a fixed size, so sweep `i` is found in O(1) time, and sweeps
+stored without compression are returned as read-only views of the memory-mapped
+data file. Time-range queries only read the timestamps of the blocks whose
+(min, max) range overlaps the query, so they stay fast for millions of sweeps
+as long as sweeps are appended in roughly time order.
+
+Sweep data can be compressed with zlib or lzma, optionally after shuffling the
+bytes of each value so that similar bytes are adjacent, which helps compression
+of floating-point data. The compression settings are stored per record, so they
+may be changed whenever the archive is reopened.
+
+Data is flushed to the file before the record that refers to it is written.
+When an archive is reopened after a crash, a partial record, any record whose
+data did not reach the file, and any data without a record are discarded, as
+is a partial grid table entry.
+"""
+
+import json
+import lzma
+import os
+import threading
+import time
+import zlib
+from collections import namedtuple
+
+import numpy as np
+
+from .sweep_result import SweepResult
+
+
+FORMAT_NAME = "picovna5-sweep-archive"
+FORMAT_VERSION = 1
+
+RECORD_DTYPE = np.dtype([
+    ("timestamp_ns", "<i8"),
+    ("data_offset", "<u8"),
+    ("data_bytes", "<u8"),
+    ("grid", "<u4"),
+    ("num_points", "<u4"),
+    ("calibration", "<u4"),
+    ("serial", "<u4"),
+    ("codec", "u1"),
+    ("reserved", "u1", (7,)),
+])
+
+NO_STRING = 0xFFFFFFFF
+
+CODECS = {None: 0, "zlib": 1, "lzma": 2}
+SHUFFLE_FLAG = 0x80
+
+DATA_DTYPE = np.dtype("<c16")
+GRID_DTYPE = np.dtype("<f8")
+
+ArchivedSweep = namedtuple("ArchivedSweep", ["freqs", "s", "timestamp_ns", "calibration", "serial"])
+
+
+def shuffle_bytes(payload, itemsize=8):
+    """Groups byte k of every `itemsize`-byte value together."""
+    return np.frombuffer(payload, dtype=np.uint8).reshape(-1, itemsize).T.tobytes()
+
+
+def unshuffle_bytes(payload, itemsize=8):
+    return np.frombuffer(payload, dtype=np.uint8).reshape(itemsize, -1).T.tobytes()
+
+
+def encode_data(s, compression=None, level=6, shuffle=True):
+    """Encodes an `(N, 2, 2)` complex S-matrix, returning `(codec, payload)`."""
+    payload = np.ascontiguousarray(s, dtype=DATA_DTYPE).tobytes()
+    codec = CODECS[compression]
+    if codec == 0:
+        return codec, payload
+    if shuffle:
+        payload = shuffle_bytes(payload)
+        codec |= SHUFFLE_FLAG
+    if compression == "zlib":
+        return codec, zlib.compress(payload, level)
+    return codec, lzma.compress(payload, preset=level)
+
+
+def decode_data(codec, payload, num_points):
+    base = codec & ~SHUFFLE_FLAG
+    if base == CODECS["zlib"]:
+        payload = zlib.decompress(payload)
+    elif base == CODECS["lzma"]:
+        payload = lzma.decompress(payload)
+    elif base != 0:
+        raise ValueError(f"Unknown sweep archive codec {codec}")
+    if codec & SHUFFLE_FLAG:
+        payload = unshuffle_bytes(payload)
+    return np.frombuffer(payload, dtype=DATA_DTYPE).reshape(num_points, 2, 2)
+
+
+class SweepArchive:
+    """Append-only archive of sweeps, stored in the directory `path`.
+
+    `mode` is "a" (create or append) or "r" (read only). `compression`
+    (`None`, "zlib" or "lzma"), `level` and `shuffle` apply to sweeps appended
+    by this instance. `block_size` is the number of records per time index
+    block and is fixed when the archive is created.
+
+    Appending is thread-safe. Appended sweeps are visible to readers in other
+    processes after `flush()`.
+    """
+
+    def __init__(self, path, mode="a", compression=None, level=6, shuffle=True, block_size=4096):
+        if mode not in ("a", "r"):
+            raise ValueError("mode must be 'a' or 'r'")
+        if compression not in CODECS:
+            raise ValueError(f"Unsupported compression {compression!r}; expected one of {list(CODECS)}")
+        self.path = path
+        self.mode = mode
+        self.compression = compression
+        self.level = level
+        self.shuffle = shuffle
+        self._lock = threading.RLock()
+
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get("format") != FORMAT_NAME or meta.get("version") != FORMAT_VERSION:
+                raise ValueError(f"{path} is not a version {FORMAT_VERSION} sweep archive")
+            self.block_size = meta["block_size"]
+        elif mode == "a":
+            os.makedirs(path, exist_ok=True)
+            self.block_size = block_size
+            with open(meta_path, "w") as f:
+                json.dump({"format": FORMAT_NAME, "version": FORMAT_VERSION, "block_size": block_size}, f)
+        else:
+            raise FileNotFoundError(f"No sweep archive at {path}")
+
+        file_mode = "a+b" if mode == "a" else "rb"
+        if mode == "a":
+            for name in ("records.bin", "data.bin", "grids.bin", "grid_table.bin", "strings.txt", "time_index.bin"):
+                open(os.path.join(path, name), "ab").close()
+        self._files = {name: open(os.path.join(path, name), file_mode)
+                       for name in ("records.bin", "data.bin", "grids.bin", "grid_table.bin", "time_index.bin")}
+
+        self._load()
+
+    #### Loading
+    ###########################################################################
+
+    def _file_size(self, name):
+        return os.fstat(self._files[name].fileno()).st_size
+
+    def _load(self):
+        # discard a partial record and any records whose data is not (all) in the data file, then any
+        # data written after the last remaining record; the data file is never extended
+        count = self._file_size("records.bin") // RECORD_DTYPE.itemsize
+        data_size = self._file_size("data.bin")
+        data_end = 0
+        if count:
+            records = np.memmap(self._files["records.bin"], dtype=RECORD_DTYPE, mode="r", shape=(count,))
+            # data is appended in record order, so the ends of the records' data only increase
+            ends = records["data_offset"] + records["data_bytes"]
+            count = int(np.searchsorted(ends, data_size, side="right"))
+            data_end = int(ends[count - 1]) if count else 0
+            del records, ends
+        if self.mode == "a":
+            self._files["records.bin"].truncate(count * RECORD_DTYPE.itemsize)
+            if data_end < data_size:
+                self._files["data.bin"].truncate(data_end)
+        self._count = count
+        self._data_end = data_end
+        self._records_map = None
+        self._data_map = None
+        records = self._records()
+
+        # discard a partial grid table entry, and any grid without an entry (grids are flushed before
+        # their entry is written)
+        table = np.fromfile(os.path.join(self.path, "grid_table.bin"), dtype="<u8")
+        table = table[:len(table) // 2 * 2].reshape(-1, 2)
+        grids_data = np.fromfile(os.path.join(self.path, "grids.bin"), dtype=GRID_DTYPE)
+        table = table[:int(np.searchsorted(table[:, 0] + table[:, 1] * GRID_DTYPE.itemsize, grids_data.nbytes,
+                                           side="right"))]
+        grids_end = int(table[-1, 0] + table[-1, 1] * GRID_DTYPE.itemsize) if len(table) else 0
+        if self.mode == "a":
+            self._files["grid_table.bin"].truncate(table.nbytes)
+            if grids_end < self._file_size("grids.bin"):
+                self._files["grids.bin"].truncate(grids_end)
+        self._grids = [grids_data[offset // GRID_DTYPE.itemsize:offset // GRID_DTYPE.itemsize + length]
+                       for offset, length in table.tolist()]
+        self._grid_ids = {grid.tobytes(): i for i, grid in enumerate(self._grids)}
+        self._grids_end = grids_end
+
+        with open(os.path.join(self.path, "strings.txt"), encoding="utf-8") as f:
+            self._strings = f.read().splitlines()
+        self._string_ids = {string: i for i, string in enumerate(self._strings)}
+
+        # rebuild any time index blocks missing after a crash
+        num_blocks = -(-count // self.block_size)
+        index = np.fromfile(os.path.join(self.path, "time_index.bin"), dtype="<i8")
+        index = index[:len(index) // 2 * 2].reshape(-1, 2)
+        index = list(map(tuple, index[:max(num_blocks - 1, 0)].tolist()))
+        timestamps = records["timestamp_ns"] if count else np.empty(0, dtype=np.int64)
+        for block in range(len(index), num_blocks):
+            block_timestamps = timestamps[block * self.block_size:(block + 1) * self.block_size]
+            index.append((int(block_timestamps.min()), int(block_timestamps.max())))
+        self._time_index = index
+        self._index_written = max(num_blocks - 1, 0)
+        if self.mode == "a":
+            self._write_time_index()
+
+    def _records(self):
+        """Returns a memory map of the record table, remapping it if records have been appended."""
+        if self._records_map is None or len(self._records_map) < self._count:
+            if self._count == 0:
+                return np.empty(0, dtype=RECORD_DTYPE)
+            self._records_map = np.memmap(self._files["records.bin"], dtype=RECORD_DTYPE, mode="r",
+                                          shape=(self._count,))
+        return self._records_map
+
+    def _data(self, end):
+        if self._data_map is None or len(self._data_map) < end:
+            self._data_map = np.memmap(self._files["data.bin"], dtype=np.uint8, mode="r", shape=(self._data_end,))
+        return self._data_map
+
+    #### Appending
+    ###########################################################################
+
+    def _string_id(self, string):
+        if string is None:
+            return NO_STRING
+        string = str(string)
+        if "\n" in string or "\r" in string:
+            raise ValueError("Calibration IDs and serial numbers cannot contain line breaks")
+        i = self._string_ids.get(string)
+        if i is None:
+            i = len(self._strings)
+            with open(os.path.join(self.path, "strings.txt"), "a", encoding="utf-8", newline="\n") as f:
+                f.write(string + "\n")
+            self._strings.append(string)
+            self._string_ids[string] = i
+        return i
+
+    def _grid_id(self, freqs):
+        key = freqs.tobytes()
+        i = self._grid_ids.get(key)
+        if i is None:
+            i = len(self._grids)
+            f = self._files["grids.bin"]
+            f.seek(0, os.SEEK_END)
+            f.write(key)
+            f.flush()
+            table = self._files["grid_table.bin"]
+            table.seek(0, os.SEEK_END)
+            table.write(np.array([self._grids_end, len(freqs)], dtype="<u8").tobytes())
+            table.flush()
+            self._grids_end += len(key)
+            self._grids.append(freqs.copy())
+            self._grid_ids[key] = i
+        return i
+
+    def append(self, freqs, s, timestamp_ns=None, calibration=None, serial=None):
+        """Appends one sweep and returns its index.
+
+        `timestamp_ns` defaults to `time.time_ns()`. `calibration` identifies the
+        calibration in use (for example `CalibrationManager.active_sha256`) and
+        `serial` the instrument.
+        """
+        if self.mode != "a":
+            raise PermissionError("Archive is open read-only")
+        freqs = np.ascontiguousarray(freqs, dtype=GRID_DTYPE)
+        s = np.asarray(s)
+        if s.shape != (len(freqs), 2, 2):
+            raise ValueError(f"Expected S-parameters of shape ({len(freqs)}, 2, 2), got {s.shape}")
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        codec, payload = encode_data(s, self.compression, self.level, self.shuffle)
+
+        with self._lock:
+            record = np.zeros(1, dtype=RECORD_DTYPE)
+            record["timestamp_ns"] = timestamp_ns
+            record["data_offset"] = self._data_end
+            record["data_bytes"] = len(payload)
+            record["grid"] = self._grid_id(freqs)
+            record["num_points"] = len(freqs)
+            record["calibration"] = self._string_id(calibration)
+            record["serial"] = self._string_id(serial)
+            record["codec"] = codec
+
+            data = self._files["data.bin"]
+            data.write(payload)
+            # the data must reach the file before its record can
+            data.flush()
+            self._data_end += len(payload)
+            self._files["records.bin"].write(record.tobytes())
+
+            index = self._count
+            self._count += 1
+            block = index // self.block_size
+            if block == len(self._time_index):
+                self._time_index.append((timestamp_ns, timestamp_ns))
+            else:
+                low, high = self._time_index[block]
+                self._time_index[block] = (min(low, timestamp_ns), max(high, timestamp_ns))
+            return index
+
+    def append_result(self, result, timestamp_ns=None, calibration=None, serial=None):
+        """Appends a `SweepResult`."""
+        return self.append(result.freqs, result.s, timestamp_ns, calibration, serial)
+
+    def append_points(self, points, timestamp_ns=None, calibration=None, serial=None):
+        """Appends the points returned by `performMeasurement`."""
+        return self.append_result(SweepResult.from_points(points), timestamp_ns, calibration, serial)
+
+    def append_sweep(self, sweep, timestamp_ns=None, calibration=None, serial=None):
+        """Drains an asynchronous sweep from `startMeasurement` and appends it.
+
+        The timestamp defaults to the time at which draining started.
+        """
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        return self.append_result(SweepResult.from_sweep(sweep), timestamp_ns, calibration, serial)
+
+    def _write_time_index(self):
+        f = self._files["time_index.bin"]
+        f.truncate(self._index_written * 16)
+        f.seek(0, os.SEEK_END)
+        f.write(np.array(self._time_index[self._index_written:], dtype="<i8").tobytes())
+        # the last block may still change, so it is rewritten on every flush
+        self._index_written = max(len(self._time_index) - 1, 0)
+
+    def flush(self):
+        """Writes buffered data, records and the time index to disk."""
+        if self.mode != "a":
+            return
+        with self._lock:
+            self._files["data.bin"].flush()
+            self._files["records.bin"].flush()
+            self._write_time_index()
+            self._files["time_index.bin"].flush()
+
+    def close(self):
+        with self._lock:
+            if self._files is None:
+                return
+            self.flush()
+            self._records_map = None
+            self._data_map = None
+            for f in self._files.values():
+                f.close()
+            self._files = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    #### Reading
+    ###########################################################################
+
+    def __len__(self):
+        return self._count
+
+    def _string(self, i):
+        return None if i == NO_STRING else self._strings[i]
+
+    def __getitem__(self, index):
+        """Returns sweep `index` as an `ArchivedSweep`.
+
+        Uncompressed data is returned as a read-only view of the memory-mapped
+        data file; compressed data is decompressed into a new array.
+        """
+        with self._lock:
+            if index < 0:
+                index += self._count
+            if not 0 <= index < self._count:
+                raise IndexError("sweep index out of range")
+            if self.mode == "a":
+                self._files["data.bin"].flush()
+                self._files["records.bin"].flush()
+            record = self._records()[index]
+            offset, size = int(record["data_offset"]), int(record["data_bytes"])
+            num_points, codec = int(record["num_points"]), int(record["codec"])
+            payload = self._data(offset + size)[offset:offset + size]
+            if codec == 0:
+                s = payload.view(DATA_DTYPE).reshape(num_points, 2, 2)
+            else:
+                s = decode_data(codec, payload.tobytes(), num_points)
+            return ArchivedSweep(self._grids[int(record["grid"])], s, int(record["timestamp_ns"]),
+                                 self._string(int(record["calibration"])), self._string(int(record["serial"])))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def timestamps(self):
+        """Returns the timestamps of all sweeps, in append order."""
+        with self._lock:
+            if self.mode == "a":
+                self._files["records.bin"].flush()
+            return np.array(self._records()["timestamp_ns"])
+
+    def query(self, start_ns=None, end_ns=None):
+        """Returns the indices of the sweeps with `start_ns <= timestamp < end_ns`, in append order."""
+        low = np.iinfo(np.int64).min if start_ns is None else start_ns
+        high = np.iinfo(np.int64).max if end_ns is None else end_ns
+        with self._lock:
+            if self.mode == "a":
+                self._files["records.bin"].flush()
+            timestamps = self._records()["timestamp_ns"]
+            matches = []
+            for block, (block_min, block_max) in enumerate(self._time_index):
+                if block_max < low or block_min >= high:
+                    continue
+                first = block * self.block_size
+                t = timestamps[first:first + self.block_size]
+                matches.append(first + np.flatnonzero((t >= low) & (t < high)))
+            return np.concatenate(matches) if matches else np.empty(0, dtype=np.int64)
+
+    def stats(self):
+        with self._lock:
+            data_bytes = self._data_end
+            raw_bytes = int(self._records()["num_points"].sum(dtype=np.uint64)) * 4 * DATA_DTYPE.itemsize
+            return {
+                "sweeps": self._count,
+                "grids": len(self._grids),
+                "data_bytes": data_bytes,
+                "raw_bytes": raw_bytes,
+                "compression_ratio": raw_bytes / data_bytes if data_bytes else 1.0,
+                "index_blocks": len(self._time_index),
+            }
@@ -0,0 +1,181 @@
+"""
+sweep_builder
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Builds `vna.MeasurementConfiguration` objects from vectorised sweep definitions,
+with an LRU cache so that repeated jobs reuse an already-built configuration.
+
+04_log_frequency_sweep grows its frequency list one point at a time in Python,
+adds each point to the configuration, and only then counts the points to check
+the 10,001-point limit. Here the frequency, power and bandwidth arrays are
+computed with NumPy first, the limit is checked before any SDK object is
+created, and uniform sweeps use `addUniformFrequencySweep()` directly.
+
+Cached configurations are shared between callers and must not be modified;
+pass `trigger_mode` to the cache rather than calling `setTriggerMode()` on the
+returned object.
+"""
+
+import collections
+import math
+import threading
+
+import numpy as np
+
+
+MAX_POINTS = 10001
+
+
+def check_point_count(num_points):
+    if num_points < 1:
+        raise ValueError("A sweep must have at least one point.")
+    if num_points > MAX_POINTS:
+        raise ValueError(f"Sweep has {num_points} points, which exceeds the {MAX_POINTS:,} point limit.")
+
+
+def uniform_frequencies(num_points, start_hz, stop_hz):
+    check_point_count(num_points)
+    return np.linspace(start_hz, stop_hz, num_points)
+
+
+def log_frequencies(num_points, start_hz, stop_hz):
+    """Returns `num_points` logarithmically spaced frequencies from `start_hz` to `stop_hz` inclusive."""
+    check_point_count(num_points)
+    return np.geomspace(start_hz, stop_hz, num_points)
+
+
+def log_frequencies_by_ratio(start_hz, stop_hz, ratio):
+    """Returns start_hz * ratio**k for every k where the frequency is below `stop_hz`.
+
+    This is the sweep built point by point in 04_log_frequency_sweep; the point
+    count is computed (and checked) before the array is created.
+    """
+    if ratio <= 1.0:
+        raise ValueError("ratio must be greater than 1.")
+    num_points = max(0, math.ceil(math.log(stop_hz / start_hz) / math.log(ratio)))
+    check_point_count(num_points)
+    freqs = start_hz * ratio ** np.arange(num_points)
+    # guard against rounding at the top end of the sweep
+    return freqs[freqs < stop_hz]
+
+
+def segmented_frequencies(segments):
+    """Concatenates uniform segments.
+
+    `segments` is a sequence of `(num_points, start_hz, stop_hz, power_dbm, bandwidth_hz)`.
+    Returns `(freqs, power_dbm, bandwidth_hz)` arrays, one entry per point.
+    """
+    total = sum(segment[0] for segment in segments)
+    check_point_count(total)
+    freqs = np.concatenate([np.linspace(start, stop, n) for n, start, stop, _, _ in segments])
+    power = np.concatenate([np.full(n, power, dtype=np.float64) for n, _, _, power, _ in segments])
+    bandwidth = np.concatenate([np.full(n, bw, dtype=np.float64) for n, _, _, _, bw in segments])
+    return freqs, power, bandwidth
+
+
+def build_configuration(freqs, power_dbm, bandwidth_hz, trigger_mode=None):
+    """Builds a configuration from per-point arrays (scalars are broadcast to every point)."""
+    from vna import vna
+
+    freqs, power_dbm, bandwidth_hz = np.broadcast_arrays(
+        np.asarray(freqs, dtype=np.float64), np.asarray(power_dbm, dtype=np.float64),
+        np.asarray(bandwidth_hz, dtype=np.float64)
+    )
+    check_point_count(freqs.size)
+
+    mc = vna.MeasurementConfiguration()
+    for f, p, bw in zip(freqs.tolist(), power_dbm.tolist(), bandwidth_hz.tolist()):
+        pt = vna.MeasurementPoint()
+        pt.frequencyHz = f
+        pt.powerLeveldBm = p
+        pt.bandwidthHz = bw
+        mc.addPoint(pt)
+    if trigger_mode is not None:
+        mc.setTriggerMode(trigger_mode)
+    return mc
+
+
+def build_uniform_configuration(num_points, start_hz, stop_hz, power_dbm, bandwidth_hz, trigger_mode=None):
+    from vna import vna
+
+    check_point_count(num_points)
+    mc = vna.MeasurementConfiguration()
+    mc.addUniformFrequencySweep(num_points, start_hz, stop_hz, power_dbm, bandwidth_hz)
+    if trigger_mode is not None:
+        mc.setTriggerMode(trigger_mode)
+    return mc
+
+
+class ConfigurationCache:
+    """LRU cache of built configurations, keyed on the sweep definition.
+
+    Each method returns a cached configuration if the same definition has been
+    built before, and otherwise builds and caches it. `hits` and `misses` count
+    cache lookups.
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            mc = self._entries.get(key)
+            if mc is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return mc
+            self.misses += 1
+        mc = build()
+        with self._lock:
+            self._entries[key] = mc
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return mc
+
+    def uniform(self, num_points, start_hz, stop_hz, power_dbm, bandwidth_hz, trigger_mode=None):
+        key = ("uniform", num_points, start_hz, stop_hz, power_dbm, bandwidth_hz, trigger_mode)
+        return self.get_or_build(key, lambda: build_uniform_configuration(
+            num_points, start_hz, stop_hz, power_dbm, bandwidth_hz, trigger_mode
+        ))
+
+    def logarithmic(self, num_points, start_hz, stop_hz, power_dbm, bandwidth_hz, trigger_mode=None):
+        key = ("log", num_points, start_hz, stop_hz, power_dbm, bandwidth_hz, trigger_mode)
+        return self.get_or_build(key, lambda: build_configuration(
+            log_frequencies(num_points, start_hz, stop_hz), power_dbm, bandwidth_hz, trigger_mode
+        ))
+
+    def logarithmic_by_ratio(self, start_hz, stop_hz, ratio, power_dbm, bandwidth_hz, trigger_mode=None):
+        key = ("log-ratio", start_hz, stop_hz, ratio, power_dbm, bandwidth_hz, trigger_mode)
+        return self.get_or_build(key, lambda: build_configuration(
+            log_frequencies_by_ratio(start_hz, stop_hz, ratio), power_dbm, bandwidth_hz, trigger_mode
+        ))
+
+    def segmented(self, segments, trigger_mode=None):
+        segments = tuple(tuple(segment) for segment in segments)
+        key = ("segmented", segments, trigger_mode)
+        return self.get_or_build(key, lambda: build_configuration(
+            *segmented_frequencies(segments), trigger_mode=trigger_mode
+        ))
+
+    def list_sweep(self, freqs, power_dbm, bandwidth_hz, trigger_mode=None):
+        """Arbitrary per-point sweep; the key is built from the array contents."""
+        freqs, power_dbm, bandwidth_hz = (
+            np.ascontiguousarray(a, dtype=np.float64) for a in (freqs, power_dbm, bandwidth_hz)
+        )
+        check_point_count(freqs.size)
+        key = ("list", freqs.tobytes(), power_dbm.shape, power_dbm.tobytes(),
+               bandwidth_hz.shape, bandwidth_hz.tobytes(), trigger_mode)
+        return self.get_or_build(key, lambda: build_configuration(freqs, power_dbm, bandwidth_hz, trigger_mode))
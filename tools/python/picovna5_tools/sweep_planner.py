@@ -0,0 +1,212 @@
+"""
+sweep_planner
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Sweep-time estimates and per-segment IF bandwidth planning.
+
+Every `vna.MeasurementPoint` has its own `bandwidthHz`, but the examples use
+1 kHz or 10 kHz for every point, which makes segments that need no low noise
+floor as slow as those that do. The time a point takes is modelled as a fixed
+time plus a settling time inversely proportional to its IF bandwidth, so a
+sweep takes
+
+    per_sweep_s + per_point_s * N + per_cycle_s * sum(1 / bandwidth_hz)
+
+`SweepTimeModel.calibrate()` fits the three coefficients by least squares to
+the measured times of a few sweeps of a device (`vna.Device.openDemo()` or an
+instrument). How well this model fits the timing of the demo device or of an
+instrument has not been established; use `SweepPlan.compare()` or
+benchmarks/sweep_planner.py to check it before relying on the predictions.
+
+The trace noise floor rises by 10 dB per decade of IF bandwidth.
+`NoiseModel.measure()` estimates it at one bandwidth from the difference
+between two repeated sweeps, and `SweepPlanner` then picks for each segment
+the widest bandwidth (from `IF_BANDWIDTHS_HZ` by default) whose noise floor
+meets the segment's target, and builds the configuration with
+`sweep_builder`. `SweepPlan.compare()` measures the planned sweep and reports
+the predicted and measured times.
+
+The noise floor is measured at one power level; measure a separate
+`NoiseModel` for segments at other powers.
+"""
+
+import math
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from .sweep_builder import build_configuration, build_uniform_configuration, segmented_frequencies
+from .sweep_result import SweepResult
+
+
+# 1-2-5 steps from 10 Hz to 100 kHz; pass `bandwidths_hz` to `SweepPlanner` to match the instrument
+IF_BANDWIDTHS_HZ = (10, 20, 50, 100, 200, 500, 1e3, 2e3, 5e3, 1e4, 2e4, 5e4, 1e5)
+
+# A segment of a plan: `noise_floor_db` is the target and `expected_floor_db` the noise floor at `bandwidth_hz`.
+PlannedSegment = namedtuple("PlannedSegment", [
+    "num_points", "start_hz", "stop_hz", "power_dbm", "bandwidth_hz", "noise_floor_db", "expected_floor_db",
+    "predicted_s",
+])
+
+
+def _measure_s(device, mc):
+    start = time.perf_counter()
+    device.performMeasurement(mc)
+    return time.perf_counter() - start
+
+
+class SweepTimeModel:
+    """Predicts sweep durations as `per_sweep_s + per_point_s * N + per_cycle_s * sum(1 / bandwidth_hz)`."""
+
+    def __init__(self, per_sweep_s, per_point_s, per_cycle_s):
+        self.per_sweep_s = per_sweep_s
+        self.per_point_s = per_point_s
+        self.per_cycle_s = per_cycle_s
+
+    def __repr__(self):
+        return (f"SweepTimeModel(per_sweep_s={self.per_sweep_s:.3g}, per_point_s={self.per_point_s:.3g}, "
+                f"per_cycle_s={self.per_cycle_s:.3g})")
+
+    def predict(self, bandwidth_hz, num_points=None):
+        """Predicts the duration of a sweep.
+
+        `bandwidth_hz` is an array with one entry per point, or a scalar for
+        a sweep of `num_points` points at one bandwidth. Raises `ValueError`
+        if `bandwidth_hz` is a scalar and `num_points` is not given.
+        """
+        bandwidth_hz = np.asarray(bandwidth_hz, dtype=np.float64)
+        if bandwidth_hz.ndim == 0:
+            if num_points is None:
+                raise ValueError("num_points is needed to predict a sweep at a single bandwidth")
+            bandwidth_hz = np.full(num_points, bandwidth_hz)
+        return self.per_sweep_s + self.per_point_s * bandwidth_hz.size + self.per_cycle_s * np.sum(1 / bandwidth_hz)
+
+    def predict_configuration(self, mc):
+        """Predicts the duration of a sweep of a `vna.MeasurementConfiguration`."""
+        return self.predict([pt.bandwidthHz for pt in mc.getPoints()])
+
+    @classmethod
+    def calibrate(cls, device, start_hz, stop_hz, point_counts=(201, 1001), bandwidths_hz=(1e3, 1e4, 1e5),
+                  repeats=3, power_dbm=0.0):
+        """Fits a model to uniform sweeps of `device` for every point count and bandwidth.
+
+        Each sweep is timed `repeats` times and the median is used. Returns the
+        model and a list of `(num_points, bandwidth_hz, measured_s)`.
+        """
+        samples = []
+        for num_points in point_counts:
+            for bandwidth_hz in bandwidths_hz:
+                mc = build_uniform_configuration(num_points, start_hz, stop_hz, power_dbm, bandwidth_hz)
+                times = [_measure_s(device, mc) for _ in range(repeats)]
+                samples.append((num_points, bandwidth_hz, float(np.median(times))))
+        return cls.fit(samples), samples
+
+    @classmethod
+    def fit(cls, samples):
+        """Fits a model to `(num_points, bandwidth_hz, measured_s)` of uniform sweeps by least squares.
+
+        The three coefficients can only be separated if the samples cover at
+        least two point counts and two bandwidths; raises `ValueError` if not.
+        """
+        design = np.array([[1.0, n, n / bw] for n, bw, _ in samples]).reshape(-1, 3)
+        if np.linalg.matrix_rank(design) < 3:
+            raise ValueError("Fitting a sweep-time model needs sweeps of at least two point counts and two "
+                             "bandwidths")
+        measured = np.array([t for _, _, t in samples])
+        coefficients = np.linalg.lstsq(design, measured, rcond=None)[0]
+        return cls(*(float(c) for c in coefficients))
+
+
+class NoiseModel:
+    """A trace noise floor of `floor_db` at `bandwidth_hz`, rising by 10 dB per decade of IF bandwidth."""
+
+    def __init__(self, floor_db, bandwidth_hz):
+        self.floor_db = floor_db
+        self.bandwidth_hz = bandwidth_hz
+
+    def __repr__(self):
+        return f"NoiseModel(floor_db={self.floor_db:.1f}, bandwidth_hz={self.bandwidth_hz:g})"
+
+    def floor_at(self, bandwidth_hz):
+        """The noise floor in dB at `bandwidth_hz`."""
+        return self.floor_db + 10 * np.log10(np.asarray(bandwidth_hz, dtype=np.float64) / self.bandwidth_hz)
+
+    def widest_bandwidth(self, noise_floor_db, bandwidths_hz=IF_BANDWIDTHS_HZ):
+        """The widest of `bandwidths_hz` with a noise floor at or below `noise_floor_db`, or None."""
+        acceptable = [bw for bw in bandwidths_hz if self.floor_at(bw) <= noise_floor_db]
+        return max(acceptable) if acceptable else None
+
+    @classmethod
+    def measure(cls, device, start_hz, stop_hz, num_points=1001, bandwidth_hz=1e4, power_dbm=0.0):
+        """Estimates the noise floor from two repeated uniform sweeps of `device`.
+
+        The noise of each point is `|s_a - s_b| / sqrt(2)`; its RMS over every
+        point and S-parameter is the floor. Anything that changes between the
+        sweeps (drift, a moving DUT) is counted as noise.
+        """
+        mc = build_uniform_configuration(num_points, start_hz, stop_hz, power_dbm, bandwidth_hz)
+        a = SweepResult.from_points(device.performMeasurement(mc)).s
+        b = SweepResult.from_points(device.performMeasurement(mc)).s
+        rms = math.sqrt(np.mean(np.abs(a - b) ** 2) / 2)
+        return cls(20 * math.log10(max(rms, 1e-300)), bandwidth_hz)
+
+
+class SweepPlan:
+    """Segments with their planned bandwidths, and the predicted duration of the sweep."""
+
+    def __init__(self, segments, time_model):
+        self.segments = segments
+        self.time_model = time_model
+
+    @property
+    def num_points(self):
+        return sum(segment.num_points for segment in self.segments)
+
+    @property
+    def predicted_s(self):
+        return self.time_model.per_sweep_s + sum(segment.predicted_s for segment in self.segments)
+
+    def configuration(self, trigger_mode=None):
+        """Builds the `vna.MeasurementConfiguration` of the plan."""
+        freqs, power, bandwidth = segmented_frequencies([segment[:5] for segment in self.segments])
+        return build_configuration(freqs, power, bandwidth, trigger_mode)
+
+    def compare(self, device, repeats=3):
+        """Measures the planned sweep `repeats` times; returns `(predicted_s, median measured_s)`."""
+        mc = self.configuration()
+        times = [_measure_s(device, mc) for _ in range(repeats)]
+        return self.predicted_s, float(np.median(times))
+
+
+class SweepPlanner:
+    """Chooses the IF bandwidth of each segment of a sweep from its noise-floor target.
+
+    `time_model` is a `SweepTimeModel` and `noise_model` a `NoiseModel`;
+    bandwidths are chosen from `bandwidths_hz`.
+    """
+
+    def __init__(self, time_model, noise_model, bandwidths_hz=IF_BANDWIDTHS_HZ):
+        self.time_model = time_model
+        self.noise_model = noise_model
+        self.bandwidths_hz = tuple(sorted(bandwidths_hz))
+
+    def plan(self, segments):
+        """Plans `segments`, a sequence of `(num_points, start_hz, stop_hz, power_dbm, noise_floor_db)`.
+
+        Raises `ValueError` if a target is below the noise floor at the
+        narrowest bandwidth.
+        """
+        planned = []
+        for num_points, start_hz, stop_hz, power_dbm, noise_floor_db in segments:
+            bandwidth_hz = self.noise_model.widest_bandwidth(noise_floor_db, self.bandwidths_hz)
+            if bandwidth_hz is None:
+                narrowest = self.bandwidths_hz[0]
+                raise ValueError(f"A noise floor of {noise_floor_db} dB from {start_hz:g} Hz to {stop_hz:g} Hz is "
+                                 f"below the {float(self.noise_model.floor_at(narrowest)):.1f} dB reached at "
+                                 f"{narrowest:g} Hz")
+            predicted_s = num_points * (self.time_model.per_point_s + self.time_model.per_cycle_s / bandwidth_hz)
+            planned.append(PlannedSegment(num_points, start_hz, stop_hz, power_dbm, bandwidth_hz, noise_floor_db,
+                                          float(self.noise_model.floor_at(bandwidth_hz)), predicted_s))
+        return SweepPlan(planned, self.time_model)
@@ -0,0 +1,77 @@
+"""
+sweep_result
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+A columnar container for the results of a sweep.
+
+`instrument.performMeasurement(mc)` returns a list of point objects, and the
+examples read `pt.measurementFrequencyHz` and `pt.s11` ... `pt.s22` one point at
+a time. `SweepResult` walks the point list once and stores the sweep as
+contiguous NumPy arrays: a frequency vector and an `(N, 2, 2)` complex128
+S-matrix laid out as [[S11, S12], [S21, S22]]. Each S-parameter is then
+available as a zero-copy view, ready for vectorised processing.
+"""
+
+import numpy as np
+
+
+# (row, column) of each S-parameter in the (N, 2, 2) S-matrix
+S_MATRIX_INDEX = {"S11": (0, 0), "S12": (0, 1), "S21": (1, 0), "S22": (1, 1)}
+
+
+class SweepResult:
+    """Frequency vector `freqs` (Hz, float64, shape (N,)) and S-matrix `s` (complex128, shape (N, 2, 2))."""
+
+    __slots__ = ("freqs", "s")
+
+    def __init__(self, freqs, s):
+        self.freqs = np.ascontiguousarray(freqs, dtype=np.float64)
+        self.s = np.ascontiguousarray(s, dtype=np.complex128)
+        if self.s.shape != (len(self.freqs), 2, 2):
+            raise ValueError(f"Expected an S-matrix of shape ({len(self.freqs)}, 2, 2), got {self.s.shape}")
+
+    @classmethod
+    def from_points(cls, points):
+        """Converts the point list returned by `performMeasurement()` (or collected from `getNextPoint()`)."""
+        n = len(points)
+        freqs = np.array([pt.measurementFrequencyHz for pt in points], dtype=np.float64)
+        s = np.array([(pt.s11, pt.s12, pt.s21, pt.s22) for pt in points], dtype=np.complex128)
+        return cls(freqs, s.reshape(n, 2, 2))
+
+    @classmethod
+    def from_sweep(cls, sweep):
+        """Drains an asynchronous sweep started with `startMeasurement()` and converts it."""
+        points = []
+        while sweep.hasMorePoints():
+            points.append(sweep.getNextPoint())
+        return cls.from_points(points)
+
+    def __len__(self):
+        return len(self.freqs)
+
+    def __repr__(self):
+        if len(self) == 0:
+            return "SweepResult(0 points)"
+        return f"SweepResult({len(self)} points, {self.freqs[0]} Hz to {self.freqs[-1]} Hz)"
+
+    def parameter(self, name):
+        """Returns a view of one S-parameter, e.g. `parameter("S21")`."""
+        m, n = S_MATRIX_INDEX[name.upper()]
+        return self.s[:, m, n]
+
+    @property
+    def s11(self):
+        return self.s[:, 0, 0]
+
+    @property
+    def s12(self):
+        return self.s[:, 0, 1]
+
+    @property
+    def s21(self):
+        return self.s[:, 1, 0]
+
+    @property
+    def s22(self):
+        return self.s[:, 1, 1]
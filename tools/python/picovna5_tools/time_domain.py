@@ -0,0 +1,152 @@
+"""
+time_domain
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+A batched, NumPy-based time domain transform for many sweeps and S-parameters
+at once.
+
+`vna.transform()` converts one S-parameter of one sweep per call and returns a
+list of sample objects. `transform()` here takes a whole stack of S-matrices,
+for example `(sweeps, N, 2, 2)`, and transforms every sweep and every
+S-parameter in a single FFT call.
+
+Modes:
+* "lowpass_impulse" and "lowpass_step" need a harmonic frequency grid (every
+  frequency a multiple of the step, as set up in 03_time_domain_transform). The
+  DC value is extrapolated from the first two points and the spectrum is made
+  Hermitian, giving a real response. A perfect through has an impulse peak
+  and a final step value of 1. The step response is returned on a time axis
+  centred on zero, from -T/2 to T/2, so that it includes the negative-time
+  half of the windowed impulse.
+* "bandpass_impulse" works on any uniform grid and gives a complex response,
+  normalised so that a perfect through has a peak magnitude of 1.
+
+Windows: "rectangular", "hanning" and "kaiser" (with `kaiser_beta`). For
+low-pass modes the window is centred on DC.
+
+As with the PicoVNA 5 software, if the frequency grid is not harmonic (for
+low-pass modes) or the number of points is not a power of two, the data is
+first interpolated onto a suitable grid with a power-of-two number of points.
+The spectrum is then zero-padded to a power-of-two FFT length of at least
+`oversample` times the minimum.
+"""
+
+import numpy as np
+
+
+MODES = ("lowpass_impulse", "lowpass_step", "bandpass_impulse")
+WINDOWS = ("rectangular", "hanning", "kaiser")
+
+
+def next_power_of_two(n):
+    return 1 << max(0, int(n) - 1).bit_length()
+
+
+def window_function(name, length, kaiser_beta=6.0):
+    """Returns a symmetric window of `length` points."""
+    if name == "rectangular":
+        return np.ones(length)
+    if name == "hanning":
+        # np.hanning has zeros at both ends; drop them so no data point is discarded
+        return np.hanning(length + 2)[1:-1]
+    if name == "kaiser":
+        return np.kaiser(length, kaiser_beta)
+    raise ValueError(f"Unknown window {name!r}; expected one of {WINDOWS}")
+
+
+def linear_interpolation_weights(source_freqs, target_freqs):
+    """Returns `(lower, weight)` so that y(target) = y[lower] * (1 - weight) + y[lower + 1] * weight.
+
+    Targets outside the source range take the nearest end value.
+    """
+    source_freqs = np.asarray(source_freqs, dtype=np.float64)
+    target_freqs = np.clip(np.asarray(target_freqs, dtype=np.float64), source_freqs[0], source_freqs[-1])
+    lower = np.clip(np.searchsorted(source_freqs, target_freqs, side="right") - 1, 0, len(source_freqs) - 2)
+    span = source_freqs[lower + 1] - source_freqs[lower]
+    weight = (target_freqs - source_freqs[lower]) / span
+    return lower, weight
+
+
+def _along(values, axis, ndim):
+    """Reshapes a 1-D array so that it broadcasts along `axis` of an `ndim`-dimensional array."""
+    shape = [1] * ndim
+    shape[axis] = -1
+    return values.reshape(shape)
+
+
+def _is_harmonic(freqs, rtol=1e-6):
+    if len(freqs) < 2:
+        return False
+    step = (freqs[-1] - freqs[0]) / (len(freqs) - 1)
+    return step > 0 and abs(freqs[0] - step) <= rtol * step
+
+
+def _is_uniform(freqs, rtol=1e-6):
+    if len(freqs) < 2:
+        return False
+    steps = np.diff(freqs)
+    return steps[0] > 0 and np.all(np.abs(steps - steps[0]) <= rtol * steps[0])
+
+
+def transform(freqs, s, mode="lowpass_step", window="hanning", kaiser_beta=6.0, oversample=1, axis=-3):
+    """Transforms every trace in `s` to the time domain.
+
+    `freqs` are the sweep frequencies in Hz (shape (N,)); `s` holds complex data
+    with the frequency axis at `axis` (by default the layout `(..., N, 2, 2)`).
+    Returns `(times, response)`: `times` in seconds, and `response` with the
+    frequency axis replaced by time. The response is real for low-pass modes
+    and complex for "bandpass_impulse". Raises `ValueError` unless there are
+    at least two frequencies, in increasing order.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode!r}; expected one of {MODES}")
+    freqs = np.asarray(freqs, dtype=np.float64)
+    s = np.asarray(s)
+    axis = axis % s.ndim
+    num_points = len(freqs)
+    if num_points < 2 or np.any(np.diff(freqs) <= 0):
+        raise ValueError("A time domain transform needs at least two frequencies, in increasing order")
+    if s.shape[axis] != num_points:
+        raise ValueError(f"s has {s.shape[axis]} points along axis {axis}, but there are {num_points} frequencies")
+
+    lowpass = mode.startswith("lowpass")
+    grid_ok = _is_harmonic(freqs) if lowpass else _is_uniform(freqs)
+    if not grid_ok or num_points & (num_points - 1):
+        n = next_power_of_two(num_points)
+        if lowpass:
+            target = freqs[-1] * np.arange(1, n + 1) / n
+        else:
+            target = np.linspace(freqs[0], freqs[-1], n)
+        lower, weight = linear_interpolation_weights(freqs, target)
+        weight = _along(weight, axis, s.ndim)
+        s = (np.take(s, lower, axis=axis) * (1.0 - weight) + np.take(s, lower + 1, axis=axis) * weight)
+        freqs, num_points = target, n
+
+    step = (freqs[-1] - freqs[0]) / (num_points - 1)
+
+    if lowpass:
+        # window centred on DC: the right-hand half of a (2N + 1)-point window
+        w = window_function(window, 2 * num_points + 1, kaiser_beta)[num_points:]
+        first = np.take(s, [0], axis=axis)
+        second = np.take(s, [1], axis=axis)
+        dc = (2.0 * first - second).real
+        spectrum = np.concatenate([dc, s], axis=axis) * _along(w, axis, s.ndim)
+        n_fft = next_power_of_two(2 * num_points * oversample)
+        response = np.fft.irfft(spectrum, n_fft, axis=axis)
+        if mode == "lowpass_step":
+            # the negative-time half of the impulse wraps to the end of the array; move it to the
+            # front before integrating, so the step includes it and settles at the (windowed) DC value
+            response = np.cumsum(np.fft.fftshift(response, axes=axis), axis=axis)
+            times = (np.arange(n_fft) - n_fft // 2) / (n_fft * step)
+        else:
+            # irfft scales by 1/n_fft; rescale so that a flat spectrum gives a unit impulse
+            response *= n_fft / (2.0 * w.sum() - w[0])
+            times = np.arange(n_fft) / (n_fft * step)
+    else:
+        w = window_function(window, num_points, kaiser_beta)
+        n_fft = next_power_of_two(num_points * oversample)
+        response = np.fft.ifft(s * _along(w, axis, s.ndim), n_fft, axis=axis) * (n_fft / w.sum())
+        times = np.arange(n_fft) / (n_fft * step)
+
+    return times, response
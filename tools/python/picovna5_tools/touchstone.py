@@ -0,0 +1,297 @@
+"""
+touchstone
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Reads and writes Touchstone (.s1p/.s2p) files using the `(N, 2, 2)` S-matrix
+layout of `SweepResult`.
+
+Data can be written as real/imaginary ("RI"), linear magnitude/angle ("MA")
+or dB/angle ("DB") pairs, separated by spaces or tabs, matching the options of
+the PicoVNA 5 software's `MMEMory:STORe:TRACe:OPTion` commands. As the
+Touchstone format requires, two-port data rows are ordered
+S11, S21, S12, S22.
+
+`TouchstoneStreamWriter` writes a sweep row by row as its points arrive, so
+that the file is complete as soon as the last point has been received. Its
+output is byte-identical to `write_touchstone` for the same data and options.
+"""
+
+import mmap
+import os
+import re
+import time
+import warnings
+
+import numpy as np
+
+
+FREQUENCY_UNITS = {"HZ": 1.0, "KHZ": 1e3, "MHZ": 1e6, "GHZ": 1e9}
+DATA_FORMATS = ("RI", "MA", "DB")
+
+# (row, column) of each value pair in a Touchstone data row
+TWO_PORT_ORDER = ((0, 0), (1, 0), (0, 1), (1, 1))
+ONE_PORT_INDEX = {"S11": (0, 0), "S22": (1, 1)}
+
+NUMBER_FORMAT = "%.12g"
+
+
+def option_line(fmt="RI", unit="HZ", z0=50.0):
+    return f"# {unit} S {fmt} R {z0:g}"
+
+
+def parse_option_line(line):
+    """Parses a Touchstone option line, returning `(frequency scale, data format, z0)`.
+
+    Missing fields take the Touchstone defaults (GHz, MA, 50 ohms).
+    """
+    scale, fmt, z0 = FREQUENCY_UNITS["GHZ"], "MA", 50.0
+    tokens = line.lstrip("#").upper().split()
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token in FREQUENCY_UNITS:
+            scale = FREQUENCY_UNITS[token]
+        elif token in DATA_FORMATS:
+            fmt = token
+        elif token == "R" and i + 1 < len(tokens):
+            z0 = float(tokens[i + 1])
+            i += 1
+        elif token != "S":
+            raise ValueError(f"Unsupported Touchstone option {token!r} (only S-parameters are supported)")
+        i += 1
+    return scale, fmt, z0
+
+
+def ports_from_path(path):
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext not in (".s1p", ".s2p"):
+        raise ValueError(f"Cannot tell the number of ports from {path!r}; expected .s1p or .s2p")
+    return int(ext[2])
+
+
+def pairs_to_complex(a, b, fmt):
+    """Converts value pairs in Touchstone format `fmt` to complex numbers."""
+    if fmt == "RI":
+        return a + 1j * b
+    magnitude = a if fmt == "MA" else 10.0 ** (a / 20.0)
+    return magnitude * np.exp(1j * np.deg2rad(b))
+
+
+def complex_to_pairs(s, fmt):
+    """Converts complex numbers to value pairs in Touchstone format `fmt`."""
+    if fmt == "RI":
+        return s.real, s.imag
+    magnitude = np.abs(s)
+    if fmt == "DB":
+        magnitude = 20.0 * np.log10(magnitude)
+    return magnitude, np.degrees(np.angle(s))
+
+
+def to_s_matrix(values, num_ports, fmt, one_port_parameter="S11"):
+    """Converts Touchstone data rows (shape (N, 1 + 2 * ports**2)) to `(freqs, s)`."""
+    s = np.zeros((len(values), 2, 2), dtype=np.complex128)
+    if num_ports == 1:
+        m, n = ONE_PORT_INDEX[one_port_parameter]
+        s[:, m, n] = pairs_to_complex(values[:, 1], values[:, 2], fmt)
+    else:
+        for k, (m, n) in enumerate(TWO_PORT_ORDER):
+            s[:, m, n] = pairs_to_complex(values[:, 1 + 2 * k], values[:, 2 + 2 * k], fmt)
+    return values[:, 0], s
+
+
+def data_columns(freqs, s, num_ports=2, fmt="RI", unit="HZ", one_port_parameter="S11"):
+    """Returns the Touchstone data rows for a sweep as a float64 array of shape (N, 1 + 2 * ports**2)."""
+    s = np.asarray(s)
+    indices = TWO_PORT_ORDER if num_ports == 2 else (ONE_PORT_INDEX[one_port_parameter],)
+    columns = np.empty((len(freqs), 1 + 2 * len(indices)), dtype=np.float64)
+    columns[:, 0] = np.asarray(freqs, dtype=np.float64) / FREQUENCY_UNITS[unit]
+    for k, (m, n) in enumerate(indices):
+        columns[:, 1 + 2 * k], columns[:, 2 + 2 * k] = complex_to_pairs(s[..., m, n], fmt)
+    return columns
+
+
+def row_template(num_ports, tabs=False):
+    separator = "\t" if tabs else " "
+    return separator.join([NUMBER_FORMAT] * (1 + 2 * num_ports * num_ports)) + "\n"
+
+
+def _data_block(buffer):
+    """Returns the data section of a Touchstone file held in `buffer`, and its option line.
+
+    The option line is the first line starting with "#". Comments, blank lines
+    and any further option lines are removed from the data, which is returned
+    as bytes of whitespace-separated numbers.
+    """
+    option = None
+    position = 0
+    # header: comments, blank lines and the option line, up to the first data line
+    while position < len(buffer):
+        end = buffer.find(b"\n", position)
+        end = len(buffer) if end == -1 else end + 1
+        line = bytes(buffer[position:end]).strip()
+        if line and not line.startswith(b"!"):
+            if not line.startswith(b"#"):
+                break
+            if option is None:
+                option = line.decode("ascii", errors="replace").split("!", 1)[0]
+        position = end
+    data = buffer[position:]
+    if buffer.find(b"!", position) != -1 or buffer.find(b"#", position) != -1:
+        # slow path, only for files with comments inside the data section
+        data = re.sub(rb"[!#][^\n]*", b"", data)
+    return data, option
+
+
+def parse_touchstone(buffer, num_ports):
+    """Parses the contents of a .s1p or .s2p file, returning `(freqs, s, z0)`."""
+    data, option = _data_block(buffer)
+    scale, fmt, z0 = parse_option_line(option if option is not None else "#")
+    columns = 1 + 2 * num_ports * num_ports
+    with warnings.catch_warnings():
+        # depending on the NumPy version, np.fromstring warns or raises when it meets text that is not a number
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(data, dtype=np.float64, sep=" ")
+        except (DeprecationWarning, ValueError):
+            raise ValueError("Touchstone data contains text that is not a number") from None
+    if len(values) % columns:
+        raise ValueError(f"Touchstone data has {len(values)} values, not a multiple of {columns}")
+    freqs, s = to_s_matrix(values.reshape(-1, columns), num_ports, fmt)
+    return freqs * scale, s, z0
+
+
+def read_touchstone(path):
+    """Reads a .s1p or .s2p file, returning `(freqs, s, z0)` with `s` in `(N, 2, 2)` layout.
+
+    The file is memory-mapped and its data section parsed in a single NumPy
+    call. One-port data is returned as S11.
+    """
+    num_ports = ports_from_path(path)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return parse_touchstone(b"", num_ports)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return parse_touchstone(buffer, num_ports)
+
+
+def to_network(freqs, s, z0=50.0, num_ports=2, name=None):
+    """Converts a sweep to a `skrf.Network`. Requires scikit-rf."""
+    import skrf
+
+    frequency = skrf.Frequency.from_f(freqs, unit="Hz")
+    data = s if num_ports == 2 else s[:, :1, :1]
+    return skrf.Network(frequency=frequency, s=data, z0=z0, name=name)
+
+
+def read_network(path):
+    """Reads a .s1p or .s2p file into a `skrf.Network`, using `read_touchstone`. Requires scikit-rf."""
+    freqs, s, z0 = read_touchstone(path)
+    name = os.path.splitext(os.path.basename(str(path)))[0]
+    return to_network(freqs, s, z0, ports_from_path(path), name)
+
+
+def write_touchstone(file, freqs, s, num_ports=2, fmt="RI", tabs=False, unit="HZ", z0=50.0,
+                     one_port_parameter="S11"):
+    """Writes a whole sweep to a Touchstone file (a path or an open text file)."""
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "w", newline="\n") as f:
+            return write_touchstone(f, freqs, s, num_ports, fmt, tabs, unit, z0, one_port_parameter)
+    template = row_template(num_ports, tabs)
+    columns = data_columns(freqs, s, num_ports, fmt, unit, one_port_parameter)
+    file.write(option_line(fmt, unit, z0) + "\n")
+    file.write("".join(template % tuple(row) for row in columns.tolist()))
+
+
+class TouchstoneStreamWriter:
+    """Writes a Touchstone file incrementally, one point (or block of points) at a time.
+
+    Points are held in a preallocated block of `flush_rows` rows. When the
+    block is full, or `flush_interval_s` has passed since the last flush, the
+    pending rows are converted and formatted together, written, and the file
+    is flushed. `close()` writes any remaining rows.
+
+    `file` is a path or an open text file. A path is opened with a write
+    buffer of `buffer_size` bytes and closed by `close()`.
+    """
+
+    def __init__(self, file, num_ports=2, fmt="RI", tabs=False, unit="HZ", z0=50.0, one_port_parameter="S11",
+                 flush_rows=256, flush_interval_s=None, buffer_size=1 << 20):
+        if fmt not in DATA_FORMATS:
+            raise ValueError(f"Unsupported Touchstone data format {fmt!r}")
+        if flush_rows < 1:
+            raise ValueError("flush_rows must be at least 1")
+        self._owns_file = isinstance(file, (str, os.PathLike))
+        self.file = open(file, "w", newline="\n", buffering=buffer_size) if self._owns_file else file
+        self.num_ports = num_ports
+        self.fmt = fmt
+        self.unit = unit
+        self.one_port_parameter = one_port_parameter
+        self.flush_interval_s = flush_interval_s
+        self.rows = 0
+        self.flushes = 0
+        self._template = row_template(num_ports, tabs)
+        self._freqs = np.empty(flush_rows, dtype=np.float64)
+        self._s = np.empty((flush_rows, 2, 2), dtype=np.complex128)
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self.file.write(option_line(fmt, unit, z0) + "\n")
+
+    def write_point(self, pt):
+        """Appends a point returned by `sweep.getNextPoint()` (or `performMeasurement`)."""
+        i = self._pending
+        self._freqs[i] = pt.measurementFrequencyHz
+        s = self._s[i]
+        s[0, 0], s[0, 1], s[1, 0], s[1, 1] = pt.s11, pt.s12, pt.s21, pt.s22
+        self._appended(1)
+
+    def write_rows(self, freqs, s):
+        """Appends a block of points given as frequencies and an `(N, 2, 2)` S-matrix."""
+        freqs = np.asarray(freqs, dtype=np.float64)
+        s = np.asarray(s, dtype=np.complex128)
+        start = 0
+        while start < len(freqs):
+            count = min(len(freqs) - start, len(self._freqs) - self._pending)
+            self._freqs[self._pending:self._pending + count] = freqs[start:start + count]
+            self._s[self._pending:self._pending + count] = s[start:start + count]
+            start += count
+            self._appended(count)
+
+    def write_sweep(self, sweep):
+        """Drains an asynchronous sweep from `startMeasurement`, writing each point as it arrives."""
+        while sweep.hasMorePoints():
+            self.write_point(sweep.getNextPoint())
+
+    def _appended(self, count):
+        self._pending += count
+        self.rows += count
+        if self._pending == len(self._freqs) or (
+                self.flush_interval_s is not None
+                and time.monotonic() - self._last_flush >= self.flush_interval_s):
+            self.flush()
+
+    def flush(self):
+        """Writes the pending rows and flushes the file."""
+        if self._pending:
+            columns = data_columns(self._freqs[:self._pending], self._s[:self._pending], self.num_ports,
+                                   self.fmt, self.unit, self.one_port_parameter)
+            template = self._template
+            self.file.write("".join(template % tuple(row) for row in columns.tolist()))
+            self._pending = 0
+        self.file.flush()
+        self.flushes += 1
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        if self.file is None:
+            return
+        self.flush()
+        if self._owns_file:
+            self.file.close()
+        self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
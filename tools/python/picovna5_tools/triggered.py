@@ -0,0 +1,240 @@
+"""
+triggered
+Copyright © 2026 AAI Robotics Ltd.
+MIT License. See LICENSE.txt for terms.
+
+Trigger-driven acquisition, with the next sweep always armed.
+
+api/python/05_trigger arms one sweep with `vna.TriggerMode_RISING_EDGE` and
+waits for it. An application that handles a stream of trigger events, and
+arms the next sweep only after processing the last one, misses any trigger
+that arrives while it is processing. `TriggeredAcquisition` is a
+`ContinuousAcquisition` that sets the trigger mode of the configuration, so
+the next sweep is armed (`startMeasurement` called) as soon as the previous
+one has been drained, and is processed while the next sweep waits for its
+trigger.
+
+Every sweep is timed with `InstrumentedDevice`, so the time from arming to
+the first point (`start_to_first_point_s`, which includes waiting for the
+trigger) and from the first to the last point (`first_to_last_point_s`) are
+recorded as histograms in a `SweepMetrics`, labelled with the trigger mode.
+
+The demo device has no trigger input, so `SimulatedTriggerSource` and
+`TriggerGatedDevice` stand in for one: each sweep is held back after it has
+been armed until the simulated source fires, and triggers that fire while no
+sweep is armed are counted as missed, as they would be by an instrument. The
+time from each trigger to the first point of its sweep is recorded as
+`trigger_to_first_point_s`.
+
+A hardware-triggered sweep waits until its trigger arrives, so `stop()` takes
+effect after the next trigger. Closing a simulated source ends the acquisition
+at once: the sweep waiting for its trigger raises `AcquisitionStopped`.
+"""
+
+import collections
+import threading
+import time
+
+from .continuous import AcquisitionStopped, ContinuousAcquisition
+from .instrumentation import InstrumentedDevice, SweepMetrics
+
+
+def trigger_modes():
+    """Returns every trigger mode of the `vna` package, as a dict of name (e.g. "RISING_EDGE") to value."""
+    from vna import vna
+
+    prefix = "TriggerMode_"
+    return {name[len(prefix):]: getattr(vna, name) for name in dir(vna) if name.startswith(prefix)}
+
+
+def resolve_trigger_mode(mode):
+    """Returns `(name, value)` of a trigger mode given by name (e.g. "RISING_EDGE") or value."""
+    modes = trigger_modes()
+    if isinstance(mode, str):
+        name = mode.upper()
+        if name.startswith("TRIGGERMODE_"):
+            name = name[len("TRIGGERMODE_"):]
+        if name not in modes:
+            raise ValueError(f"Unknown trigger mode {mode!r}; expected one of {sorted(modes)}")
+        return name, modes[name]
+    for name, value in modes.items():
+        if value == mode:
+            return name, value
+    raise ValueError(f"Unknown trigger mode {mode!r}; expected one of {sorted(modes)}")
+
+
+class TriggeredAcquisition(ContinuousAcquisition):
+    """Acquires one sweep of `mc` per trigger, keeping the next sweep armed while the last is processed.
+
+    `trigger_mode` is a name such as "RISING_EDGE" or a `vna.TriggerMode_*`
+    value, and is set on `mc`, so `mc` should not be a configuration shared
+    with other code (such as one from `ConfigurationCache`). Timings are
+    recorded in `metrics` (a new `SweepMetrics` by default) with `labels` and
+    the trigger mode as labels. The other arguments are those of
+    `ContinuousAcquisition`; by default no triggered sweep is dropped
+    (`policy="block"`).
+    """
+
+    def __init__(self, device, mc, num_points, process=None, trigger_mode="RISING_EDGE", metrics=None,
+                 labels=None, buffers=4, policy="block", max_sweeps=None):
+        self.trigger_mode, value = resolve_trigger_mode(trigger_mode)
+        mc.setTriggerMode(value)
+        self.metrics = metrics if metrics is not None else SweepMetrics()
+        self.labels = dict(labels or {}, trigger_mode=self.trigger_mode)
+        if isinstance(device, TriggerGatedDevice) and device.metrics is None:
+            device.metrics, device.labels = self.metrics, self.labels
+        super().__init__(InstrumentedDevice(device, self.metrics, self.labels), mc, num_points, process, buffers,
+                         policy, max_sweeps)
+
+    def stats(self):
+        """The statistics of `ContinuousAcquisition`, with a summary of the latency histograms."""
+        stats = super().stats()
+        for name in ("start_to_first_point_s", "first_to_last_point_s", "trigger_to_first_point_s"):
+            histogram = self.metrics.histogram(name, self.labels).snapshot()
+            stats[name] = {key: histogram[key] for key in ("count", "mean", "p50", "p95", "max")}
+        return stats
+
+
+#### Simulated trigger source
+###############################################################################
+
+class _Arming:
+    __slots__ = ("fired", "trigger_ns")
+
+    def __init__(self):
+        self.fired = threading.Event()
+        self.trigger_ns = None
+
+
+class SimulatedTriggerSource:
+    """Simulated trigger events for `TriggerGatedDevice`.
+
+    `fire()` triggers the sweep that has been armed the longest; if no sweep
+    is armed, the trigger is missed. `start()` fires triggers periodically on
+    a background thread. After `close()`, every armed sweep (and any sweep
+    armed later) raises `AcquisitionStopped`, which ends a
+    `TriggeredAcquisition`.
+    """
+
+    def __init__(self):
+        self.fired = 0
+        self.missed = 0
+        self._armed = collections.deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = None
+        self._stopping = threading.Event()
+
+    def arm(self):
+        arming = _Arming()
+        with self._lock:
+            if self._closed:
+                arming.fired.set()
+            else:
+                self._armed.append(arming)
+        return arming
+
+    def fire(self):
+        """Fires one trigger. Returns False if no sweep was armed, so the trigger was missed."""
+        now = time.perf_counter_ns()
+        with self._lock:
+            self.fired += 1
+            if not self._armed:
+                self.missed += 1
+                return False
+            arming = self._armed.popleft()
+        arming.trigger_ns = now
+        arming.fired.set()
+        return True
+
+    def start(self, interval_s, count=None):
+        """Fires a trigger every `interval_s` seconds (`count` times, or until `close()`)."""
+        def run():
+            next_s = time.perf_counter() + interval_s
+            fired = 0
+            while count is None or fired < count:
+                if self._stopping.wait(max(next_s - time.perf_counter(), 0.0)):
+                    return
+                self.fire()
+                fired += 1
+                next_s += interval_s
+
+        self._stopping.clear()
+        self._thread = threading.Thread(target=run, name="simulated-trigger", daemon=True)
+        self._thread.start()
+        return self
+
+    def join(self):
+        """Waits until a `start()` with a `count` has fired every trigger."""
+        if self._thread is not None:
+            self._thread.join()
+
+    def close(self):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            self._closed = True
+            armed, self._armed = self._armed, collections.deque()
+        for arming in armed:
+            arming.fired.set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _GatedSweep:
+    """A sweep that is started on the device only once its simulated trigger has fired."""
+
+    def __init__(self, device, mc, arming, metrics, labels):
+        self._device = device
+        self._mc = mc
+        self._arming = arming
+        self._metrics = metrics
+        self._labels = labels
+        self._sweep = None
+        self._first_point = True
+
+    def hasMorePoints(self):
+        if self._sweep is None:
+            self._arming.fired.wait()
+            if self._arming.trigger_ns is None:
+                raise AcquisitionStopped("The trigger source was closed before triggering this sweep")
+            self._sweep = self._device.startMeasurement(self._mc)
+        return self._sweep.hasMorePoints()
+
+    def getNextPoint(self):
+        pt = self._sweep.getNextPoint()
+        if self._first_point:
+            self._first_point = False
+            if self._metrics is not None:
+                self._metrics.observe("trigger_to_first_point_s",
+                                      (time.perf_counter_ns() - self._arming.trigger_ns) * 1e-9, self._labels)
+        return pt
+
+
+class TriggerGatedDevice:
+    """Wraps a device (e.g. `vna.Device.openDemo()`) so that each sweep waits for a `SimulatedTriggerSource`.
+
+    `startMeasurement` arms the sweep with the source and returns at once;
+    the sweep starts on the device when its trigger fires. If `metrics` is
+    given, the time from each trigger to the first point is recorded there.
+    `TriggeredAcquisition` sets `metrics` and `labels` to its own if they
+    are not given. Other attributes are passed through to the device.
+    """
+
+    def __init__(self, device, source, metrics=None, labels=None):
+        self._device = device
+        self.source = source
+        self.metrics = metrics
+        self.labels = labels
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    def startMeasurement(self, mc):
+        return _GatedSweep(self._device, mc, self.source.arm(), self.metrics, self.labels)